@@ -1,8 +1,14 @@
 from functools import cached_property
 from app.services.ai_service import AIService
+from app.services.comparison_service import ComparisonService
 from app.services.intent_service import IntentService
 from app.services.product_service import ProductService
+from app.services.product_search import ProductSearchService
+from app.services.price_match import PriceMatchService
 from app.services.language_service import LanguageService
+from app.services.provider_router import ProviderRouter
+from app.services.query_service import QueryService
+from app.services.template_service import TemplateService
 
 class ServiceContainer:
     @cached_property
@@ -21,6 +27,30 @@ class ServiceContainer:
     def product_service(self) -> ProductService:
         return ProductService()
 
+    @cached_property
+    def query_service(self) -> QueryService:
+        return QueryService()
+
+    @cached_property
+    def product_search_service(self) -> ProductSearchService:
+        return ProductSearchService()
+
+    @cached_property
+    def price_match_service(self) -> PriceMatchService:
+        return PriceMatchService()
+
+    @cached_property
+    def comparison_service(self) -> ComparisonService:
+        return ComparisonService()
+
+    @cached_property
+    def template_service(self) -> TemplateService:
+        return TemplateService()
+
+    @cached_property
+    def provider_router(self) -> ProviderRouter:
+        return ProviderRouter()
+
 container = ServiceContainer()
 
 def get_ai_service() -> AIService:
@@ -33,4 +63,22 @@ def get_product_service() -> ProductService:
     return container.product_service
 
 def get_language_service() -> LanguageService:
-    return container.language_service
\ No newline at end of file
+    return container.language_service
+
+def get_query_service() -> QueryService:
+    return container.query_service
+
+def get_product_search_service() -> ProductSearchService:
+    return container.product_search_service
+
+def get_price_match_service() -> PriceMatchService:
+    return container.price_match_service
+
+def get_comparison_service() -> ComparisonService:
+    return container.comparison_service
+
+def get_template_service() -> TemplateService:
+    return container.template_service
+
+def get_provider_router() -> ProviderRouter:
+    return container.provider_router
@@ -4,20 +4,33 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from app.core.config import get_settings
 from app.core.logger import Logger
-from app.core.exceptions import ShopBuddyException
+from app.core.exceptions import ShopBuddyException, ValidationException
 from app.models.schemas import (
     QueryRequest, QueryResponse, HealthResponse, 
-    LanguagesResponse, LanguageInfo
+    LanguagesResponse, LanguageInfo,
+    ProductSnapshotRequest, ProductQueryRequest, ProductQueryResponse,
+    ProductFacetsResponse, ProductSearchRequest, ProductSearchResponse,
+    PriceMatchRequest, PriceMatchResponse, MetricsResponse
 )
-from app.models.enums import IntentType
+from app.models.enums import IntentType, SortOrder
 from app.api.dependencies import (
     get_ai_service, get_intent_service, 
-    get_product_service, get_language_service
+    get_product_service, get_language_service, get_query_service,
+    get_product_search_service, get_price_match_service, get_comparison_service,
+    get_template_service, get_provider_router
 )
 from app.services.ai_service import AIService
+from app.services.comparison_service import ComparisonService
 from app.services.intent_service import IntentService
 from app.services.product_service import ProductService
+from app.services.product_search import ProductSearchService
+from app.services.price_match import PriceMatchService
+from app.services.provider_router import ProviderRouter
 from app.services.language_service import LanguageService
+from app.services.query_service import QueryService
+from app.services.template_service import TemplateService
+from app.services.filter_plan import FilterPlan
+from app.services.product_table import ProductTable
 
 class ShopBuddyAPI:
     def __init__(self):
@@ -32,10 +45,23 @@ class ShopBuddyAPI:
         """Saare endpoints ko router ke saath jodna."""
         self.router.add_api_route("/", self.root, methods=["GET"], response_model=Dict)
         self.router.add_api_route("/health", self.health_check, methods=["GET"], response_model=HealthResponse)
+        self.router.add_api_route("/metrics", self.metrics, methods=["GET"], response_model=MetricsResponse)
         self.router.add_api_route("/languages", self.get_languages, methods=["GET"], response_model=LanguagesResponse)
         self.router.add_api_route("/language/{language_code}", self.set_language, methods=["POST"])
         self.router.add_api_route("/chat", self.chat, methods=["POST"], response_model=QueryResponse)
         self.router.add_api_route("/clear", self.clear_chat, methods=["POST"])
+        self.router.add_api_route(
+            "/products/query", self.query_products, methods=["POST"], response_model=ProductQueryResponse
+        )
+        self.router.add_api_route(
+            "/products/facets", self.product_facets, methods=["POST"], response_model=ProductFacetsResponse
+        )
+        self.router.add_api_route(
+            "/products/search", self.search_products, methods=["POST"], response_model=ProductSearchResponse
+        )
+        self.router.add_api_route(
+            "/products/match", self.match_prices, methods=["POST"], response_model=PriceMatchResponse
+        )
 
     # --- Endpoints (Ab ye Class Methods hain) ---
 
@@ -62,6 +88,14 @@ class ShopBuddyAPI:
             services=services
         )
 
+    async def metrics(
+        self,
+        template_service: TemplateService = Depends(get_template_service),
+        provider_router: ProviderRouter = Depends(get_provider_router)
+    ):
+        """Share of chat requests answered without an LLM call, and LLM provider health."""
+        return MetricsResponse(bypass=template_service.metrics, providers=provider_router.metrics)
+
     async def get_languages(self, language_service: LanguageService = Depends(get_language_service)):
         supported = language_service.get_supported_languages()
         # List comprehension for cleaner code
@@ -88,21 +122,26 @@ class ShopBuddyAPI:
         ai_service: AIService = Depends(get_ai_service),
         intent_service: IntentService = Depends(get_intent_service),
         product_service: ProductService = Depends(get_product_service),
-        language_service: LanguageService = Depends(get_language_service)
+        language_service: LanguageService = Depends(get_language_service),
+        query_service: QueryService = Depends(get_query_service),
+        price_match_service: PriceMatchService = Depends(get_price_match_service),
+        comparison_service: ComparisonService = Depends(get_comparison_service),
+        template_service: TemplateService = Depends(get_template_service)
     ):
         """Main chat logic encapsulated in a method."""
         start_time = time.time()
         thoughts: List[str] = []
         
         try:
+            # Query Analysis (computed once, shared by every stage)
+            analysis = query_service.analyze(request.query, language=request.language)
+            
             # Language Handling
-            if request.language == "auto":
-                detected_lang = language_service.detect_language(request.query)
-                language_service.set_language(detected_lang)
-            elif request.language:
-                language_service.set_language(request.language)
+            if analysis.language:
+                language_service.set_language(analysis.language)
             
             current_lang = language_service.get_current_language()
+            analysis.language = current_lang
             
             # Logging thoughts (Instance variable use nahi kiya taaki request stateless rahe, 
             # par hum self.logger use kar sakte hain)
@@ -113,17 +152,19 @@ class ShopBuddyAPI:
             ])
 
             # Intent Logic
-            intent, confidence, _ = intent_service.classify(request.query)
+            intent, confidence, _ = intent_service.classify(analysis)
             thoughts.append(f"Intent: {intent} ({confidence:.0%})")
 
             # --- Specific Intent Handlers (Clean Code) ---
             if intent == IntentType.CLEAR_CHAT.value:
+                template_service.record(intent, bypassed=True)
                 return self._build_response(
                     answer=language_service.translate("actions.clear", current_lang) + "!",
                     thoughts=thoughts, intent=intent, conf=confidence, start=start_time, lang=current_lang
                 )
 
             if intent == IntentType.HELP.value:
+                template_service.record(intent, bypassed=True)
                 return self._build_response(
                     answer=language_service.get_help_text(current_lang),
                     thoughts=thoughts, intent=intent, conf=confidence, start=start_time, lang=current_lang
@@ -131,32 +172,64 @@ class ShopBuddyAPI:
 
             # Product Logic
             items = [p.model_dump() for p in request.products] if request.products else []
+            page_items = items
             filtered_products = []
+            
+            if items:
+                price_match_service.observe(request.site_type, items)
+                unique_items = product_service.collapse_duplicates(items)
+                if len(unique_items) < len(items):
+                    thoughts.append(f"Duplicates collapsed: {len(items)} -> {len(unique_items)} items")
+                items = unique_items
 
             if items and intent == IntentType.PRODUCT_FILTER.value:
-                filters = product_service.parse_filters(request.query)
-                thoughts.append(f"Filters: {product_service.format_filter_description(filters)}")
+                filters = product_service.plan_filters(analysis)
+                currency = product_service.get_table(items).currency
+                thoughts.append(f"Filters: {product_service.format_filter_description(filters, currency)}")
                 filtered_products = product_service.apply_filters(items, filters)
                 thoughts.append(f"Filtered: {len(filtered_products)} items")
                 items = filtered_products if filtered_products else items
 
+            # Template Tier (answers without an LLM round trip)
+            templated = template_service.render(intent, analysis, items, current_lang)
+            if templated is not None:
+                template_service.record(intent, bypassed=True)
+                thoughts.append("Answered from templates")
+                return QueryResponse(
+                    answer=templated.text, thoughts=thoughts, filtered_products=templated.products, intent=intent,
+                    confidence=confidence, processing_time=time.time() - start_time, language=current_lang
+                )
+
+            # Comparisons see the whole page so "3 vs 4" means the shopper's #3 and #4
+            if items and intent == IntentType.PRODUCT_COMPARE.value:
+                return self._compare_locally(
+                    request, page_items, analysis, thoughts, intent, confidence, start_time,
+                    current_lang, comparison_service, ai_service, template_service
+                )
+
             # AI Generation
-            thoughts.append("Generating response")
-            answer = ai_service.generate_response(
+            template_service.record(intent, bypassed=False)
+            mode, route = ai_service.select_route(intent, request.mode)
+            thoughts.append(f"Generating response ({mode}: {route.model})")
+            generated = ai_service.generate(
                 query=request.query, items=items, 
                 site_type=request.site_type or "Unknown",
                 page_type=request.page_type or "Unknown",
                 page_title=request.page_title or "",
                 page_content=request.page_content or "",
-                language=current_lang
+                language=current_lang,
+                analysis=analysis,
+                route=route
             )
+            thoughts.append(f"Prompt: {generated.prompt_tokens}/{route.prompt_tokens} tokens")
 
             processing_time = time.time() - start_time
             self.logger.info(f"Query Processed | Time: {processing_time:.2f}s")
 
             return QueryResponse(
-                answer=answer, thoughts=thoughts, filtered_products=filtered_products,
-                intent=intent, confidence=confidence, processing_time=processing_time, language=current_lang
+                answer=generated.text, thoughts=thoughts, filtered_products=filtered_products,
+                intent=intent, confidence=confidence, processing_time=processing_time, language=current_lang,
+                prompt_tokens=generated.prompt_tokens
             )
 
         except ShopBuddyException as e:
@@ -173,7 +246,164 @@ class ShopBuddyAPI:
             "status": "success"
         }
 
+    async def query_products(
+        self,
+        request: ProductQueryRequest,
+        product_service: ProductService = Depends(get_product_service)
+    ):
+        """Structured filter/sort over a product snapshot. No intent or LLM involved."""
+        start_time = time.time()
+        
+        try:
+            table = self._resolve_snapshot(request, product_service)
+            
+            try:
+                plan = FilterPlan.build(
+                    min_price=request.min_price,
+                    max_price=request.max_price,
+                    currency=request.currency,
+                    min_rating=request.min_rating,
+                    contains=request.contains,
+                    category=request.category,
+                    sort_by=request.sort_by,
+                    descending=None if request.sort_order is None else request.sort_order == SortOrder.DESCENDING,
+                    limit=request.limit
+                )
+            except ValueError as e:
+                raise ValidationException(str(e), field="currency" if "currency" in str(e) else "sort_by")
+            
+            return ProductQueryResponse(
+                items=product_service.select(table, plan),
+                total=table.size,
+                snapshot_id=table.key,
+                processing_time=time.time() - start_time
+            )
+        
+        except ShopBuddyException as e:
+            self.logger.error(f"Error: {e.message}")
+            raise HTTPException(status_code=400, detail=e.to_dict())
+
+    async def product_facets(
+        self,
+        request: ProductSnapshotRequest,
+        product_service: ProductService = Depends(get_product_service)
+    ):
+        """Price histogram, percentiles, rating, discount and category counts for a snapshot."""
+        start_time = time.time()
+        
+        try:
+            table = self._resolve_snapshot(request, product_service)
+            
+            return ProductFacetsResponse(
+                **product_service.facets(table),
+                snapshot_id=table.key,
+                processing_time=time.time() - start_time
+            )
+        
+        except ShopBuddyException as e:
+            self.logger.error(f"Error: {e.message}")
+            raise HTTPException(status_code=400, detail=e.to_dict())
+
+    async def search_products(
+        self,
+        request: ProductSearchRequest,
+        product_service: ProductService = Depends(get_product_service),
+        search_service: ProductSearchService = Depends(get_product_search_service)
+    ):
+        """Free-text relevance search over a snapshot, e.g. "wireless earbuds with noise cancelling"."""
+        start_time = time.time()
+        
+        try:
+            table = self._resolve_snapshot(request, product_service)
+            result = search_service.search(table, request.query, request.limit)
+            
+            return ProductSearchResponse(
+                items=table.rows(result.indices),
+                scores=[round(float(score), 4) for score in result.scores],
+                mode=result.mode,
+                total=table.size,
+                snapshot_id=table.key,
+                processing_time=time.time() - start_time
+            )
+        
+        except ShopBuddyException as e:
+            self.logger.error(f"Error: {e.message}")
+            raise HTTPException(status_code=400, detail=e.to_dict())
+
+    async def match_prices(
+        self,
+        request: PriceMatchRequest,
+        product_service: ProductService = Depends(get_product_service),
+        price_match_service: PriceMatchService = Depends(get_price_match_service)
+    ):
+        """Find this page's products on other recently seen sites, cheapest offer first."""
+        start_time = time.time()
+        
+        try:
+            table = self._resolve_snapshot(request, product_service)
+            price_match_service.observe(request.site, table.products)
+            
+            unique = product_service.collapse_duplicates(table.products)
+            
+            return PriceMatchResponse(
+                matches=price_match_service.match(request.site, unique),
+                snapshot_id=table.key,
+                processing_time=time.time() - start_time
+            )
+        
+        except ShopBuddyException as e:
+            self.logger.error(f"Error: {e.message}")
+            raise HTTPException(status_code=400, detail=e.to_dict())
+
     # --- Helper Method (Private) ---
+    def _resolve_snapshot(self, request: ProductSnapshotRequest, product_service: ProductService) -> ProductTable:
+        """Products se table banao, warna snapshot_id se cached table nikalo."""
+        if request.products:
+            return product_service.get_table([p.model_dump() for p in request.products])
+        
+        if request.snapshot_id:
+            table = product_service.get_snapshot(request.snapshot_id)
+            if table is None:
+                raise ValidationException("Unknown or expired snapshot", field="snapshot_id")
+            return table
+        
+        return product_service.get_table([])
+    
+
+    def _compare_locally(
+        self, request, items, analysis, thoughts, intent, conf, start, lang,
+        comparison_service: ComparisonService, ai_service: AIService, template_service: TemplateService
+    ) -> QueryResponse:
+        """Answer comparisons from the snapshot; the LLM only adds optional commentary."""
+        answer, comparison = comparison_service.answer(items, analysis, lang)
+        compared = [items[row["position"] - 1] for row in comparison["items"]] if comparison else []
+        thoughts.append(f"Compared locally: {len(compared)} items")
+        commentary = bool(compared) and get_settings().comparison_commentary and ai_service.llm_available
+        template_service.record(intent, bypassed=not commentary)
+        prompt_tokens = None
+        
+        if commentary:
+            mode, route = ai_service.select_route(intent, request.mode)
+            thoughts.append(f"Generating commentary ({mode}: {route.model})")
+            generated = ai_service.generate(
+                query=request.query, items=compared,
+                site_type=request.site_type or "Unknown",
+                page_type=request.page_type or "Unknown",
+                page_title=request.page_title or "",
+                language=lang,
+                analysis=analysis,
+                route=route
+            )
+            prompt_tokens = generated.prompt_tokens
+            thoughts.append(f"Prompt: {prompt_tokens}/{route.prompt_tokens} tokens")
+            answer = f"{answer}\n\n{generated.text}"
+        
+        return QueryResponse(
+            answer=answer, thoughts=thoughts, filtered_products=compared, intent=intent,
+            confidence=conf, processing_time=time.time() - start, language=lang, comparison=comparison,
+            prompt_tokens=prompt_tokens
+        )
+
     def _build_response(self, answer, thoughts, intent, conf, start, lang):
         """Duplicate code reduce karne ke liye helper method"""
         return QueryResponse(
@@ -3,10 +3,19 @@ Application configuration using Pydantic Settings.
 """
 
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, FrozenSet, NamedTuple, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class ModelRoute(NamedTuple):
+    """Model, response length, product context size and prompt budget for one response mode."""
+    
+    model: str
+    max_tokens: int
+    context_items: int
+    prompt_tokens: int
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -32,6 +41,58 @@ class Settings(BaseSettings):
     # AI Parameters
     temperature: float = 0.7
     max_tokens: int = 1500
+    context_items: int = 25
+    prompt_token_budget: int = 6000
+    
+    # Model Routing (GROQ_MODEL, MAX_TOKENS, CONTEXT_ITEMS and PROMPT_TOKEN_BUDGET form the quality route)
+    llm_routes: str = "fast=llama-3.1-8b-instant:600:10:1500,balanced=llama-3.3-70b-versatile:1000:20:3000"
+    llm_intent_modes: str = (
+        "greeting=fast,farewell=fast,thanks=fast,help=fast,product_filter=fast,price_query=fast,"
+        "product_info=balanced,summarize=balanced,general_question=balanced,product_compare=quality"
+    )
+    llm_default_mode: str = "balanced"
+    
+    # Provider Routing
+    provider_ewma_alpha: float = 0.2
+    circuit_error_threshold: float = 0.5
+    circuit_min_calls: int = 5
+    circuit_open_seconds: float = 30.0
+    retry_budget_ratio: float = 0.1
+    retry_budget_burst: int = 5
+    llm_hedging: bool = False
+    hedge_quantile: float = 0.9
+    hedge_min_delay_seconds: float = 0.25
+    hedge_min_samples: int = 20
+    hedge_budget_ratio: float = 0.05
+    
+    # Intent Classification
+    intent_corpus_path: str = "data/intent_examples.jsonl"
+    intent_top_k: int = 5
+    intent_corpus_reload_seconds: float = 5.0
+    category_corpus_path: str = "data/category_examples.jsonl"
+    category_min_similarity: float = 0.3
+    category_cache_size: int = 20000
+    
+    # Product Processing
+    product_table_cache_size: int = 32
+    filter_plan_cache_size: int = 512
+    filter_result_cache_size: int = 256
+    product_search_cache_size: int = 16
+    search_vector_weight: float = 0.6
+    price_base_currency: str = "INR"
+    exchange_rates_path: Optional[str] = "data/exchange_rates.json"
+    duplicate_name_threshold: float = 0.8
+    price_match_threshold: float = 0.6
+    price_match_capacity: int = 5000
+    embedding_cache_path: Optional[str] = "data/embeddings.sqlite3"
+    embedding_cache_size: int = 20000
+    embedding_provider: str = "auto"
+    embedding_batch_size: int = 64
+    vector_store_cache_size: int = 8
+    vector_store_dir: Optional[str] = None
+    vector_store_max_pending: int = 4
+    comparison_commentary: bool = False
+    llm_bypass_intents: str = "greeting,farewell,thanks,price_query,product_filter"
     
     # Logging
     log_level: str = "INFO"
@@ -47,6 +108,42 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.app_env.lower() == "production"
     
+    @property
+    def bypass_intents(self) -> FrozenSet[str]:
+        return frozenset(intent.strip() for intent in self.llm_bypass_intents.split(",") if intent.strip())
+    
+    @property
+    def model_routes(self) -> Dict[str, ModelRoute]:
+        """
+        Response mode to route, parsed from "mode=model:max_tokens:context_items[:prompt_tokens]" entries.
+        Malformed entries are logged and skipped so one typo cannot stop the AI service.
+        """
+        from app.core.logger import Logger
+
+        routes = {
+            "quality": ModelRoute(self.groq_model, self.max_tokens, self.context_items, self.prompt_token_budget)
+        }
+        for entry in filter(str.strip, self.llm_routes.split(",")):
+            mode, _, spec = entry.partition("=")
+            model, *limits = spec.strip().split(":")
+            try:
+                if not (mode.strip() and model and len(limits) in (2, 3)):
+                    raise ValueError("expected mode=model:max_tokens:context_items[:prompt_tokens]")
+                limits = [int(limit) for limit in limits] + [self.prompt_token_budget] * (3 - len(limits))
+                if min(limits) <= 0:
+                    raise ValueError("limits must be positive")
+            except ValueError as e:
+                Logger("config").warning(f"Ignoring LLM_ROUTES entry {entry.strip()!r}: {e}")
+                continue
+            routes[mode.strip()] = ModelRoute(model, *limits)
+        return routes
+    
+    @property
+    def intent_modes(self) -> Dict[str, str]:
+        """Intent to default response mode."""
+        pairs = (entry.partition("=") for entry in self.llm_intent_modes.split(","))
+        return {intent.strip(): mode.strip() for intent, _, mode in pairs if intent.strip() and mode.strip()}
+    
     @property
     def has_groq(self) -> bool:
         return bool(self.groq_api_key)
@@ -77,4 +77,7 @@ class AppLogger:
         self._logger.critical(message, **kwargs)
 
     def exception(self, message: str, **kwargs):
-        self._logger.exception(message, **kwargs)
\ No newline at end of file
+        self._logger.exception(message, **kwargs)
+
+
+Logger = AppLogger
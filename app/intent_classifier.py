@@ -121,8 +121,24 @@ class IntentClassifier:
         return "general_question"
 
     def get_similar_products(self, query: str, products: list, top_k: int = 5):
-        """Find similar products (simple version)"""
-        return products[:top_k] if products else []
+        """Find products most similar to the query by cosine similarity"""
+        if not products:
+            return []
+        
+        if not self.model:
+            return products[:top_k]
+        
+        try:
+            texts = [f"{p.get('name') or ''} {p.get('extra') or ''}".strip() for p in products]
+            embeddings = self.model.encode(texts, batch_size=64, normalize_embeddings=True)
+            query_embedding = self.model.encode([query], normalize_embeddings=True)[0]
+            
+            similarities = embeddings @ query_embedding
+            best = np.argsort(-similarities, kind="stable")[:top_k]
+            return [products[i] for i in best]
+        except Exception as e:
+            print(f"⚠️ Similar product search failed: {e}")
+            return products[:top_k]
 
 
 # Create singleton
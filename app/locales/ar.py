@@ -46,7 +46,8 @@ ARABIC = {
         "compare_header": "مقارنة:",
         "price": "السعر",
         "rating": "التقييم",
-        "no_match": "لا توجد نتائج مطابقة."
+        "no_match": "لا توجد نتائج مطابقة.",
+        "price_range": "تتراوح الأسعار في هذه الصفحة من {min} إلى {max} (الوسيط {median})."
     },
     "filters": {
         "applied": "فلاتر:",
@@ -84,5 +85,21 @@ ARABIC = {
         "send": "إرسال",
         "typing": "يكتب...",
         "powered_by": "ShopBuddy AI"
+    },
+    "comparison": {
+        "product": "المنتج",
+        "price": "السعر",
+        "rating": "التقييم",
+        "discount": "الخصم",
+        "reviews": "المراجعات",
+        "ram": "الذاكرة",
+        "storage": "التخزين",
+        "screen": "الشاشة",
+        "battery": "البطارية",
+        "cheapest": "أقل سعر: {name}",
+        "top_rated": "الأعلى تقييمًا: {name}",
+        "best_value": "أفضل قيمة: {name}",
+        "need_two": "أحتاج إلى منتجين على الأقل في هذه الصفحة للمقارنة.",
+        "not_found": "لم أجد هذه العناصر في هذه الصفحة. جرّب 'compare 1 and 2' أو 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -53,7 +53,8 @@ GERMAN = {
         "compare_header": "Vergleich der ausgewählten Artikel:",
         "price": "Preis",
         "rating": "Bewertung",
-        "no_match": "Keine Produkte entsprechen Ihren Filtern. Versuchen Sie andere Kriterien."
+        "no_match": "Keine Produkte entsprechen Ihren Filtern. Versuchen Sie andere Kriterien.",
+        "price_range": "Die Preise auf dieser Seite reichen von {min} bis {max} (Median {median})."
     },
     
     "filters": {
@@ -96,5 +97,22 @@ GERMAN = {
         "send": "Senden",
         "typing": "Denke nach...",
         "powered_by": "Powered by ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Produkt",
+        "price": "Preis",
+        "rating": "Bewertung",
+        "discount": "Rabatt",
+        "reviews": "Rezensionen",
+        "ram": "RAM",
+        "storage": "Speicher",
+        "screen": "Bildschirm",
+        "battery": "Akku",
+        "cheapest": "Niedrigster Preis: {name}",
+        "top_rated": "Am besten bewertet: {name}",
+        "best_value": "Bestes Preis-Leistungs-Verhältnis: {name}",
+        "need_two": "Zum Vergleichen brauche ich mindestens zwei Produkte auf dieser Seite.",
+        "not_found": "Diese Artikel wurden auf dieser Seite nicht gefunden. Versuchen Sie 'compare 1 and 2' oder 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -53,7 +53,8 @@ ENGLISH = {
         "compare_header": "Comparison of selected items:",
         "price": "Price",
         "rating": "Rating",
-        "no_match": "No products match your filters. Try different criteria."
+        "no_match": "No products match your filters. Try different criteria.",
+        "price_range": "Prices on this page range from {min} to {max} (median {median})."
     },
     
     "filters": {
@@ -96,5 +97,22 @@ ENGLISH = {
         "send": "Send",
         "typing": "Thinking...",
         "powered_by": "Powered by ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Product",
+        "price": "Price",
+        "rating": "Rating",
+        "discount": "Discount",
+        "reviews": "Reviews",
+        "ram": "RAM",
+        "storage": "Storage",
+        "screen": "Screen",
+        "battery": "Battery",
+        "cheapest": "Lowest price: {name}",
+        "top_rated": "Highest rated: {name}",
+        "best_value": "Best value: {name}",
+        "need_two": "I need at least two products on this page to compare.",
+        "not_found": "I couldn't find those items on this page. Try 'compare 1 and 2' or 'compare top 3'."
     }
 }
\ No newline at end of file
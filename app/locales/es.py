@@ -53,7 +53,8 @@ SPANISH = {
         "compare_header": "Comparación de artículos seleccionados:",
         "price": "Precio",
         "rating": "Valoración",
-        "no_match": "Ningún producto coincide con tus filtros. Prueba otros criterios."
+        "no_match": "Ningún producto coincide con tus filtros. Prueba otros criterios.",
+        "price_range": "Los precios en esta página van de {min} a {max} (mediana {median})."
     },
     
     "filters": {
@@ -96,5 +97,22 @@ SPANISH = {
         "send": "Enviar",
         "typing": "Pensando...",
         "powered_by": "Impulsado por ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Producto",
+        "price": "Precio",
+        "rating": "Valoración",
+        "discount": "Descuento",
+        "reviews": "Reseñas",
+        "ram": "RAM",
+        "storage": "Almacenamiento",
+        "screen": "Pantalla",
+        "battery": "Batería",
+        "cheapest": "Precio más bajo: {name}",
+        "top_rated": "Mejor valorado: {name}",
+        "best_value": "Mejor relación calidad-precio: {name}",
+        "need_two": "Necesito al menos dos productos en esta página para comparar.",
+        "not_found": "No encontré esos artículos en esta página. Prueba 'compare 1 and 2' o 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -53,7 +53,8 @@ FRENCH = {
         "compare_header": "Comparaison des articles sélectionnés:",
         "price": "Prix",
         "rating": "Note",
-        "no_match": "Aucun produit ne correspond à vos filtres. Essayez d'autres critères."
+        "no_match": "Aucun produit ne correspond à vos filtres. Essayez d'autres critères.",
+        "price_range": "Les prix sur cette page vont de {min} à {max} (médiane {median})."
     },
     
     "filters": {
@@ -96,5 +97,22 @@ FRENCH = {
         "send": "Envoyer",
         "typing": "Réflexion...",
         "powered_by": "Propulsé par ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Produit",
+        "price": "Prix",
+        "rating": "Note",
+        "discount": "Remise",
+        "reviews": "Avis",
+        "ram": "RAM",
+        "storage": "Stockage",
+        "screen": "Écran",
+        "battery": "Batterie",
+        "cheapest": "Prix le plus bas : {name}",
+        "top_rated": "Mieux noté : {name}",
+        "best_value": "Meilleur rapport qualité-prix : {name}",
+        "need_two": "Il me faut au moins deux produits sur cette page pour comparer.",
+        "not_found": "Je n'ai pas trouvé ces articles sur cette page. Essayez 'compare 1 and 2' ou 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -53,7 +53,8 @@ HINDI = {
         "compare_header": "चुने हुए आइटम की तुलना:",
         "price": "कीमत",
         "rating": "रेटिंग",
-        "no_match": "कोई प्रोडक्ट आपके फ़िल्टर से मैच नहीं करता। दूसरे मापदंड आज़माएं।"
+        "no_match": "कोई प्रोडक्ट आपके फ़िल्टर से मैच नहीं करता। दूसरे मापदंड आज़माएं।",
+        "price_range": "इस पेज पर कीमतें {min} से {max} तक हैं (मीडियन {median})।"
     },
     
     "filters": {
@@ -96,5 +97,22 @@ HINDI = {
         "send": "भेजें",
         "typing": "सोच रहा हूं...",
         "powered_by": "ShopBuddy AI द्वारा संचालित"
+    },
+    
+    "comparison": {
+        "product": "प्रोडक्ट",
+        "price": "कीमत",
+        "rating": "रेटिंग",
+        "discount": "छूट",
+        "reviews": "रिव्यू",
+        "ram": "RAM",
+        "storage": "स्टोरेज",
+        "screen": "स्क्रीन",
+        "battery": "बैटरी",
+        "cheapest": "सबसे कम कीमत: {name}",
+        "top_rated": "सबसे अच्छी रेटिंग: {name}",
+        "best_value": "सबसे अच्छी वैल्यू: {name}",
+        "need_two": "तुलना के लिए इस पेज पर कम से कम दो प्रोडक्ट चाहिए।",
+        "not_found": "ये आइटम इस पेज पर नहीं मिले। 'compare 1 and 2' या 'compare top 3' आज़माएं।"
     }
 }
\ No newline at end of file
@@ -41,7 +41,8 @@ JAPANESE = {
         "compare_header": "選択した商品の比較：",
         "price": "価格",
         "rating": "評価",
-        "no_match": "フィルターに一致する商品がありません。別の条件をお試しください。"
+        "no_match": "フィルターに一致する商品がありません。別の条件をお試しください。",
+        "price_range": "このページの価格は {min} から {max} です（中央値 {median}）。"
     },
     
     "actions": {
@@ -58,5 +59,22 @@ JAPANESE = {
         "send": "送信",
         "typing": "考え中...",
         "powered_by": "ShopBuddy AI 搭載"
+    },
+    
+    "comparison": {
+        "product": "商品",
+        "price": "価格",
+        "rating": "評価",
+        "discount": "割引",
+        "reviews": "レビュー",
+        "ram": "RAM",
+        "storage": "ストレージ",
+        "screen": "画面",
+        "battery": "バッテリー",
+        "cheapest": "最安値：{name}",
+        "top_rated": "最高評価：{name}",
+        "best_value": "コスパ最高：{name}",
+        "need_two": "比較するには、このページに2つ以上の商品が必要です。",
+        "not_found": "このページでその商品が見つかりませんでした。'compare 1 and 2' や 'compare top 3' をお試しください。"
     }
 }
\ No newline at end of file
@@ -41,7 +41,8 @@ PORTUGUESE = {
         "compare_header": "Comparação dos itens selecionados:",
         "price": "Preço",
         "rating": "Avaliação",
-        "no_match": "Nenhum produto corresponde aos seus filtros. Tente outros critérios."
+        "no_match": "Nenhum produto corresponde aos seus filtros. Tente outros critérios.",
+        "price_range": "Os preços nesta página vão de {min} a {max} (mediana {median})."
     },
     
     "actions": {
@@ -58,5 +59,22 @@ PORTUGUESE = {
         "send": "Enviar",
         "typing": "Pensando...",
         "powered_by": "Desenvolvido por ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Produto",
+        "price": "Preço",
+        "rating": "Avaliação",
+        "discount": "Desconto",
+        "reviews": "Avaliações",
+        "ram": "RAM",
+        "storage": "Armazenamento",
+        "screen": "Tela",
+        "battery": "Bateria",
+        "cheapest": "Menor preço: {name}",
+        "top_rated": "Mais bem avaliado: {name}",
+        "best_value": "Melhor custo-benefício: {name}",
+        "need_two": "Preciso de pelo menos dois produtos nesta página para comparar.",
+        "not_found": "Não encontrei esses itens nesta página. Tente 'compare 1 and 2' ou 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -41,7 +41,8 @@ RUSSIAN = {
         "compare_header": "Сравнение выбранных товаров:",
         "price": "Цена",
         "rating": "Рейтинг",
-        "no_match": "Нет товаров, соответствующих фильтрам. Попробуйте другие критерии."
+        "no_match": "Нет товаров, соответствующих фильтрам. Попробуйте другие критерии.",
+        "price_range": "Цены на этой странице от {min} до {max} (медиана {median})."
     },
     
     "actions": {
@@ -58,5 +59,22 @@ RUSSIAN = {
         "send": "Отправить",
         "typing": "Думаю...",
         "powered_by": "Работает на ShopBuddy AI"
+    },
+    
+    "comparison": {
+        "product": "Товар",
+        "price": "Цена",
+        "rating": "Рейтинг",
+        "discount": "Скидка",
+        "reviews": "Отзывы",
+        "ram": "ОЗУ",
+        "storage": "Память",
+        "screen": "Экран",
+        "battery": "Батарея",
+        "cheapest": "Самая низкая цена: {name}",
+        "top_rated": "Самый высокий рейтинг: {name}",
+        "best_value": "Лучшее соотношение цены и качества: {name}",
+        "need_two": "Для сравнения на странице нужно как минимум два товара.",
+        "not_found": "Не удалось найти эти товары на странице. Попробуйте 'compare 1 and 2' или 'compare top 3'."
     }
 }
\ No newline at end of file
@@ -41,7 +41,8 @@ CHINESE = {
         "compare_header": "所选商品比较：",
         "price": "价格",
         "rating": "评分",
-        "no_match": "没有产品符合你的筛选条件。请尝试其他条件。"
+        "no_match": "没有产品符合你的筛选条件。请尝试其他条件。",
+        "price_range": "此页面的价格从 {min} 到 {max}（中位数 {median}）。"
     },
     
     "actions": {
@@ -58,5 +59,22 @@ CHINESE = {
         "send": "发送",
         "typing": "思考中...",
         "powered_by": "由 ShopBuddy AI 提供支持"
+    },
+    
+    "comparison": {
+        "product": "商品",
+        "price": "价格",
+        "rating": "评分",
+        "discount": "折扣",
+        "reviews": "评论数",
+        "ram": "内存",
+        "storage": "存储",
+        "screen": "屏幕",
+        "battery": "电池",
+        "cheapest": "最低价格：{name}",
+        "top_rated": "评分最高：{name}",
+        "best_value": "性价比最高：{name}",
+        "need_two": "此页面至少需要两个商品才能比较。",
+        "not_found": "在此页面上找不到这些商品。请尝试 'compare 1 and 2' 或 'compare top 3'。"
     }
 }
\ No newline at end of file
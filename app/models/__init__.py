@@ -6,22 +6,42 @@ from app.models.schemas import (
     Product,
     QueryRequest,
     QueryResponse,
+    ProductSnapshotRequest,
+    ProductQueryRequest,
+    ProductQueryResponse,
+    ProductFacetsResponse,
+    ProductSearchRequest,
+    ProductSearchResponse,
+    PriceMatchRequest,
+    PriceMatchResponse,
     HealthResponse,
+    MetricsResponse,
     ErrorResponse
 )
 from app.models.enums import (
     IntentType,
     SiteCategory,
-    SortOrder
+    SortOrder,
+    ResponseMode
 )
 
 __all__ = [
     "Product",
     "QueryRequest",
     "QueryResponse",
+    "ProductSnapshotRequest",
+    "ProductQueryRequest",
+    "ProductQueryResponse",
+    "ProductFacetsResponse",
+    "ProductSearchRequest",
+    "ProductSearchResponse",
+    "PriceMatchRequest",
+    "PriceMatchResponse",
     "HealthResponse",
+    "MetricsResponse",
     "ErrorResponse",
     "IntentType",
     "SiteCategory",
-    "SortOrder"
+    "SortOrder",
+    "ResponseMode"
 ]
\ No newline at end of file
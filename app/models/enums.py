@@ -46,6 +46,14 @@ class SortOrder(str, Enum):
     DESCENDING = "desc"
 
 
+class ResponseMode(str, Enum):
+    """LLM routing modes, from cheapest to most capable."""
+    
+    FAST = "fast"
+    BALANCED = "balanced"
+    QUALITY = "quality"
+
+
 class AIProvider(str, Enum):
     """AI service provider options."""
     
@@ -4,6 +4,7 @@ Pydantic schemas with multi-language support.
 
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
+from app.models.enums import ResponseMode, SortOrder
 
 
 class Product(BaseModel):
@@ -32,6 +33,7 @@ class QueryRequest(BaseModel):
     site_type: Optional[str] = Field(default=None, description="Detected site type")
     page_type: Optional[str] = Field(default=None, description="Page category")
     language: Optional[str] = Field(default="auto", description="Language code (auto/en/hi/es/...)")
+    mode: Optional[ResponseMode] = Field(default=None, description="LLM routing mode; defaults per intent")
 
 
 class QueryResponse(BaseModel):
@@ -44,6 +46,119 @@ class QueryResponse(BaseModel):
     confidence: Optional[float] = Field(default=None, description="Intent confidence")
     processing_time: Optional[float] = Field(default=None, description="Time in seconds")
     language: Optional[str] = Field(default=None, description="Response language")
+    comparison: Optional[Dict[str, Any]] = Field(default=None, description="Aligned attributes of compared items")
+    prompt_tokens: Optional[int] = Field(default=None, description="Estimated prompt tokens sent to the LLM")
+
+
+class ProductSnapshotRequest(BaseModel):
+    """Schema for requests that work on a product snapshot."""
+    
+    products: Optional[List[Product]] = Field(default=[], description="Scraped items")
+    snapshot_id: Optional[str] = Field(default=None, description="Previously returned snapshot reference")
+
+
+class ProductQueryRequest(ProductSnapshotRequest):
+    """Schema for structured product filtering without natural language."""
+    
+    min_price: Optional[float] = Field(default=None, ge=0, description="Minimum price")
+    max_price: Optional[float] = Field(default=None, ge=0, description="Maximum price")
+    currency: Optional[str] = Field(default=None, description="Currency of the price bounds (default: the page's)")
+    min_rating: Optional[float] = Field(default=None, ge=0, description="Minimum rating")
+    contains: Optional[str] = Field(default=None, description="Text that name or extra must contain")
+    category: Optional[str] = Field(default=None, description="Product category, as in facet counts")
+    sort_by: Optional[str] = Field(default=None, description="Sort field (price/rating/discount/reviews/value)")
+    sort_order: Optional[SortOrder] = Field(
+        default=None, description="Sort direction (default: ascending for price, descending otherwise)"
+    )
+    limit: int = Field(default=20, ge=1, le=200, description="Maximum items returned")
+
+
+class ProductQueryResponse(BaseModel):
+    """Schema for structured product query response."""
+    
+    items: List[Dict[str, Any]] = Field(default=[], description="Filtered and sorted items")
+    total: int = Field(..., description="Items in the snapshot")
+    snapshot_id: str = Field(..., description="Reference for follow-up queries")
+    processing_time: Optional[float] = Field(default=None, description="Time in seconds")
+
+
+class ProductSearchRequest(ProductSnapshotRequest):
+    """Schema for free-text relevance search over a product snapshot."""
+    
+    query: str = Field(..., description="Search text", min_length=1)
+    limit: int = Field(default=10, ge=1, le=50, description="Maximum items returned")
+
+
+class ProductSearchResponse(BaseModel):
+    """Schema for product search response."""
+    
+    items: List[Dict[str, Any]] = Field(default=[], description="Items ordered by relevance")
+    scores: List[float] = Field(default=[], description="Relevance score per item")
+    mode: str = Field(..., description="hybrid or keyword")
+    total: int = Field(..., description="Items in the snapshot")
+    snapshot_id: str = Field(..., description="Reference for follow-up queries")
+    processing_time: Optional[float] = Field(default=None, description="Time in seconds")
+
+
+class PriceMatchRequest(ProductSnapshotRequest):
+    """Schema for matching a snapshot's products against other sites."""
+    
+    site: str = Field(..., description="Site the products come from", min_length=1)
+
+
+class PriceOffer(BaseModel):
+    """Schema for one product offer seen on another site."""
+    
+    site: str = Field(..., description="Site name")
+    name: str = Field(..., description="Product name on that site")
+    price: Optional[str] = Field(default="", description="Price as scraped")
+    price_value: float = Field(..., description="Parsed price")
+    similarity: float = Field(..., description="Estimated name similarity (0-1)")
+
+
+class PriceMatch(BaseModel):
+    """Schema for one product and its offers elsewhere."""
+    
+    product: Dict[str, Any] = Field(..., description="Product from the request")
+    price_value: float = Field(default=0, description="Parsed price of the product")
+    offers: List[PriceOffer] = Field(default=[], description="Offers on other sites, cheapest first")
+    best_site: str = Field(..., description="Site with the cheapest offer")
+    savings: float = Field(default=0, description="Saving versus the cheapest offer")
+
+
+class PriceMatchResponse(BaseModel):
+    """Schema for cross-site price match response."""
+    
+    matches: List[PriceMatch] = Field(default=[], description="Products found on other sites")
+    snapshot_id: str = Field(..., description="Reference for follow-up queries")
+    processing_time: Optional[float] = Field(default=None, description="Time in seconds")
+
+
+class FacetBucket(BaseModel):
+    """Schema for one facet bucket."""
+    
+    label: str = Field(..., description="Display label")
+    count: int = Field(..., description="Items in the bucket")
+    min: Optional[float] = Field(default=None, description="Lower bound (inclusive)")
+    max: Optional[float] = Field(default=None, description="Upper bound")
+
+
+class ProductFacetsResponse(BaseModel):
+    """Schema for product statistics and facet counts."""
+    
+    total: int = Field(..., description="Items in the snapshot")
+    currency: str = Field(default="INR", description="Currency the page's prices are in")
+    price_min: float = Field(default=0, description="Lowest price")
+    price_max: float = Field(default=0, description="Highest price")
+    price_avg: float = Field(default=0, description="Average price")
+    rating_avg: float = Field(default=0, description="Average rating of rated items")
+    price_percentiles: Dict[str, float] = Field(default={}, description="Price percentiles (p10-p90)")
+    price_histogram: List[FacetBucket] = Field(default=[], description="Price buckets")
+    rating_distribution: Dict[str, int] = Field(default={}, description="Item counts per star")
+    discount_bands: List[FacetBucket] = Field(default=[], description="Discount buckets")
+    categories: Dict[str, int] = Field(default={}, description="Item counts per category")
+    snapshot_id: str = Field(..., description="Reference for follow-up queries")
+    processing_time: Optional[float] = Field(default=None, description="Time in seconds")
 
 
 class LanguageInfo(BaseModel):
@@ -70,6 +185,51 @@ class HealthResponse(BaseModel):
     services: Dict[str, str] = Field(default={}, description="Service statuses")
 
 
+class IntentBypassCount(BaseModel):
+    """Chat requests and LLM bypasses for one intent."""
+    
+    requests: int = Field(default=0, description="Chat requests with this intent")
+    bypassed: int = Field(default=0, description="Requests answered without the LLM")
+
+
+class BypassMetrics(BaseModel):
+    """Share of chat requests answered without the LLM."""
+    
+    requests: int = Field(default=0, description="Chat requests handled")
+    bypassed: int = Field(default=0, description="Requests answered without the LLM")
+    bypass_rate: float = Field(default=0.0, description="Bypassed share of requests")
+    intents: Dict[str, IntentBypassCount] = Field(default={}, description="Counts per intent")
+
+
+class ProviderHealth(BaseModel):
+    """Observed health of one LLM provider."""
+    
+    state: str = Field(..., description="Circuit state (closed/open/half_open)")
+    latency_ms: Optional[float] = Field(default=None, description="EWMA latency of successful calls")
+    error_rate: float = Field(default=0.0, description="EWMA error rate")
+    calls: int = Field(default=0, description="Calls made")
+    failures: int = Field(default=0, description="Failed calls")
+    first_token_ms: Optional[float] = Field(default=None, description="First-token latency at HEDGE_QUANTILE")
+
+
+class ProviderMetrics(BaseModel):
+    """LLM provider routing state."""
+    
+    providers: Dict[str, ProviderHealth] = Field(default={}, description="Health per provider")
+    retry_budget: float = Field(default=0.0, description="Retries currently allowed")
+    retries: int = Field(default=0, description="Retries made on another provider")
+    retries_denied: int = Field(default=0, description="Retries refused by the budget")
+    hedges: int = Field(default=0, description="Calls raced against a second provider")
+    hedge_wins: int = Field(default=0, description="Hedged calls the second provider answered first")
+
+
+class MetricsResponse(BaseModel):
+    """Schema for service metrics."""
+    
+    bypass: BypassMetrics = Field(..., description="LLM bypass counts")
+    providers: ProviderMetrics = Field(..., description="LLM provider routing")
+
+
 class ErrorResponse(BaseModel):
     """Schema for error response."""
     
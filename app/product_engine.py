@@ -4,6 +4,7 @@ Product Filtering Engine
 
 import re
 from typing import List, Dict
+from app.utils.prices import get_price_parser
 
 
 class ProductEngine:
@@ -12,13 +13,7 @@ class ProductEngine:
 
     def extract_price(self, price_str: str) -> float:
         """Extract numeric price"""
-        if not price_str or price_str == 'N/A':
-            return 0.0
-        cleaned = re.sub(r'[^\d.]', '', str(price_str).replace(',', ''))
-        try:
-            return float(cleaned) if cleaned else 0.0
-        except:
-            return 0.0
+        return get_price_parser().parse(price_str)
 
     def extract_rating(self, rating_str: str) -> float:
         """Extract numeric rating"""
@@ -3,11 +3,28 @@ Service layer containing business logic.
 """
 
 from app.services.ai_service import AIService
+from app.services.comparison_service import ComparisonService
+from app.services.context_assembler import ContextAssembler
 from app.services.intent_service import IntentService
+from app.services.product_categorizer import ProductCategorizer
 from app.services.product_service import ProductService
+from app.services.product_search import ProductSearchService
+from app.services.price_match import PriceMatchService
+from app.services.provider_router import ProviderRouter
+from app.services.query_service import QueryService, QueryAnalysis
+from app.services.template_service import TemplateService
 
 __all__ = [
     "AIService",
+    "ComparisonService",
+    "ContextAssembler",
     "IntentService",
-    "ProductService"
+    "ProductCategorizer",
+    "ProductService",
+    "ProductSearchService",
+    "PriceMatchService",
+    "ProviderRouter",
+    "QueryService",
+    "QueryAnalysis",
+    "TemplateService"
 ]
\ No newline at end of file
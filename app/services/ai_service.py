@@ -4,33 +4,49 @@ Enterprise-Grade LLM Orchestration with Real Product Intelligence
 Production Ready - Clean Code
 """
 
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, NamedTuple, Optional, Any, Tuple, Union
 from datetime import datetime
-from app.core.config import get_settings
+from app.core.config import ModelRoute, get_settings
 from app.core.logger import Logger
 from app.core.exceptions import AIServiceException
+from app.models.enums import AIProvider
+from app.services.context_assembler import ContextAssembler
+from app.services.filter_plan import FilterPlan
+from app.services.product_search import ProductSearchService
+from app.services.provider_router import ProviderRouter
+from app.services.product_service import ProductService
+from app.services.query_service import QueryAnalysis, ensure_analysis
+from app.services.local_embeddings import LocalEmbeddings
+from app.services.vector_store_cache import VectorStoreCache, VECTOR_STORE_AVAILABLE
+from app.utils.prices import get_price_parser
+from app.utils.ranking import top_k
+from app.utils.tokens import count_tokens
 
 from langchain_groq import ChatGroq
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.runnables import RunnableLambda
 from langchain.callbacks.base import BaseCallbackHandler
-from langchain_core.documents import Document
 
 from pydantic import BaseModel, Field
 from enum import Enum
 import json
+import os
 import re
 
 try:
-    from langchain_community.vectorstores import FAISS
     from langchain_google_genai import GoogleGenerativeAIEmbeddings
-    VECTOR_STORE_AVAILABLE = True
 except ImportError:
     VECTOR_STORE_AVAILABLE = False
 
 
+_RATING_PATTERN = re.compile(r'([\d.]+)')
+_NO_PAGE_CONTENT = "No additional page content available."
+_NO_HISTORY = "No previous conversation."
+
+
 class IntentType(str, Enum):
     PRODUCT_SEARCH = "product_search"
     PRICE_COMPARISON = "price_comparison"
@@ -39,6 +55,13 @@ class IntentType(str, Enum):
     GENERAL_CHAT = "general_chat"
 
 
+class GeneratedResponse(NamedTuple):
+    """Response text and the prompt tokens sent to produce it."""
+    
+    text: str
+    prompt_tokens: int
+
+
 class ProductRecommendation(BaseModel):
     product_name: str = Field(description="Product name")
     reason: str = Field(description="Why this product is recommended")
@@ -97,150 +120,63 @@ class SimpleChatHistory:
 class ProductIntelligence:
     
     @staticmethod
-    def extract_price_range(query: str) -> Tuple[Optional[int], Optional[int]]:
-        patterns = [
-            r'(\d+)\s*(?:se|से)\s*kam',
-            r'under\s*[₹$]?\s*(\d+)',
-            r'below\s*[₹$]?\s*(\d+)',
-            r'less\s*than\s*[₹$]?\s*(\d+)',
-            r'[₹$]?\s*(\d+)\s*(?:se|से|-|to)\s*[₹$]?\s*(\d+)',
-            r'between\s*[₹$]?\s*(\d+)\s*(?:and|&)\s*[₹$]?\s*(\d+)',
-            r'budget\s*[₹$]?\s*(\d+)',
-            r'max\s*[₹$]?\s*(\d+)',
-        ]
+    def extract_price_range(query: Union[str, QueryAnalysis]) -> Tuple[Optional[int], Optional[int]]:
+        analysis = ensure_analysis(query)
         
-        query_lower = query.lower().replace(',', '')
+        if not analysis.has_price_bounds:
+            return (None, None)
         
-        for pattern in patterns:
-            match = re.search(pattern, query_lower)
-            if match:
-                groups = match.groups()
-                if len(groups) == 1:
-                    return (0, int(groups[0]))
-                else:
-                    return (int(groups[0]), int(groups[1]))
-        
-        return (None, None)
+        max_price = int(analysis.max_price) if analysis.max_price is not None else None
+        return (int(analysis.min_price or 0), max_price)
     
     @staticmethod
-    def filter_by_price(items: List[Dict], min_price: int = None, max_price: int = None) -> List[Dict]:
+    def filter_by_price(
+        items: List[Dict], min_price: int = None, max_price: int = None, currency: Optional[str] = None
+    ) -> List[Dict]:
         if not items:
             return []
         
-        filtered = []
-        
-        for item in items:
-            price_str = item.get('price', '0')
-            price_match = re.search(r'[\d,]+', str(price_str))
-            
-            if price_match:
-                try:
-                    price = int(price_match.group().replace(',', ''))
-                    
-                    if min_price and price < min_price:
-                        continue
-                    if max_price and price > max_price:
-                        continue
-                    
-                    filtered.append(item)
-                except ValueError:
-                    continue
-        
-        return filtered
+        # Bounds without a currency are in the page's own currency, like its prices
+        plan = FilterPlan.build(
+            min_price=min_price or None, max_price=max_price or None, currency=currency, limit=len(items)
+        )
+        return ProductService().apply_filters(items, plan)
     
     @staticmethod
-    def extract_category(query: str) -> Optional[str]:
-        query_lower = query.lower()
-        
-        category_keywords = {
-            "mobile_accessories": [
-                "mobile", "phone", "earphone", "headphone", "earbuds",
-                "charger", "cable", "power bank", "case", "cover"
-            ],
-            "electronics": [
-                "tv", "television", "speaker", "tablet", "laptop",
-                "camera", "smart watch", "monitor"
-            ],
-            "home_kitchen": [
-                "mixer", "grinder", "kettle", "cooker", "toaster",
-                "oven", "refrigerator", "washing machine", "iron", "fan"
-            ],
-            "fashion": [
-                "shirt", "tshirt", "jeans", "shoes", "watch",
-                "sunglasses", "bag", "wallet", "belt"
-            ],
-            "books": ["book", "novel", "kindle", "magazine"],
-            "beauty": ["beauty", "cosmetic", "makeup", "skincare", "perfume"]
-        }
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in query_lower for keyword in keywords):
-                return category
-        
-        return None
+    def extract_category(query: Union[str, QueryAnalysis]) -> Optional[str]:
+        return ensure_analysis(query).category
     
     @staticmethod
-    def sort_by_value(items: List[Dict]) -> List[Dict]:
+    def sort_by_value(items: List[Dict], limit: Optional[int] = None) -> List[Dict]:
         if not items:
             return []
         
-        def value_score(item):
-            score = 0.0
-            
-            discount = 0
-            if item.get('discount'):
-                match = re.search(r'(\d+)%', str(item['discount']))
-                if match:
-                    discount = int(match.group(1))
-            
-            rating = 0.0
-            if item.get('rating'):
-                match = re.search(r'([\d.]+)', str(item['rating']))
-                if match:
-                    try:
-                        rating = float(match.group(1))
-                    except ValueError:
-                        pass
-            
-            price = 999999
-            if item.get('price'):
-                match = re.search(r'[\d,]+', str(item['price']))
-                if match:
-                    try:
-                        price = int(match.group().replace(',', ''))
-                    except ValueError:
-                        pass
-            
-            score = (discount * 0.4) + (rating * 6) + (max(0, (10000 - price) / 10000) * 30)
-            return score
-        
-        return sorted(items, key=value_score, reverse=True)
+        # Scores are computed once per snapshot and cached on its table
+        plan = FilterPlan(sort_by="value", descending=True, limit=limit or len(items))
+        return ProductService().apply_filters(items, plan)
     
     @staticmethod
-    def sort_by_price(items: List[Dict], ascending: bool = True) -> List[Dict]:
+    def sort_by_price(
+        items: List[Dict], ascending: bool = True, limit: Optional[int] = None
+    ) -> List[Dict]:
         if not items:
             return []
         
+        parser = get_price_parser()
+        
         def get_price(item):
-            price_str = item.get('price', '999999')
-            match = re.search(r'[\d,]+', str(price_str))
-            if match:
-                try:
-                    return int(match.group().replace(',', ''))
-                except ValueError:
-                    return 999999
-            return 999999
+            return parser.parse(item.get('price')) or 999999
         
-        return sorted(items, key=get_price, reverse=not ascending)
+        return top_k(items, get_price, limit, reverse=not ascending)
     
     @staticmethod
-    def sort_by_rating(items: List[Dict]) -> List[Dict]:
+    def sort_by_rating(items: List[Dict], limit: Optional[int] = None) -> List[Dict]:
         if not items:
             return []
         
         def get_rating(item):
             rating_str = item.get('rating', '0')
-            match = re.search(r'([\d.]+)', str(rating_str))
+            match = _RATING_PATTERN.search(str(rating_str))
             if match:
                 try:
                     return float(match.group(1))
@@ -248,7 +184,7 @@ class ProductIntelligence:
                     return 0.0
             return 0.0
         
-        return sorted(items, key=get_rating, reverse=True)
+        return top_k(items, get_rating, limit, reverse=True)
 
 
 class LangChainService:
@@ -265,92 +201,116 @@ class LangChainService:
         self._logger = Logger("langchain_service")
         self._settings = get_settings()
         self._product_intel = ProductIntelligence()
+        self._product_search = ProductSearchService()
+        self._context_assembler = ContextAssembler()
+        self._provider_router = ProviderRouter()
         self._chat_histories: Dict[str, SimpleChatHistory] = {}
         self._token_callback = TokenCounterCallback()
-        self._vectorstore: Optional[Any] = None
         self._embeddings = None
+        self._embedding_provider: Optional[str] = None
+        self._vector_stores: Optional[VectorStoreCache] = None
+        self._response_chain = None
+        self._routes = self._settings.model_routes
+        self._route_chains: Dict[Tuple[str, int], Any] = {}
         
         self._setup_llms()
         self._setup_embeddings()
         self._setup_chains()
     
     def _setup_llms(self) -> None:
+        self._llm = self._build_llm(self._routes["quality"])
+    
+    def _build_llm(self, route: ModelRoute) -> Optional[Any]:
         try:
-            llms = []
+            llms: Dict[str, Any] = {}
             
+            # Keyed by provider and model so each model gets its own latency and circuit
             if self._settings.has_groq:
-                groq_llm = ChatGroq(
+                # Retries are granted by the provider router's budget, not per client
+                llms[f"{AIProvider.GROQ.value}/{route.model}"] = ChatGroq(
                     temperature=self._settings.temperature,
-                    model_name=self._settings.groq_model,
+                    model_name=route.model,
                     groq_api_key=self._settings.groq_api_key,
-                    max_tokens=self._settings.max_tokens,
-                    max_retries=2,
+                    max_tokens=route.max_tokens,
+                    max_retries=0,
                     callbacks=[self._token_callback]
                 )
-                llms.append(groq_llm)
             
             if self._settings.has_gemini:
-                gemini_llm = ChatGoogleGenerativeAI(
+                llms[f"{AIProvider.GEMINI.value}/{self._settings.gemini_model}"] = ChatGoogleGenerativeAI(
                     model=self._settings.gemini_model,
                     google_api_key=self._settings.gemini_api_key,
                     temperature=self._settings.temperature,
+                    max_output_tokens=route.max_tokens,
                     convert_system_message_to_human=True,
                     callbacks=[self._token_callback]
                 )
-                llms.append(gemini_llm)
             
-            if len(llms) > 1:
-                self._llm = llms[0].with_fallbacks(llms[1:])
-            elif len(llms) == 1:
-                self._llm = llms[0]
-            else:
-                self._llm = None
+            if not llms:
+                return None
+            return RunnableLambda(lambda prompt: self._provider_router.invoke(llms, prompt))
                 
         except Exception as e:
-            self._logger.error(f"LLM initialization failed: {e}")
-            self._llm = None
+            self._logger.error(f"LLM initialization failed for {route.model}: {e}")
+            return None
     
     def _setup_embeddings(self) -> None:
         if not VECTOR_STORE_AVAILABLE:
             return
         
         try:
-            if self._settings.has_gemini:
+            provider = self._settings.embedding_provider.lower()
+            
+            if provider in ("auto", "local"):
+                local = LocalEmbeddings(batch_size=self._settings.embedding_batch_size)
+                if local.available:
+                    self._embeddings, self._embedding_provider = local, "local"
+                elif provider == "local":
+                    self._logger.warning("Local embeddings requested but the model is not loaded")
+            
+            if self._embeddings is None and provider in ("auto", "gemini") and self._settings.has_gemini:
                 self._embeddings = GoogleGenerativeAIEmbeddings(
                     model="models/embedding-001",
                     google_api_key=self._settings.gemini_api_key
                 )
+                self._embedding_provider = "gemini"
+            
+            if self._embeddings is not None:
+                # Stores from different providers are not interchangeable
+                persist_dir = self._settings.vector_store_dir
+                self._vector_stores = VectorStoreCache(
+                    self._embeddings,
+                    maxsize=self._settings.vector_store_cache_size,
+                    max_pending=self._settings.vector_store_max_pending,
+                    persist_dir=os.path.join(persist_dir, self._embedding_provider) if persist_dir else None
+                )
+                self._logger.info(f"RAG embeddings: {self._embedding_provider}")
         except Exception as e:
             self._logger.error(f"Embeddings setup failed: {e}")
             self._embeddings = None
+            self._embedding_provider = None
+            self._vector_stores = None
     
-    def _create_vectorstore(self, items: List[Dict]) -> None:
-        if not VECTOR_STORE_AVAILABLE or not self._embeddings or not items:
-            return
+    def _get_vectorstore(self, items: List[Dict]) -> Optional[Any]:
+        """Cached store for this product set; None while it builds in the background."""
+        if self._vector_stores is None:
+            return None
+        return self._vector_stores.get(items)
+    
+    def _retrieve(self, items: List[Dict], query: str, limit: int) -> Optional[List[Dict]]:
+        """Items the RAG store finds closest to the query, or None until the store is ready."""
+        store = self._get_vectorstore(items)
+        if store is None:
+            return None
         
         try:
-            documents = []
-            for item in items:
-                content = f"""
-                Product: {item.get('name', 'Unknown')}
-                Price: {item.get('price', 'N/A')}
-                Rating: {item.get('rating', 'N/A')}
-                Discount: {item.get('discount', 'N/A')}
-                """
-                metadata = {
-                    'name': item.get('name'),
-                    'price': item.get('price'),
-                    'rating': item.get('rating'),
-                    'discount': item.get('discount')
-                }
-                documents.append(Document(page_content=content, metadata=metadata))
-            
-            self._vectorstore = FAISS.from_documents(
-                documents=documents,
-                embedding=self._embeddings
-            )
-        except Exception:
-            self._vectorstore = None
+            documents = store.similarity_search(query, k=min(limit, len(items)))
+        except Exception as e:
+            self._logger.error(f"Vector store retrieval failed: {e}")
+            return None
+        
+        positions = [document.metadata.get("position") for document in documents]
+        return [items[position] for position in positions if isinstance(position, int) and position < len(items)] or None
     
     def _setup_chains(self) -> None:
         if not self._llm:
@@ -401,6 +361,7 @@ FORMAT:
         ])
         
         self._response_chain = self._response_prompt | self._llm | StrOutputParser()
+        self._route_chains[self._route_key(self._routes["quality"])] = self._response_chain
         
         self._structured_prompt = ChatPromptTemplate.from_messages([
             ("system", """Generate structured JSON with product recommendations.
@@ -427,13 +388,42 @@ Return valid JSON:
         
         self._structured_chain = self._structured_prompt | self._llm | JsonOutputParser()
     
-    def _format_products_context(self, items: List[Dict]) -> str:
-        if not items:
-            return "No products currently available. The user should browse the website to see products."
+    @staticmethod
+    def _route_key(route: ModelRoute) -> Tuple[str, int]:
+        return route.model, route.max_tokens
+    
+    def select_route(self, intent: Optional[str] = None, mode: Optional[str] = None) -> Tuple[str, ModelRoute]:
+        """
+        Pick the model route for a request.
         
-        context_parts = [f"{len(items)} Products Available:\n"]
+        Args:
+            intent: Classified intent, used when no mode is requested
+            mode: Requested response mode (fast/balanced/quality)
+            
+        Returns:
+            Tuple of (mode name, route); unknown modes use LLM_DEFAULT_MODE
+        """
+        mode = getattr(mode, "value", mode) or self._settings.intent_modes.get(intent or "") or self._settings.llm_default_mode
+        if mode not in self._routes:
+            mode = self._settings.llm_default_mode if self._settings.llm_default_mode in self._routes else "quality"
+        return mode, self._routes[mode]
+    
+    def _get_response_chain(self, route: ModelRoute) -> Optional[Any]:
+        key = self._route_key(route)
+        chain = self._route_chains.get(key)
+        if chain is None:
+            llm = self._build_llm(route)
+            if llm is None:
+                # Route misconfigured or provider refused the model; keep answering on the default
+                return self._response_chain
+            chain = self._route_chains.setdefault(key, self._response_prompt | llm | StrOutputParser())
+        return chain
+    
+    @staticmethod
+    def _format_product_entries(items: List[Dict]) -> List[str]:
+        entries = []
         
-        for i, item in enumerate(items[:25], 1):
+        for i, item in enumerate(items, 1):
             parts = [f"\n{i}. {item.get('name', 'Unknown Product')}"]
             
             if item.get("price"):
@@ -448,38 +438,58 @@ Return valid JSON:
             if item.get("reviews"):
                 parts.append(f"   Reviews: {item['reviews']}")
             
-            context_parts.append("\n".join(parts))
+            entries.append("\n".join(parts))
         
-        return "\n".join(context_parts)
+        return entries
     
     def _get_chat_history(self, session_id: str) -> SimpleChatHistory:
         if session_id not in self._chat_histories:
             self._chat_histories[session_id] = SimpleChatHistory()
         return self._chat_histories[session_id]
     
-    def _prepare_items(self, items: List[Dict], query: str) -> List[Dict]:
+    def _prepare_items(
+        self,
+        items: List[Dict],
+        analysis: QueryAnalysis,
+        limit: Optional[int] = None,
+        use_rag: bool = False
+    ) -> Tuple[List[Dict], int]:
         if not items:
-            return []
+            return [], 0
         
-        min_price, max_price = self._product_intel.extract_price_range(query)
+        if analysis.has_price_bounds:
+            items = self._product_intel.filter_by_price(
+                items, analysis.min_price, analysis.max_price, analysis.price_currency
+            )
         
-        if max_price:
-            items = self._product_intel.filter_by_price(items, min_price, max_price)
+        if analysis.has_spec_bounds and items:
+            plan = FilterPlan.build(specs=analysis.specs, limit=len(items))
+            items = ProductService().apply_filters(items, plan)
         
-        query_lower = query.lower()
+        keywords = analysis.keywords
+        total = len(items)
+        limit = limit or self._settings.context_items
         
-        if any(word in query_lower for word in ["cheapest", "lowest price", "sasta", "cheap", "budget"]):
-            items = self._product_intel.sort_by_price(items, ascending=True)
-        elif any(word in query_lower for word in ["expensive", "costly", "premium", "best"]):
-            items = self._product_intel.sort_by_price(items, ascending=False)
-        elif any(word in query_lower for word in ["best rated", "top rated", "highest rating", "popular"]):
-            items = self._product_intel.sort_by_rating(items)
+        if keywords.has("rank_cheap"):
+            items = self._product_intel.sort_by_price(items, ascending=True, limit=limit)
+        elif keywords.has("rank_premium"):
+            items = self._product_intel.sort_by_price(items, ascending=False, limit=limit)
+        elif keywords.has("rank_rated"):
+            items = self._product_intel.sort_by_rating(items, limit=limit)
         else:
-            items = self._product_intel.sort_by_value(items)
-        
-        return items
+            # Most relevant items first, from the RAG store once it is built;
+            # value order when the query names nothing on the page
+            ranked = self._retrieve(items, analysis.text, limit) if use_rag and items else None
+            if ranked is None:
+                ranked = self._product_search.rank_items(items, analysis.text, limit=limit)
+            items = ranked if ranked is not None else self._product_intel.sort_by_value(items, limit=limit)
+        
+        return items, total
+    
+    def generate_response(self, query: str, items: List[Dict] = None, **kwargs) -> str:
+        return self.generate(query, items, **kwargs).text
     
-    def generate_response(
+    def generate(
         self,
         query: str,
         items: List[Dict] = None,
@@ -489,30 +499,29 @@ Return valid JSON:
         page_content: str = "",
         language: str = "en",
         session_id: str = "default",
-        use_rag: bool = False
-    ) -> str:
+        use_rag: bool = False,
+        analysis: Optional[QueryAnalysis] = None,
+        route: Optional[ModelRoute] = None
+    ) -> GeneratedResponse:
         
         if not self._response_chain:
-            return "AI Service is currently unavailable. Please check API keys configuration."
+            return GeneratedResponse("AI Service is currently unavailable. Please check API keys configuration.", 0)
         
         try:
-            prepared_items = self._prepare_items(items or [], query)
-            
-            if use_rag and prepared_items and VECTOR_STORE_AVAILABLE:
-                self._create_vectorstore(prepared_items)
+            route = route or self.select_route()[1]
+            analysis = analysis or ensure_analysis(query)
+            prepared_items, total_items = self._prepare_items(items or [], analysis, route.context_items, use_rag)
             
-            product_context = self._format_products_context(prepared_items)
+            if prepared_items:
+                products_header = f"{total_items} Products Available:\n"
+            else:
+                products_header = "No products currently available. The user should browse the website to see products."
             
-            full_context = f"""
+            page_header = f"""
 Site: {site_type}
 Page Type: {page_type}
 Page Title: {page_title}
-
-{product_context}
-
-Page Summary:
-{page_content[:400] if page_content else 'No additional page content available.'}
-            """
+"""
             
             language_map = {
                 "en": "Respond in clear, professional English.",
@@ -523,29 +532,54 @@ Page Summary:
             lang_instruction = language_map.get(language, language_map["en"])
             
             chat_history = self._get_chat_history(session_id)
-            history_text = "\n".join([
-                f"{'User' if isinstance(msg, HumanMessage) else 'ShopBuddy'}: {msg.content[:100]}"
-                for msg in chat_history.messages[-4:]
-            ]) or "No previous conversation."
+            history_lines = [
+                f"{'User' if isinstance(msg, HumanMessage) else 'ShopBuddy'}: {msg.content}"
+                for msg in chat_history.messages
+            ]
+            
+            # Query, instructions and the empty-section placeholders always go in;
+            # products, history and page text share what is left
+            fixed = self._response_prompt.format(
+                context=f"{page_header}\n{products_header}\n\nPage Summary:\n{_NO_PAGE_CONTENT}",
+                language_instruction=lang_instruction,
+                query=query,
+                chat_history=_NO_HISTORY
+            )
+            assembled = self._context_assembler.assemble(
+                route.prompt_tokens, fixed,
+                self._format_product_entries(prepared_items),
+                history_lines,
+                page_content or ""
+            )
             
-            response = self._response_chain.invoke({
+            product_context = "\n".join([products_header, *assembled.products])
+            full_context = f"""{page_header}
+{product_context}
+
+Page Summary:
+{assembled.page_summary or _NO_PAGE_CONTENT}
+            """
+            history_text = "\n".join(assembled.history) or _NO_HISTORY
+            
+            inputs = {
                 "context": full_context,
                 "language_instruction": lang_instruction,
                 "query": query,
                 "chat_history": history_text
-            })
+            }
+            response = self._get_response_chain(route).invoke(inputs)
             
             chat_history.add_user_message(query, {"timestamp": datetime.now().isoformat()})
             chat_history.add_ai_message(response, {
                 "timestamp": datetime.now().isoformat(),
-                "products_shown": len(prepared_items)
+                "products_shown": len(assembled.products)
             })
             
-            return response
+            return GeneratedResponse(response, count_tokens(self._response_prompt.format(**inputs)))
             
         except Exception as e:
             self._logger.error(f"Chain execution failed: {e}")
-            return "Sorry, I encountered an error processing your request. Please try again."
+            return GeneratedResponse("Sorry, I encountered an error processing your request. Please try again.", 0)
     
     def classify_intent(self, query: str) -> str:
         if not self._intent_chain:
@@ -569,11 +603,15 @@ Page Summary:
         if session_id in self._chat_histories:
             self._chat_histories[session_id].clear()
     
+    @property
+    def llm_available(self) -> bool:
+        return self._response_chain is not None
+    
     @property
     def active_provider(self) -> str:
         if not self._llm:
             return "none"
-        return "LangChain (Groq/Gemini Fallback)"
+        return "LangChain (Groq/Gemini, latency routed)"
     
     @property
     def token_usage(self) -> Dict[str, int]:
@@ -595,6 +633,10 @@ Page Summary:
             "llm_available": self._llm is not None,
             "active_provider": self.active_provider,
             "has_rag": self.has_rag_support,
+            "embedding_provider": self._embedding_provider,
+            "vector_stores": self._vector_stores.stats if self._vector_stores is not None else None,
+            "model_routes": {mode: route._asdict() for mode, route in self._routes.items()},
+            "provider_routing": self._provider_router.metrics,
             "token_usage": self.token_usage,
             "active_sessions": len(self._chat_histories)
         }
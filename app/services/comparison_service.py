@@ -0,0 +1,290 @@
+"""
+Local product comparison service.
+Resolves the items a query refers to and compares their parsed attributes.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.logger import Logger
+from app.services.filter_plan import FilterPlan
+from app.services.language_service import LanguageService
+from app.services.product_search import ProductSearchService, query_terms
+from app.services.product_service import ProductService
+from app.services.product_table import ProductTable
+from app.services.query_service import QueryAnalysis
+from app.utils.bm25 import tokenize
+from app.utils.specs import SPEC_FIELDS
+
+
+_DEFAULT_COUNT = 3
+_MAX_COUNT = 5
+_NAME_LIMIT = 60
+
+_TOP_PATTERN = re.compile(r"\b(?:top|first|pehle)\s*(\d{1,2})\b")
+_ORDINAL_WORDS = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "pehla": 1, "pehle": 1, "dusra": 2, "doosra": 2, "teesra": 3, "tisra": 3
+}
+_ORDINAL_PATTERN = re.compile(r"\b(" + "|".join(_ORDINAL_WORDS) + r"|last)\b")
+_REFERENCE = r"(?:#|no\.?\s*|item\s*|product\s*)?\b\d{1,2}(?:st|nd|rd|th)?\b"
+_REFERENCE_LIST_PATTERN = re.compile(
+    _REFERENCE + r"(?:\s*(?:vs\.?|versus|and|aur|or|&|,|with)\s*" + _REFERENCE + r")+"
+)
+_REFERENCE_NUMBER_PATTERN = re.compile(r"\d{1,2}")
+# "#3", "no. 3", "item 3" and "3rd" are positions even next to a product name
+_EXPLICIT_REFERENCE_PATTERN = re.compile(r"#|\bno\b|\bitem|\bproduct|\d(?:st|nd|rd|th)\b")
+_VERSUS_PATTERN = re.compile(r"\s+(?:vs\.?|versus)\s+")
+_NAME_LIST_PATTERN = re.compile(r"\s+(?:vs\.?|versus|and|aur|or)\s+|\s*[,&]\s*")
+_COMPARE_WORDS = frozenset(tokenize(
+    "compare comparison between difference better best vs versus aur or which kaun sa mein"
+))
+_LEAD_WORDS_PATTERN = re.compile(r"^(?:compare|comparison|between|of)\s+")
+
+ATTRIBUTES = ("price", "rating", "discount", "reviews") + SPEC_FIELDS
+
+
+def _short_name(item: Dict) -> str:
+    name = str(item.get("name") or "").strip()
+    return name if len(name) <= _NAME_LIMIT else name[:_NAME_LIMIT - 1].rstrip() + "…"
+
+
+def _format_value(attribute: str, item: Dict, value: float) -> str:
+    if value <= 0:
+        return "-"
+    if attribute == "price":
+        return str(item.get("price"))
+    if attribute == "rating":
+        return f"{value:.1f}"
+    if attribute == "discount":
+        return f"{value:g}%"
+    if attribute == "reviews":
+        return f"{int(value):,}"
+    if attribute == "ram":
+        return f"{value:g}GB"
+    if attribute == "storage":
+        return f"{value / 1024:g}TB" if value >= 1024 and value % 1024 == 0 else f"{value:g}GB"
+    if attribute == "screen":
+        return f"{value:g}\""
+    if attribute == "battery":
+        return f"{value:g}mAh"
+    return f"{value:g}"
+
+
+class ComparisonService:
+    """
+    Service answering comparison queries without the LLM.
+
+    Picks the referenced items ("compare top 3", "1 vs 2", "boat vs jbl"),
+    lines up their parsed price, rating, discount, review and spec columns,
+    and renders the table from locale templates. Implements singleton pattern.
+    """
+
+    _instance: Optional["ComparisonService"] = None
+
+    def __new__(cls) -> "ComparisonService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self._logger = Logger("comparison_service")
+        self._product_service = ProductService()
+        self._product_search = ProductSearchService()
+        self._language_service = LanguageService()
+        self._logger.info("Comparison service initialized")
+
+    def resolve(self, items: List[Dict], analysis: QueryAnalysis) -> Optional[List[int]]:
+        """
+        Positions of the items a comparison query refers to.
+
+        Numbered references ("3 vs 4", "#2 and #5", "first vs last") are
+        page positions; bare numbers next to a product name ("iphone 14
+        and 15") are part of the names. Picks the query leaves open
+        ("top 3", bounds, no reference at all) skip near-duplicate
+        listings and keep to the query's category.
+
+        Args:
+            items: Products on the page, in page order, duplicates included
+            analysis: Analyzed query
+
+        Returns:
+            Row indices to compare, or None when the query names items
+            that are not on the page
+        """
+        text = analysis.text
+        count = len(items)
+        table = self._product_service.get_table(items)
+        unique = self._product_service.unique_rows(table)
+        if analysis.category:
+            # As in filters, rows without a category stay candidates
+            unique = unique[np.isin(table.category[unique], (analysis.category, ""))]
+        unique = unique.tolist()
+
+        top = _TOP_PATTERN.search(text)
+        if top:
+            return unique[:min(max(int(top.group(1)), 2), _MAX_COUNT)]
+
+        text = _ORDINAL_PATTERN.sub(
+            lambda match: "#" + str(count if match.group(1) == "last" else _ORDINAL_WORDS[match.group(1)]),
+            text
+        )
+
+        references = _REFERENCE_LIST_PATTERN.search(text)
+        named = references is not None and self._has_name_terms(text[:references.start()] + " " + text[references.end():])
+        if references and (not named or _EXPLICIT_REFERENCE_PATTERN.search(references.group())):
+            positions = [int(number) - 1 for number in _REFERENCE_NUMBER_PATTERN.findall(references.group())]
+            if any(position < 0 or position >= count for position in positions):
+                return None
+            return list(dict.fromkeys(positions))[:_MAX_COUNT]
+
+        separator = _NAME_LIST_PATTERN if named else _VERSUS_PATTERN
+        parts = [_LEAD_WORDS_PATTERN.sub("", part.strip()) for part in separator.split(text)]
+        if len(parts) > 1:
+            return self._resolve_names(table, parts)
+
+        if analysis.has_price_bounds or analysis.has_spec_bounds:
+            plan = FilterPlan.build(
+                min_price=analysis.min_price,
+                max_price=analysis.max_price,
+                currency=analysis.price_currency,
+                specs=analysis.specs,
+                limit=count
+            )
+            kept = set(unique)
+            return [position for position in plan.evaluate(table).tolist() if position in kept][:_DEFAULT_COUNT]
+
+        return unique[:_DEFAULT_COUNT]
+
+    @staticmethod
+    def _has_name_terms(text: str) -> bool:
+        return any(term not in _COMPARE_WORDS for term in query_terms(text))
+
+    def _resolve_names(self, table: ProductTable, parts: List[str]) -> Optional[List[int]]:
+        positions = []
+        words: List[str] = []
+
+        for part in parts[:_MAX_COUNT]:
+            tokens = part.split()
+            if tokens and all(token.isdigit() for token in tokens):
+                # "iphone 14 and 15": the bare number shares the name before it
+                part = " ".join(words + tokens)
+            else:
+                words = [token for token in tokens if not token.isdigit()]
+
+            result = self._product_search.search(table, part, limit=1, numbers=True)
+            if not len(result.indices) or not result.matched[0]:
+                return None
+            positions.append(int(result.indices[0]))
+
+        return list(dict.fromkeys(positions))
+
+    def compare(self, items: List[Dict], positions: List[int]) -> Dict:
+        """
+        Align the attributes of the selected items.
+
+        Args:
+            items: Products on the page
+            positions: Row indices to compare
+
+        Returns:
+            Dict with the compared items (1-based page position, name and
+            attribute values), the attributes any item has, and the
+            positions of the cheapest, top rated and best value items
+        """
+        selected = [items[position] for position in positions]
+        table = self._product_service.get_table(selected)
+        columns = {attribute: self._column(table, attribute) for attribute in ATTRIBUTES}
+
+        return {
+            "items": [
+                {
+                    "position": position + 1,
+                    "name": str(item.get("name") or ""),
+                    **{attribute: float(columns[attribute][row]) for attribute in ATTRIBUTES}
+                }
+                for row, (position, item) in enumerate(zip(positions, selected))
+            ],
+            "attributes": [attribute for attribute in ATTRIBUTES if columns[attribute].any()],
+            "winners": {
+                "cheapest": self._winner(positions, np.where(table.valid, -table.price, -np.inf)),
+                "top_rated": self._winner(positions, np.where(table.rating > 0, table.rating, -np.inf)),
+                "best_value": self._winner(positions, np.where(table.valid, table.value, -np.inf))
+            }
+        }
+
+    @staticmethod
+    def _column(table: ProductTable, attribute: str) -> np.ndarray:
+        return table.specs[attribute] if attribute in SPEC_FIELDS else getattr(table, attribute)
+
+    @staticmethod
+    def _winner(positions: List[int], key: np.ndarray) -> Optional[int]:
+        if not np.isfinite(key).any():
+            return None
+        return positions[int(np.argmax(key))] + 1
+
+    def render(self, comparison: Dict, items: List[Dict], language: Optional[str] = None) -> str:
+        """
+        Render a comparison as a localized text table.
+
+        Args:
+            comparison: Result of ``compare``
+            items: Products on the page
+            language: Response language
+
+        Returns:
+            Markdown-style answer text
+        """
+        translate = self._language_service.translate
+        rows = comparison["items"]
+
+        lines = [f"**{translate('products.compare_header', language)}**", ""]
+        lines.extend(f"{row['position']}. **{_short_name(items[row['position'] - 1])}**" for row in rows)
+        lines.append("")
+
+        for attribute in comparison["attributes"]:
+            values = " | ".join(
+                _format_value(attribute, items[row["position"] - 1], row[attribute]) for row in rows
+            )
+            lines.append(f"**{translate(f'comparison.{attribute}', language)}**: {values}")
+
+        winners = [
+            translate(f"comparison.{label}", language, name=f"#{position} {_short_name(items[position - 1])}")
+            for label, position in comparison["winners"].items()
+            if position is not None
+        ]
+        if winners:
+            lines.append("")
+            lines.extend(f"✓ {winner}" for winner in winners)
+
+        return "\n".join(lines)
+
+    def answer(
+        self,
+        items: List[Dict],
+        analysis: QueryAnalysis,
+        language: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict]]:
+        """
+        Answer a comparison query from the page snapshot.
+
+        Args:
+            items: Products on the page
+            analysis: Analyzed query
+            language: Response language
+
+        Returns:
+            Tuple of (answer text, comparison or None if nothing was compared)
+        """
+        if len(items) < 2:
+            return self._language_service.translate("comparison.need_two", language), None
+
+        positions = self.resolve(items, analysis)
+        if positions is None:
+            return self._language_service.translate("comparison.not_found", language), None
+        if len(positions) < 2:
+            return self._language_service.translate("comparison.need_two", language), None
+
+        comparison = self.compare(items, positions)
+        return self.render(comparison, items, language), comparison
@@ -0,0 +1,96 @@
+"""
+Prompt context assembly.
+Fills a route's prompt token budget with products, history and page text by priority.
+"""
+
+from typing import List, NamedTuple, Optional
+from app.core.logger import Logger
+from app.utils.tokens import count_tokens, truncate_tokens
+
+
+_HISTORY_MESSAGES = 6
+_HISTORY_MESSAGE_TOKENS = 80
+_PAGE_SUMMARY_TOKENS = 300
+
+
+class AssembledContext(NamedTuple):
+    """Prompt sections chosen for one request and their token cost."""
+
+    products: List[str]
+    history: List[str]
+    page_summary: str
+    prompt_tokens: int
+
+
+class ContextAssembler:
+    """
+    Service packing prompt context into a token budget.
+
+    The query and fixed prompt text are always sent. The remaining budget
+    goes to ranked product entries first, then the most recent history
+    messages, then the page summary, so a small model gets a short prompt
+    without losing the products it must talk about. Implements singleton
+    pattern.
+    """
+
+    _instance: Optional["ContextAssembler"] = None
+
+    def __new__(cls) -> "ContextAssembler":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self._logger = Logger("context_assembler")
+        self._logger.info("Context assembler initialized")
+
+    def assemble(
+        self,
+        budget: int,
+        fixed: str,
+        products: List[str],
+        history: List[str],
+        page_content: str = ""
+    ) -> AssembledContext:
+        """
+        Choose the prompt sections that fit a token budget.
+
+        Args:
+            budget: Prompt token budget of the route
+            fixed: Text sent regardless of budget (template, query, page header)
+            products: Product entries, best first
+            history: Conversation lines, oldest first
+            page_content: Page text
+
+        Returns:
+            AssembledContext with the chosen sections and the prompt size
+        """
+        used = count_tokens(fixed)
+        remaining = budget - used
+
+        chosen_products = []
+        for entry in products:
+            cost = count_tokens(entry)
+            if cost > remaining:
+                break
+            chosen_products.append(entry)
+            remaining -= cost
+
+        chosen_history = []
+        for line in reversed(history[-_HISTORY_MESSAGES:]):
+            line = truncate_tokens(line, _HISTORY_MESSAGE_TOKENS)
+            cost = count_tokens(line)
+            if cost > remaining:
+                break
+            chosen_history.append(line)
+            remaining -= cost
+        chosen_history.reverse()
+
+        page_summary = truncate_tokens(page_content, min(remaining, _PAGE_SUMMARY_TOKENS))
+        remaining -= count_tokens(page_summary)
+
+        if len(chosen_products) < len(products):
+            self._logger.debug(f"Prompt budget {budget} fits {len(chosen_products)}/{len(products)} products")
+
+        return AssembledContext(chosen_products, chosen_history, page_summary, budget - remaining)
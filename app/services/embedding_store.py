@@ -0,0 +1,141 @@
+"""
+Persistent embedding cache.
+Content-hash keyed vectors in SQLite with an in-memory LRU in front.
+"""
+
+import hashlib
+import os
+import sqlite3
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from app.core.logger import Logger
+from app.utils.cache import LRUCache
+
+
+_SQLITE_BATCH = 500
+
+
+class EmbeddingStore:
+    """
+    Embedding cache shared by every session and surviving restarts.
+
+    Vectors are keyed by a hash of the model name and the exact text, so
+    a product seen once on any page is never embedded again. Lookups go
+    memory, then SQLite, and only the remaining texts reach the encoder.
+    """
+
+    def __init__(self, path: Optional[str], namespace: str, maxsize: int = 20000):
+        self._logger = Logger("embedding_store")
+        self._namespace = namespace
+        self._memory: LRUCache[np.ndarray] = LRUCache(maxsize)
+        self._lock = Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+        if path:
+            self._open(path)
+
+    def _open(self, path: str) -> None:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._logger.warning(f"Embedding store unavailable, using memory only: {e}")
+            self._db = None
+
+    def _key(self, text: str) -> str:
+        data = f"{self._namespace}\x1f{text}".encode("utf-8", "replace")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _read(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        if self._db is None:
+            return found
+
+        try:
+            with self._lock:
+                for start in range(0, len(keys), _SQLITE_BATCH):
+                    batch = keys[start:start + _SQLITE_BATCH]
+                    rows = self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+        except sqlite3.Error as e:
+            # A locked or corrupt file is a cache miss; the encoder fills in
+            self._logger.warning(f"Could not read embeddings: {e}")
+            return {}
+        return found
+
+    def _write(self, vectors: Dict[str, np.ndarray]) -> None:
+        if self._db is None or not vectors:
+            return
+
+        try:
+            with self._lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()]
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            self._logger.warning(f"Could not persist embeddings: {e}")
+
+    def encode(self, texts: List[str], encoder: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Embed texts, calling the encoder only for texts never seen before.
+
+        Args:
+            texts: Texts to embed
+            encoder: Function embedding a list of texts into a matrix
+
+        Returns:
+            Float32 matrix with one row per text
+        """
+        keys = [self._key(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            vector = self._memory.get(key)
+            if vector is None:
+                missing.append(key)
+            else:
+                vectors[key] = vector
+
+        stored = self._read(missing) if missing else {}
+        unseen = [key for key in missing if key not in stored]
+
+        fresh: Dict[str, np.ndarray] = {}
+        if unseen:
+            text_by_key = dict(zip(keys, texts))
+            encoded = encoder([text_by_key[key] for key in unseen])
+            fresh = {key: np.asarray(vector, dtype=np.float32) for key, vector in zip(unseen, encoded)}
+            self._write(fresh)
+
+        for key, vector in {**stored, **fresh}.items():
+            self._memory.put(key, vector)
+            vectors[key] = vector
+
+        self.hits += len(keys) - len(unseen)
+        self.misses += len(unseen)
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Lookup counters and in-memory size."""
+        return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
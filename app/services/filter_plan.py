@@ -0,0 +1,213 @@
+"""
+Compiled product filter plans.
+A hashable description of a filter that compiles into a fast evaluator.
+"""
+
+from functools import lru_cache
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple, Union
+import numpy as np
+from app.models.enums import SortOrder
+from app.services.product_table import ProductTable
+from app.utils.keywords import OTHER_CATEGORY
+from app.utils.prices import get_price_parser
+from app.utils.specs import SPEC_FIELDS, SpecBound, screen_tolerance
+
+
+SORTABLE_FIELDS = frozenset(["price", "rating", "discount", "reviews", "value"])
+# Fields where more is better, so an unspecified sort order lists the highest first
+DESCENDING_FIELDS = frozenset(["rating", "discount", "reviews", "value"])
+
+
+class Predicate(NamedTuple):
+    """Single column comparison, e.g. ``price <= 1000`` or ``category in (mobiles, "")``."""
+
+    field: str
+    op: str
+    value: Union[float, str, Tuple[str, ...]]
+
+
+class FilterPlan(NamedTuple):
+    """
+    Hashable filter plan: predicates, a sort key and a limit.
+    Doubles as a cache key for filtered results. Price bounds are in
+    ``currency``, or in the table's own currency when it is None.
+    """
+
+    predicates: Tuple[Predicate, ...] = ()
+    sort_by: Optional[str] = None
+    descending: bool = False
+    limit: int = 10
+    currency: Optional[str] = None
+
+    @classmethod
+    def build(
+        cls,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        contains: Optional[str] = None,
+        category: Optional[str] = None,
+        specs: Iterable[SpecBound] = (),
+        sort_by: Optional[str] = None,
+        descending: Optional[bool] = None,
+        limit: int = 10,
+        currency: Optional[str] = None
+    ) -> "FilterPlan":
+        """
+        Build a plan from structured filter parameters.
+
+        A descending of None sorts price lowest first and the other
+        fields highest first.
+
+        Raises:
+            ValueError: If sort_by is not a sortable column or the
+                currency has no exchange rate
+        """
+        if sort_by is not None and sort_by not in SORTABLE_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort_by}")
+
+        if currency is not None:
+            currency = currency.upper()
+            if currency not in get_price_parser().rates:
+                raise ValueError(f"Unsupported currency: {currency}")
+
+        predicates = []
+
+        if min_price is not None:
+            predicates.append(Predicate("price", "ge", float(min_price)))
+
+        if max_price is not None:
+            predicates.append(Predicate("price", "le", float(max_price)))
+
+        if min_rating is not None:
+            predicates.append(Predicate("rating", "ge", float(min_rating)))
+
+        if contains and contains.strip():
+            predicates.append(Predicate("text", "contains", contains.strip().lower()))
+
+        if category:
+            # Facets list uncategorized rows as "other"; they are stored as ""
+            predicates.append(Predicate("category", "eq", "" if category == OTHER_CATEGORY else category))
+
+        for field, op, value in specs:
+            predicates.append(Predicate(field, op, float(value)))
+
+        if descending is None:
+            descending = sort_by in DESCENDING_FIELDS
+
+        return cls(
+            predicates=tuple(predicates),
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            currency=currency
+        )
+
+    def _bound(self, field: str, op: str) -> Optional[float]:
+        for predicate in self.predicates:
+            if predicate.field == field and predicate.op == op:
+                return predicate.value
+        return None
+
+    @property
+    def min_price(self) -> Optional[float]:
+        return self._bound("price", "ge")
+
+    @property
+    def max_price(self) -> Optional[float]:
+        return self._bound("price", "le")
+
+    @property
+    def category(self) -> Optional[str]:
+        for predicate in self.predicates:
+            if predicate.field == "category":
+                value = predicate.value[0] if predicate.op == "in" else predicate.value
+                return value or OTHER_CATEGORY
+        return None
+
+    @property
+    def specs(self) -> Tuple[Predicate, ...]:
+        return tuple(predicate for predicate in self.predicates if predicate.field in SPEC_FIELDS)
+
+    @property
+    def sort_order(self) -> Optional[SortOrder]:
+        if self.sort_by is None:
+            return None
+        return SortOrder.DESCENDING if self.descending else SortOrder.ASCENDING
+
+    def evaluate(self, table: ProductTable) -> np.ndarray:
+        """Run the compiled plan and return the selected row indices."""
+        return compile_plan(self)(table)
+
+
+def _column(table: ProductTable, field: str) -> np.ndarray:
+    if field in SPEC_FIELDS:
+        return table.specs[field]
+    return getattr(table, field)
+
+
+def _predicate_mask(predicate: Predicate, currency: Optional[str]) -> Callable[[ProductTable], np.ndarray]:
+    field, op, value = predicate
+
+    if field == "price" and currency is not None:
+        # "under $50" on a rupee page is compared in rupees
+        convert = get_price_parser().convert
+        bound = lambda table: convert(value, currency, table.currency)
+    else:
+        bound = lambda table: value
+
+    if op == "ge":
+        return lambda table: _column(table, field) >= bound(table)
+    if op == "le":
+        # Zero means the value could not be parsed, so it never satisfies an upper bound
+        return lambda table: (_column(table, field) > 0) & (_column(table, field) <= bound(table))
+    if op == "eq":
+        return lambda table: _column(table, field) == value
+    if op == "in":
+        return lambda table: np.isin(_column(table, field), value)
+    if op == "near":
+        tolerance = screen_tolerance(value)
+        return lambda table: np.abs(_column(table, field) - value) <= tolerance
+    if op == "contains":
+        return lambda table: np.char.find(_column(table, field), value) >= 0
+
+    raise ValueError(f"Unsupported predicate operator: {op}")
+
+
+def _sort_key(plan: FilterPlan) -> Optional[Callable[[ProductTable], np.ndarray]]:
+    if plan.sort_by == "price":
+        return lambda table: table.price_key(plan.descending)
+    if plan.sort_by is not None:
+        return lambda table: _column(table, plan.sort_by)
+    return None
+
+
+@lru_cache(maxsize=256)
+def compile_plan(plan: FilterPlan) -> Callable[[ProductTable], np.ndarray]:
+    """
+    Compile a plan into an evaluator over a ProductTable.
+
+    Args:
+        plan: Filter plan to compile
+
+    Returns:
+        Function mapping a table to the ordered, limited row indices
+    """
+    masks = [_predicate_mask(predicate, plan.currency) for predicate in plan.predicates]
+    sort_key = _sort_key(plan)
+    limit = plan.limit
+    descending = plan.descending
+
+    def evaluate(table: ProductTable) -> np.ndarray:
+        mask = np.ones(table.size, dtype=bool)
+        for predicate_mask in masks:
+            mask &= predicate_mask(table)
+
+        indices = np.flatnonzero(mask)
+
+        if sort_key is not None:
+            indices = table.top_k(indices, sort_key(table), limit, descending)
+
+        return indices[:limit]
+
+    return evaluate
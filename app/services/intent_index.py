@@ -0,0 +1,178 @@
+"""
+Nearest-neighbour intent index over a file-backed example corpus.
+Provides top-k voting and incremental hot reload.
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.core.logger import Logger
+from app.models.enums import IntentType
+
+
+class IntentIndex:
+    """
+    Vectorized kNN index over labeled intent examples.
+
+    The corpus is a JSON Lines file with one ``{"text": ..., "intent": ...}``
+    object per line. Embeddings are cached by example text, so a reload
+    only encodes lines that were added or changed since the last load.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoder: Callable[[List[str]], Any],
+        top_k: int = 5,
+        reload_interval: float = 5.0
+    ):
+        import numpy as np
+
+        self._np = np
+        self._logger = Logger("intent_index")
+        self._path = path
+        self._encoder = encoder
+        self._top_k = max(1, top_k)
+        self._reload_interval = reload_interval
+
+        self._embedding_cache: Dict[str, Any] = {}
+        self._intents: List[str] = [intent.value for intent in IntentType]
+        # (matrix, labels) swapped as one reference so a concurrent search
+        # never pairs a new matrix with old labels
+        self._examples: Optional[Tuple[Any, Any]] = None
+        self._mtime: Optional[float] = None
+        self._last_check = 0.0
+
+    @property
+    def size(self) -> int:
+        """Number of examples currently indexed."""
+        return 0 if self._examples is None else len(self._examples[1])
+
+    def _read_corpus(self) -> List[Tuple[str, str]]:
+        examples: List[Tuple[str, str]] = []
+        seen = set()
+        valid_intents = set(self._intents)
+
+        with open(self._path, encoding="utf-8") as corpus:
+            for line_no, line in enumerate(corpus, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                try:
+                    record = json.loads(line)
+                    text = str(record["text"]).lower().strip()
+                    intent = str(record["intent"])
+                except (ValueError, KeyError, TypeError):
+                    self._logger.warning(f"Skipping malformed corpus line {line_no}")
+                    continue
+
+                if intent not in valid_intents or not text:
+                    self._logger.warning(f"Skipping unknown intent on line {line_no}: {intent}")
+                    continue
+
+                if (text, intent) not in seen:
+                    seen.add((text, intent))
+                    examples.append((text, intent))
+
+        return examples
+
+    def load(self) -> bool:
+        """
+        (Re)build the index from the corpus file.
+
+        Returns:
+            True if the index holds at least one example
+        """
+        np = self._np
+
+        try:
+            mtime = os.path.getmtime(self._path)
+            examples = self._read_corpus()
+        except OSError as e:
+            self._logger.warning(f"Intent corpus not available: {e}")
+            return self.size > 0
+
+        if not examples:
+            self._logger.warning(f"Intent corpus is empty: {self._path}")
+            return self.size > 0
+
+        texts = sorted({text for text, _ in examples})
+        missing = [text for text in texts if text not in self._embedding_cache]
+
+        if missing:
+            vectors = np.asarray(self._encoder(missing), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8
+            for text, vector in zip(missing, vectors / norms):
+                self._embedding_cache[text] = vector
+
+        self._embedding_cache = {text: self._embedding_cache[text] for text in texts}
+
+        intent_ids = {intent: i for i, intent in enumerate(self._intents)}
+        matrix = np.stack([self._embedding_cache[text] for text, _ in examples])
+        labels = np.array([intent_ids[intent] for _, intent in examples], dtype=np.int32)
+
+        self._examples = (matrix, labels)
+        self._mtime = mtime
+
+        self._logger.info(
+            f"Intent index loaded: {len(examples)} examples, {len(missing)} newly encoded"
+        )
+        return True
+
+    def maybe_reload(self) -> None:
+        """Reload the corpus if the file changed since the last load."""
+        now = time.monotonic()
+        if now - self._last_check < self._reload_interval:
+            return
+        self._last_check = now
+
+        try:
+            mtime = os.path.getmtime(self._path)
+        except OSError:
+            return
+
+        if mtime != self._mtime:
+            self.load()
+
+    def search(self, query_embedding: Any) -> Tuple[str, float, Dict[str, float]]:
+        """
+        Classify an embedded query by similarity-weighted top-k voting.
+
+        Args:
+            query_embedding: Query vector from the same encoder
+
+        Returns:
+            Tuple of (intent_type, confidence, vote_shares)
+        """
+        np = self._np
+        matrix, labels = self._examples
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) + 1e-8)
+        similarities = matrix @ query
+
+        k = min(self._top_k, len(similarities))
+        neighbours = np.argpartition(-similarities, k - 1)[:k]
+        neighbour_sims = similarities[neighbours]
+        neighbour_labels = labels[neighbours]
+
+        votes = np.bincount(
+            neighbour_labels,
+            weights=np.clip(neighbour_sims, 0.0, None),
+            minlength=len(self._intents)
+        )
+        if votes.any():
+            best = int(np.argmax(votes))
+        else:
+            best = int(neighbour_labels[np.argmax(neighbour_sims)])
+        confidence = float(np.max(neighbour_sims[neighbour_labels == best]))
+
+        total = float(votes.sum()) or 1.0
+        scores = {
+            self._intents[i]: float(votes[i]) / total
+            for i in np.flatnonzero(votes)
+        }
+
+        return self._intents[best], confidence, scores
@@ -4,10 +4,23 @@ Provides semantic similarity based intent detection.
 """
 
 import re
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, List, Optional, Union
+import numpy as np
 from app.core.logger import Logger
 from app.core.config import get_settings
 from app.models.enums import IntentType
+from app.services.embedding_store import EmbeddingStore
+from app.services.intent_index import IntentIndex
+from app.services.query_service import QueryAnalysis, ensure_analysis
+from app.utils.keywords import KeywordMatch
+
+
+_GREETINGS = frozenset(["hi", "hii", "hello", "hey", "namaste", "yo"])
+_CLEAR_COMMANDS = frozenset(["clear", "reset", "new chat"])
+_PRICE_BOUND_PATTERN = re.compile(r"(?:under|below|above|over)\s*\d+")
+_COMPARE_LEAD_PATTERN = re.compile(r"^(?:compare|comparison)\b")
+_DIGIT_PATTERN = re.compile(r"\d+")
+_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 
 
 class IntentService:
@@ -27,125 +40,138 @@ class IntentService:
     def _initialize(self) -> None:
         self._logger = Logger("intent_service")
         self._model = None
-        self._intent_embeddings: Dict[str, any] = {}
-        
-        self._intent_examples: Dict[str, List[str]] = {
-            IntentType.GREETING.value: [
-                "hi", "hello", "hey", "namaste", "good morning",
-                "good evening", "howdy", "hola", "kaise ho", "how are you"
-            ],
-            IntentType.FAREWELL.value: [
-                "bye", "goodbye", "see you", "tata", "alvida", "take care"
-            ],
-            IntentType.THANKS.value: [
-                "thank you", "thanks", "thanku", "shukriya", "dhanyawad"
-            ],
-            IntentType.HELP.value: [
-                "help", "commands", "what can you do", "how to use", "guide"
-            ],
-            IntentType.PRODUCT_FILTER.value: [
-                "show products", "best products", "top rated", "cheap",
-                "expensive", "under 1000", "above 500", "filter", "sort",
-                "sasta", "mehnga", "accha", "dikhao", "batao"
-            ],
-            IntentType.PRODUCT_COMPARE.value: [
-                "compare", "vs", "versus", "difference", "which is better"
-            ],
-            IntentType.PRODUCT_INFO.value: [
-                "tell me about", "details", "information", "specs", "features"
-            ],
-            IntentType.PRICE_QUERY.value: [
-                "price", "cost", "kitne ka", "how much", "rate"
-            ],
-            IntentType.SUMMARIZE.value: [
-                "summarize", "summary", "overview", "brief", "explain page"
-            ],
-            IntentType.CLEAR_CHAT.value: [
-                "clear", "reset", "new chat", "start over", "forget"
-            ],
-            IntentType.GENERAL_QUESTION.value: [
-                "what", "why", "how", "when", "where", "who", "explain"
-            ]
-        }
+        self._index: Optional[IntentIndex] = None
+        self._embedding_store: Optional[EmbeddingStore] = None
         
         self._load_model()
     
     def _load_model(self) -> None:
         try:
             from sentence_transformers import SentenceTransformer
-            import numpy as np
             
-            self._model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-            self._np = np
+            settings = get_settings()
+            self._model = SentenceTransformer(_MODEL_NAME)
+            self._embedding_store = EmbeddingStore(
+                path=settings.embedding_cache_path,
+                namespace=_MODEL_NAME,
+                maxsize=settings.embedding_cache_size
+            )
+            self._index = IntentIndex(
+                path=settings.intent_corpus_path,
+                encoder=lambda texts: self._model.encode(texts, batch_size=64),
+                top_k=settings.intent_top_k,
+                reload_interval=settings.intent_corpus_reload_seconds
+            )
             
-            for intent, examples in self._intent_examples.items():
-                self._intent_embeddings[intent] = self._model.encode(examples)
+            if not self._index.load():
+                self._index = None
             
             self._logger.info("Intent classification model loaded successfully")
             
         except Exception as e:
             self._logger.warning(f"ML model not available, using rule-based classification: {e}")
             self._model = None
+            self._index = None
     
-    def classify(self, query: str) -> Tuple[str, float, Dict[str, float]]:
+    @property
+    def model_available(self) -> bool:
+        """Whether the sentence transformer loaded."""
+        return self._model is not None
+    
+    def encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Embed texts with the loaded sentence transformer.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Encoder batch size
+            
+        Returns:
+            Matrix of L2-normalized embeddings, one row per text
+        """
+        if self._model is None:
+            raise RuntimeError("Sentence transformer model is not loaded")
+        
+        vectors = self._model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32)
+    
+    def encode_cached(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Like encode, but served from the shared embedding store where possible.
+        
+        Args:
+            texts: Texts to embed, e.g. product descriptions
+            batch_size: Encoder batch size for unseen texts
+            
+        Returns:
+            Matrix of L2-normalized embeddings, one row per text
+        """
+        if self._embedding_store is None:
+            return self.encode(texts, batch_size=batch_size)
+        
+        return self._embedding_store.encode(texts, lambda missing: self.encode(missing, batch_size=batch_size))
+    
+    @property
+    def embedding_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Embedding store counters, or None without a model."""
+        return self._embedding_store.stats if self._embedding_store else None
+    
+    def classify(self, query: Union[str, QueryAnalysis]) -> Tuple[str, float, Dict[str, float]]:
         """
         Classify user intent from query text.
         
         Args:
-            query: User input text
+            query: User input text or its QueryAnalysis
             
         Returns:
             Tuple of (intent_type, confidence, all_scores)
         """
-        query = query.lower().strip()
+        analysis = ensure_analysis(query)
+        query, keywords = analysis.text, analysis.keywords
         
-        quick_result = self._quick_classify(query)
+        quick_result = self._quick_classify(query, keywords)
         if quick_result:
             return quick_result, 0.95, {}
         
-        if self._model and self._intent_embeddings:
-            return self._ml_classify(query)
+        if analysis.has_spec_bounds:
+            return IntentType.PRODUCT_FILTER.value, 0.9, {}
+        
+        if self._model and self._index:
+            return self._ml_classify(query, keywords)
         
-        return self._rule_based_classify(query), 0.6, {}
+        return self._rule_based_classify(keywords), 0.6, {}
     
-    def _quick_classify(self, query: str) -> Optional[str]:
+    def _quick_classify(self, query: str, keywords: KeywordMatch) -> Optional[str]:
         """Fast rule-based classification for common patterns."""
         
-        greetings = ["hi", "hii", "hello", "hey", "namaste", "yo"]
-        if query in greetings:
+        if query in _GREETINGS:
             return IntentType.GREETING.value
         
-        if query in ["clear", "reset", "new chat"]:
+        if query in _CLEAR_COMMANDS:
             return IntentType.CLEAR_CHAT.value
         
-        if re.search(r"(?:under|below|above|over)\s*\d+", query):
+        # "compare top 3" / "compare phones under 20000" are comparisons, not filters
+        if _COMPARE_LEAD_PATTERN.match(query):
+            return IntentType.PRODUCT_COMPARE.value
+        
+        if _PRICE_BOUND_PATTERN.search(query):
             return IntentType.PRODUCT_FILTER.value
         
-        thanks_patterns = ["thank", "thanks", "thanku", "shukriya"]
-        if any(p in query for p in thanks_patterns):
+        if keywords.has("thanks"):
             return IntentType.THANKS.value
         
         return None
     
-    def _ml_classify(self, query: str) -> Tuple[str, float, Dict[str, float]]:
+    def _ml_classify(self, query: str, keywords: KeywordMatch) -> Tuple[str, float, Dict[str, float]]:
         """ML-based classification using sentence transformers."""
         
         try:
+            self._index.maybe_reload()
             query_embedding = self._model.encode([query])[0]
-            
-            scores: Dict[str, float] = {}
-            for intent, embeddings in self._intent_embeddings.items():
-                similarities = self._np.dot(embeddings, query_embedding) / (
-                    self._np.linalg.norm(embeddings, axis=1) * 
-                    self._np.linalg.norm(query_embedding) + 1e-8
-                )
-                scores[intent] = float(self._np.max(similarities))
-            
-            best_intent = max(scores, key=scores.get)
-            confidence = scores[best_intent]
+            best_intent, confidence, scores = self._index.search(query_embedding)
             
             if confidence < 0.4:
-                if re.search(r"\d+", query):
+                if _DIGIT_PATTERN.search(query):
                     return IntentType.PRODUCT_FILTER.value, 0.6, scores
                 return IntentType.GENERAL_QUESTION.value, confidence, scores
             
@@ -153,24 +179,21 @@ class IntentService:
             
         except Exception as e:
             self._logger.error(f"ML classification failed: {e}")
-            return self._rule_based_classify(query), 0.5, {}
+            return self._rule_based_classify(keywords), 0.5, {}
     
-    def _rule_based_classify(self, query: str) -> str:
+    def _rule_based_classify(self, keywords: KeywordMatch) -> str:
         """Fallback rule-based classification."""
         
-        product_keywords = ["best", "top", "cheap", "sasta", "under", "above", "price", "product", "show"]
-        if any(kw in query for kw in product_keywords):
+        if keywords.has("product"):
             return IntentType.PRODUCT_FILTER.value
         
-        compare_keywords = ["compare", "vs", "better", "difference"]
-        if any(kw in query for kw in compare_keywords):
+        if keywords.has("compare"):
             return IntentType.PRODUCT_COMPARE.value
         
-        if "summarize" in query or "summary" in query:
+        if keywords.has("summarize"):
             return IntentType.SUMMARIZE.value
         
-        help_keywords = ["help", "command", "how to"]
-        if any(kw in query for kw in help_keywords):
+        if keywords.has("help"):
             return IntentType.HELP.value
         
-        return IntentType.GENERAL_QUESTION.value
\ No newline at end of file
+        return IntentType.GENERAL_QUESTION.value
@@ -42,6 +42,10 @@ class LanguageService:
             "de": [r"\b(hallo|danke|wie|zeigen|produkte|preis)\b"],
             "pt": [r"\b(ola|obrigado|como|mostrar|produtos|preco)\b"]
         }
+        self._compiled_patterns = {
+            lang_code: [re.compile(p, re.IGNORECASE | re.UNICODE) for p in patterns]
+            for lang_code, patterns in self._language_patterns.items()
+        }
         
         self._logger.info("Language service initialized")
     
@@ -60,9 +64,9 @@ class LanguageService:
         
         text_lower = text.lower()
         
-        for lang_code, patterns in self._language_patterns.items():
+        for lang_code, patterns in self._compiled_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, text_lower, re.IGNORECASE | re.UNICODE):
+                if pattern.search(text_lower):
                     self._logger.debug(f"Detected language: {lang_code}")
                     return lang_code
         
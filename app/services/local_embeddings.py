@@ -0,0 +1,45 @@
+"""
+Local embedding backend for RAG.
+LangChain Embeddings over the intent service's sentence transformer.
+"""
+
+from typing import List, Optional
+from langchain_core.embeddings import Embeddings
+from app.services.intent_service import IntentService
+
+
+class LocalEmbeddings(Embeddings):
+    """
+    Embeds text in-process with the already loaded MiniLM model.
+    Documents are encoded in batches through the shared embedding store,
+    so only texts never seen before reach the model.
+    """
+
+    def __init__(self, intent_service: Optional[IntentService] = None, batch_size: int = 64):
+        self._intent_service = intent_service or IntentService()
+        self._batch_size = max(1, batch_size)
+
+    @property
+    def available(self) -> bool:
+        """Whether the underlying model is loaded."""
+        return self._intent_service.model_available
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed documents in batches.
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            One normalized vector per text
+        """
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self._batch_size):
+            batch = texts[start:start + self._batch_size]
+            vectors.extend(self._intent_service.encode_cached(batch, batch_size=self._batch_size).tolist())
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self._intent_service.encode([text])[0].tolist()
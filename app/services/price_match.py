@@ -0,0 +1,155 @@
+"""
+Cross-site price matching service.
+Remembers recently seen products per site and finds the same product elsewhere.
+"""
+
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from app.core.config import get_settings
+from app.core.logger import Logger
+from app.services.product_table import parse_price
+from app.utils.minhash import LSHIndex, minhasher, normalize_name
+
+
+_NUMBER_PATTERN = re.compile(r"\d+")
+
+
+class Offer(NamedTuple):
+    """A product as last seen on one site."""
+
+    site: str
+    name: str
+    price: str
+    price_value: float
+    model: FrozenSet[str]
+
+
+class PriceMatchService:
+    """
+    Service matching products across sites with MinHash LSH.
+    Keeps a bounded, least-recently-seen index of offers.
+    Implements singleton pattern.
+    """
+
+    _instance: Optional["PriceMatchService"] = None
+
+    def __new__(cls) -> "PriceMatchService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        settings = get_settings()
+        self._logger = Logger("price_match")
+        self._threshold = settings.price_match_threshold
+        self._capacity = max(1, settings.price_match_capacity)
+        self._index = LSHIndex(minhasher.num_perm)
+        self._offers: "OrderedDict[Tuple[str, str, FrozenSet[str]], Offer]" = OrderedDict()
+        self._lock = Lock()
+        self._logger.info("Price match service initialized")
+
+    def observe(self, site: Optional[str], products: List[Dict]) -> None:
+        """
+        Record the priced products seen on a site.
+
+        Args:
+            site: Site name, e.g. "Amazon"
+            products: Scraped products
+        """
+        if not site or not products:
+            return
+
+        site = site.strip()
+        entries = []
+        for item in products:
+            price_value = parse_price(item.get("price"))
+            text, model = normalize_name(str(item.get("name") or ""))
+            if price_value > 0 and text:
+                entries.append(((site.lower(), text, model), item, price_value))
+
+        if not entries:
+            return
+
+        signatures = minhasher.signatures([key[1] for key, _, _ in entries])
+
+        with self._lock:
+            for (key, item, price_value), signature in zip(entries, signatures):
+                if key not in self._offers:
+                    self._index.add(key, signature)
+                self._offers[key] = Offer(site, str(item.get("name")), str(item.get("price")), price_value, key[2])
+                self._offers.move_to_end(key)
+
+            while len(self._offers) > self._capacity:
+                evicted, _ = self._offers.popitem(last=False)
+                self._index.remove(evicted)
+
+    def match(self, site: str, products: List[Dict]) -> List[Dict]:
+        """
+        Find offers for the given products on other sites.
+
+        Args:
+            site: Site the products come from
+            products: Products to match
+
+        Returns:
+            One entry per product with offers elsewhere, with offers
+            sorted by price and the saving against the cheapest one
+        """
+        site_key = (site or "").strip().lower()
+        names = [normalize_name(str(item.get("name") or "")) for item in products]
+        signatures = minhasher.signatures([text for text, _ in names])
+        results = []
+
+        with self._lock:
+            for item, (text, model), signature in zip(products, names, signatures):
+                if not text:
+                    continue
+
+                offers = []
+                for key, similarity in self._index.query(signature, self._threshold):
+                    offer = self._offers[key]
+                    if key[0] == site_key or not self._same_model(model, offer.model):
+                        continue
+                    offers.append((offer, similarity))
+
+                if offers:
+                    results.append(self._summarize(item, offers))
+
+        return results
+
+    @staticmethod
+    def _same_model(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+        # Sites format specs differently ("42H" vs "42 Hours"), so compare the
+        # numbers inside model tokens and let one side list fewer of them
+        numbers_a = {number for token in a for number in _NUMBER_PATTERN.findall(token)}
+        numbers_b = {number for token in b for number in _NUMBER_PATTERN.findall(token)}
+        words_a = {token for token in a if not _NUMBER_PATTERN.search(token)}
+        words_b = {token for token in b if not _NUMBER_PATTERN.search(token)}
+
+        return words_a == words_b and (numbers_a <= numbers_b or numbers_b <= numbers_a)
+
+    @staticmethod
+    def _summarize(item: Dict, offers: List[Tuple[Offer, float]]) -> Dict:
+        offers.sort(key=lambda pair: pair[0].price_value)
+        best = offers[0][0]
+        price_value = parse_price(item.get("price"))
+
+        return {
+            "product": item,
+            "price_value": price_value,
+            "offers": [
+                {
+                    "site": offer.site,
+                    "name": offer.name,
+                    "price": offer.price,
+                    "price_value": offer.price_value,
+                    "similarity": round(similarity, 3)
+                }
+                for offer, similarity in offers
+            ],
+            "best_site": best.site,
+            "savings": max(0.0, price_value - best.price_value) if price_value > 0 else 0.0
+        }
@@ -0,0 +1,143 @@
+"""
+Product category classifier.
+Assigns categories by nearest centroid of labeled example embeddings.
+"""
+
+import hashlib
+import json
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from app.core.config import get_settings
+from app.core.logger import Logger
+from app.services.intent_service import IntentService
+from app.utils.cache import LRUCache
+from app.utils.keywords import CATEGORIES, CATEGORY_PREFIX, KEYWORD_TABLES, keyword_matcher
+
+
+class ProductCategorizer:
+    """
+    Service classifying product names into categories.
+
+    Each category is represented by the normalized mean embedding of its
+    examples, so a whole snapshot is classified with one matrix product.
+    Names too far from every centroid, or every name when the embedding
+    model is unavailable, fall back to keyword matching. Results are
+    cached per product name hash. Implements singleton pattern.
+    """
+
+    _instance: Optional["ProductCategorizer"] = None
+
+    def __new__(cls) -> "ProductCategorizer":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        settings = get_settings()
+        self._logger = Logger("product_categorizer")
+        self._intent_service = IntentService()
+        self._corpus_path = settings.category_corpus_path
+        self._min_similarity = settings.category_min_similarity
+        self._cache: LRUCache[str] = LRUCache(settings.category_cache_size)
+        self._labels: List[str] = []
+        self._centroids: Optional[np.ndarray] = None
+        self._lock = Lock()
+        self._logger.info("Product categorizer initialized")
+
+    def _read_examples(self) -> List[Tuple[str, str]]:
+        valid = set(CATEGORIES)
+
+        try:
+            examples = []
+            with open(self._corpus_path, encoding="utf-8") as corpus:
+                for line in corpus:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    record = json.loads(line)
+                    text, category = str(record["text"]).lower().strip(), str(record["category"])
+                    if text and category in valid:
+                        examples.append((text, category))
+            return examples
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._logger.warning(f"Category corpus unavailable, seeding from keywords: {e}")
+            return [
+                (keyword, category)
+                for category in CATEGORIES
+                for keyword in KEYWORD_TABLES[CATEGORY_PREFIX + category]
+            ]
+
+    def _get_centroids(self) -> Optional[np.ndarray]:
+        if self._centroids is not None or not self._intent_service.model_available:
+            return self._centroids
+
+        with self._lock:
+            if self._centroids is None:
+                examples = self._read_examples()
+                labels = sorted({category for _, category in examples})
+                vectors = self._intent_service.encode_cached([text for text, _ in examples])
+                assignments = np.array([labels.index(category) for _, category in examples])
+
+                centroids = np.stack([vectors[assignments == i].mean(axis=0) for i in range(len(labels))])
+                centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+
+                self._labels = labels
+                self._centroids = centroids.astype(np.float32)
+                self._logger.info(f"Category centroids built from {len(examples)} examples")
+
+        return self._centroids
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return hashlib.blake2b(name.encode("utf-8", "replace"), digest_size=12).hexdigest()
+
+    def _embedding_categories(self, names: List[str]) -> Optional[List[str]]:
+        """Nearest-centroid category per name; None when the embedding call failed."""
+        try:
+            centroids = self._get_centroids()
+            if centroids is None:
+                return [""] * len(names)
+            similarities = self._intent_service.encode_cached(names) @ centroids.T
+        except Exception as e:
+            self._logger.error(f"Category embedding failed: {e}")
+            return None
+
+        best = similarities.argmax(axis=1)
+        confident = similarities[np.arange(len(names)), best] >= self._min_similarity
+        return [self._labels[i] if ok else "" for i, ok in zip(best, confident)]
+
+    def classify(self, names: List[str]) -> List[str]:
+        """
+        Categorize product names in one batch.
+
+        Args:
+            names: Product names
+
+        Returns:
+            Category per name, empty string when none fits
+        """
+        names = [str(name or "").lower().strip() for name in names]
+        keys = [self._key(name) for name in names]
+        found: Dict[str, str] = {}
+        missing: Dict[str, str] = {}
+
+        for key, name in zip(keys, names):
+            category = self._cache.get(key) if name else ""
+            if category is None:
+                missing[key] = name
+            else:
+                found[key] = category
+
+        if missing:
+            texts = list(missing.values())
+            embedded = self._embedding_categories(texts)
+            for key, text, category in zip(missing, texts, embedded or [""] * len(texts)):
+                category = category or keyword_matcher.match(text).category or ""
+                # A transient encoder failure must not pin the keyword guess
+                if embedded is not None:
+                    self._cache.put(key, category)
+                found[key] = category
+
+        return [found[key] for key in keys]
@@ -0,0 +1,150 @@
+"""
+Facet computation over product tables.
+Price histograms, percentiles, rating, discount and category counts.
+"""
+
+import math
+from typing import Dict, List
+import numpy as np
+from app.services.product_table import ProductTable
+from app.utils.keywords import OTHER_CATEGORY
+from app.utils.prices import currency_symbol
+
+
+PRICE_PERCENTILES = (10, 25, 50, 75, 90)
+MAX_PRICE_BUCKETS = 12
+DISCOUNT_BANDS = (
+    ("Up to 10%", 0.0, 10.0),
+    ("10-25%", 10.0, 25.0),
+    ("25-50%", 25.0, 50.0),
+    ("50%+", 50.0, 100.0)
+)
+
+
+def _nice_step(raw: float) -> float:
+    """Round a bucket width up to 1, 2 or 5 times a power of ten."""
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def _price_label(low: float, high: float, step: float, symbol: str) -> str:
+    if step >= 1:
+        return f"{symbol}{low:,.0f} - {symbol}{high:,.0f}"
+    return f"{symbol}{low:,.2f} - {symbol}{high:,.2f}"
+
+
+def price_histogram(prices: np.ndarray, currency: str = "INR") -> List[Dict]:
+    """
+    Bucket prices into an adaptive histogram with round edges.
+
+    The bucket count comes from NumPy's "auto" estimator (capped at
+    MAX_PRICE_BUCKETS), then the width is rounded so edges read well.
+
+    Args:
+        prices: Valid (positive) prices
+        currency: Currency the prices are in, for the labels
+
+    Returns:
+        List of buckets with label, count, min and max
+    """
+    if prices.size == 0:
+        return []
+
+    symbol = currency_symbol(currency)
+    low, high = float(prices.min()), float(prices.max())
+    if low == high:
+        return [{"label": _price_label(low, high, 1, symbol), "count": int(prices.size), "min": low, "max": high}]
+
+    bins = len(np.histogram_bin_edges(prices, bins="auto")) - 1
+    step = _nice_step((high - low) / min(max(bins, 1), MAX_PRICE_BUCKETS))
+    start = math.floor(low / step) * step
+    count = max(1, math.ceil((high - start) / step))
+    if start + count * step < high:
+        count += 1
+
+    edges = start + step * np.arange(count + 1)
+    counts, _ = np.histogram(prices, bins=edges)
+
+    return [
+        {
+            "label": _price_label(edges[i], edges[i + 1], step, symbol),
+            "count": int(counts[i]),
+            "min": float(edges[i]),
+            "max": float(edges[i + 1])
+        }
+        for i in range(count)
+    ]
+
+
+def rating_distribution(ratings: np.ndarray) -> Dict[str, int]:
+    """Count items per whole star (4.6 counts as 4), plus unrated items."""
+    rated = ratings > 0
+    stars = np.clip(np.floor(ratings[rated]), 1, 5).astype(np.int64)
+    counts = np.bincount(stars, minlength=6)
+
+    distribution = {str(star): int(counts[star]) for star in range(5, 0, -1)}
+    distribution["unrated"] = int(ratings.size - rated.sum())
+    return distribution
+
+
+def discount_bands(discounts: np.ndarray) -> List[Dict]:
+    """Count items per discount band, plus items without a discount."""
+    discounted = discounts[discounts > 0]
+    upper = np.array([band[2] for band in DISCOUNT_BANDS[:-1]])
+    counts = np.bincount(np.searchsorted(upper, discounted, side="right"), minlength=len(DISCOUNT_BANDS))
+
+    bands = [{"label": "No discount", "count": int(discounts.size - discounted.size), "min": 0.0, "max": 0.0}]
+    bands.extend(
+        {"label": label, "count": int(counts[i]), "min": low, "max": high}
+        for i, (label, low, high) in enumerate(DISCOUNT_BANDS)
+    )
+    return bands
+
+
+def category_counts(categories: np.ndarray) -> Dict[str, int]:
+    """Count items per category, most common first; unmatched items are "other"."""
+    if categories.size == 0:
+        return {}
+
+    names, counts = np.unique(categories, return_counts=True)
+    ordered = sorted(zip(names.tolist(), counts.tolist()), key=lambda pair: (-pair[1], pair[0]))
+    return {name or OTHER_CATEGORY: int(count) for name, count in ordered}
+
+
+def compute_facets(table: ProductTable) -> Dict:
+    """
+    Compute statistics and facet counts from the table's parsed columns.
+
+    Args:
+        table: Parsed product table
+
+    Returns:
+        Dict with price stats, percentiles and histogram, rating
+        distribution, discount bands and category counts
+    """
+    prices = table.price[table.valid]
+    ratings = table.rating[table.rating > 0]
+    has_prices = prices.size > 0
+
+    percentiles = (
+        np.percentile(prices, PRICE_PERCENTILES) if has_prices else np.zeros(len(PRICE_PERCENTILES))
+    )
+
+    return {
+        "total": table.size,
+        "currency": table.currency,
+        "price_min": float(prices.min()) if has_prices else 0,
+        "price_max": float(prices.max()) if has_prices else 0,
+        "price_avg": float(prices.mean()) if has_prices else 0,
+        "rating_avg": float(ratings.mean()) if ratings.size else 0,
+        "price_percentiles": {
+            f"p{p}": float(value) for p, value in zip(PRICE_PERCENTILES, percentiles)
+        } if has_prices else {},
+        "price_histogram": price_histogram(prices, table.currency),
+        "rating_distribution": rating_distribution(table.rating),
+        "discount_bands": discount_bands(table.discount),
+        "categories": category_counts(table.category)
+    }
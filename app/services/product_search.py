@@ -0,0 +1,192 @@
+"""
+Hybrid product search service.
+Ranks a page snapshot by BM25 over name/extra blended with embedding similarity.
+"""
+
+from functools import cached_property
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from app.core.config import get_settings
+from app.core.logger import Logger
+from app.services.intent_service import IntentService
+from app.services.product_service import ProductService
+from app.services.product_table import ProductTable
+from app.utils.bm25 import BM25Index, tokenize
+from app.utils.cache import LRUCache
+
+
+_QUERY_STOPWORDS = frozenset([
+    "a", "an", "the", "and", "or", "with", "for", "of", "in", "on", "to", "me", "my",
+    "i", "is", "are", "it", "this", "that", "any", "some", "which", "what", "show",
+    "find", "give", "want", "need", "please", "product", "item", "under", "below",
+    "above", "over", "between", "rs", "inr", "price", "mujhe", "dikhao", "batao",
+    "chahiye", "wala", "wali", "ka", "ki", "ke", "se", "hai", "kya"
+])
+_MIN_SEMANTIC_SCORE = 0.3
+
+
+def query_terms(text: str, numbers: bool = False) -> List[str]:
+    """
+    Content tokens of a query: no stopwords and, unless ``numbers`` is set,
+    no bare numbers like price bounds. Model names ("iphone 15") need them.
+    """
+    return [
+        token for token in tokenize(text)
+        if token not in _QUERY_STOPWORDS and (numbers or not token.isdigit())
+    ]
+
+
+class SearchResult(NamedTuple):
+    """Ranked row indices with their relevance scores and which of them match the query."""
+
+    indices: np.ndarray
+    scores: np.ndarray
+    mode: str
+    matched: np.ndarray
+
+
+class ProductSearchIndex:
+    """
+    Lexical and vector indexes over one product snapshot.
+    Each is built on first use from the name and extra text.
+    """
+
+    def __init__(self, table: ProductTable, encoder: Callable[[List[str]], np.ndarray]):
+        self.key = table.key
+        self._table = table
+        self._encoder = encoder
+
+    @cached_property
+    def lexical(self) -> BM25Index:
+        """BM25 index over row text."""
+        return BM25Index(tokenize(text) for text in self._table.text.tolist())
+
+    @cached_property
+    def embeddings(self) -> np.ndarray:
+        """L2-normalized row embeddings."""
+        if not self._table.size:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._encoder(self._table.text.tolist())
+
+    def lexical_scores(self, terms: List[str]) -> np.ndarray:
+        """BM25 scores scaled to [0, 1] by the best match."""
+        scores = self.lexical.score(terms)
+        best = scores.max() if scores.size else 0.0
+        return scores / best if best > 0 else scores
+
+    def vector_scores(self, query_embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity per row, clipped to [0, 1]."""
+        if not self._table.size:
+            return np.zeros(0)
+        return np.clip(self.embeddings @ query_embedding, 0.0, 1.0)
+
+
+class ProductSearchService:
+    """
+    Service for relevance search over product snapshots.
+    Blends BM25 with the intent model's embeddings; without the model,
+    ranks by BM25 alone. Implements singleton pattern.
+    """
+
+    _instance: Optional["ProductSearchService"] = None
+
+    def __new__(cls) -> "ProductSearchService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        settings = get_settings()
+        self._logger = Logger("product_search")
+        self._intent_service = IntentService()
+        self._vector_weight = min(max(settings.search_vector_weight, 0.0), 1.0)
+        self._indexes: LRUCache[ProductSearchIndex] = LRUCache(settings.product_search_cache_size)
+        self._logger.info("Product search service initialized")
+
+    @property
+    def semantic(self) -> bool:
+        """Whether an embedding model is available."""
+        return self._intent_service.model_available
+
+    def get_index(self, table: ProductTable) -> ProductSearchIndex:
+        """Return the search index for a snapshot, creating it on first use."""
+        index = self._indexes.get(table.key)
+
+        if index is None:
+            index = ProductSearchIndex(table, self._intent_service.encode_cached)
+            self._indexes.put(table.key, index)
+
+        return index
+
+    def score(self, table: ProductTable, query: str, numbers: bool = False) -> Tuple[np.ndarray, str, np.ndarray]:
+        """
+        Relevance of every row to a query.
+
+        Args:
+            table: Parsed product snapshot
+            query: Search text
+            numbers: Match bare numbers in the query as terms
+
+        Returns:
+            Tuple of (scores, mode, matched). ``matched`` marks rows that
+            share a term with the query or are semantically close to it;
+            cosine similarity is positive for almost any row, so a score
+            alone does not mean a match.
+        """
+        index = self.get_index(table)
+        lexical = index.lexical_scores(query_terms(query, numbers))
+        matched = lexical > 0
+
+        if self.semantic and table.size:
+            try:
+                query_embedding = self._intent_service.encode([query])[0]
+                vector = index.vector_scores(query_embedding)
+                matched = matched | (vector >= _MIN_SEMANTIC_SCORE)
+                weight = self._vector_weight
+                return weight * vector + (1 - weight) * lexical, "hybrid", matched
+            except Exception as e:
+                self._logger.error(f"Vector scoring failed: {e}")
+
+        return lexical, "keyword", matched
+
+    def search(self, table: ProductTable, query: str, limit: int = 10, numbers: bool = False) -> SearchResult:
+        """
+        Rank snapshot rows by relevance to a free-text query.
+
+        Args:
+            table: Parsed product snapshot
+            query: Search text
+            limit: Maximum number of rows
+            numbers: Match bare numbers in the query as terms
+
+        Returns:
+            SearchResult with row indices, scores, the mode used and a
+            match flag per row
+        """
+        scores, mode, matched = self.score(table, query, numbers)
+
+        # Without embeddings, rows sharing no term with the query are not results
+        candidates = np.flatnonzero(scores > 0) if mode == "keyword" else np.arange(table.size)
+        indices = table.top_k(candidates, scores, limit, descending=True)
+        return SearchResult(indices, scores[indices], mode, matched[indices])
+
+    def rank_items(self, items: List[Dict], query: str, limit: int = 10) -> Optional[List[Dict]]:
+        """
+        Most relevant items for a query, best first.
+
+        Args:
+            items: Products to rank
+            query: Normalized query text
+            limit: Maximum number of items
+
+        Returns:
+            Ranked items, or None when the query matches nothing
+        """
+        table = ProductService().get_table(items)
+        scores, _, matched = self.score(table, query)
+
+        if not matched.any():
+            return None
+
+        return table.rows(table.top_k(np.arange(table.size), scores, limit, descending=True))
@@ -3,10 +3,21 @@ Product filtering and analysis service.
 Provides smart filtering, sorting, and product comparison.
 """
 
-import re
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
+import numpy as np
+from app.core.config import get_settings
 from app.core.logger import Logger
 from app.models.enums import SortOrder
+from app.services.filter_plan import FilterPlan, Predicate
+from app.services.product_categorizer import ProductCategorizer
+from app.services.product_facets import compute_facets
+from app.services.product_table import (
+    ProductTable, parse_price, parse_rating, snapshot_key
+)
+from app.services.query_service import QueryAnalysis, ensure_analysis
+from app.utils.cache import LRUCache
+from app.utils.prices import get_price_parser
+from app.utils.specs import SpecBound, describe_spec
 
 
 class ProductFilter:
@@ -15,9 +26,34 @@ class ProductFilter:
     def __init__(self):
         self.min_price: Optional[float] = None
         self.max_price: Optional[float] = None
+        self.currency: Optional[str] = None
+        self.category: Optional[str] = None
+        self.specs: List[SpecBound] = []
         self.sort_by: Optional[str] = None
         self.sort_order: Optional[SortOrder] = None
         self.limit: int = 10
+    
+    def to_plan(self) -> FilterPlan:
+        """
+        Convert to a hashable, compilable FilterPlan.
+        
+        The category keeps uncategorized rows too: "phones" must drop a
+        mixer grinder, but not a phone no category was found for.
+        """
+        plan = FilterPlan.build(
+            min_price=self.min_price,
+            max_price=self.max_price,
+            currency=self.currency,
+            specs=self.specs,
+            sort_by=self.sort_by,
+            descending=None if self.sort_order is None else self.sort_order == SortOrder.DESCENDING,
+            limit=self.limit
+        )
+        
+        if self.category:
+            plan = plan._replace(predicates=plan.predicates + (Predicate("category", "in", (self.category, "")),))
+        
+        return plan
 
 
 class ProductService:
@@ -36,146 +72,152 @@ class ProductService:
     
     def _initialize(self) -> None:
         self._logger = Logger("product_service")
+        self._settings = get_settings()
+        self._tables: LRUCache[ProductTable] = LRUCache(self._settings.product_table_cache_size)
+        self._plans: LRUCache[FilterPlan] = LRUCache(self._settings.filter_plan_cache_size)
+        self._results: LRUCache[np.ndarray] = LRUCache(self._settings.filter_result_cache_size)
         self._logger.info("Product service initialized")
     
     def extract_price(self, price_str: str) -> float:
         """Extract numeric price from string."""
-        if not price_str or price_str in ["N/A", "", None]:
-            return 0.0
-        
-        cleaned = re.sub(r"[^\d.]", "", str(price_str).replace(",", ""))
-        
-        try:
-            return float(cleaned) if cleaned else 0.0
-        except ValueError:
-            return 0.0
+        return parse_price(price_str)
     
     def extract_rating(self, rating_str: str) -> float:
         """Extract numeric rating from string."""
-        if not rating_str or rating_str in ["N/A", "", None]:
-            return 0.0
-        
-        match = re.search(r"(\d+\.?\d*)", str(rating_str))
-        
-        try:
-            return float(match.group(1)) if match else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        return parse_rating(rating_str)
     
-    def parse_filters(self, query: str) -> ProductFilter:
-        """Parse filter parameters from user query."""
-        query_lower = query.lower()
-        filters = ProductFilter()
+    def get_table(self, products: List[Dict]) -> ProductTable:
+        """
+        Get the parsed columnar table for a product list.
         
-        under_match = re.search(
-            r"(?:under|below|niche|less than|max|upto)\s*(?:rs\.?|inr)?\s*(\d+)",
-            query_lower
-        )
-        if under_match:
-            filters.max_price = float(under_match.group(1))
+        Tables are cached by snapshot content, so repeated requests over
+        the same page never re-parse prices or ratings.
+        """
+        key = snapshot_key(products)
+        table = self._tables.get(key)
         
-        above_match = re.search(
-            r"(?:above|over|upar|more than|min|atleast)\s*(?:rs\.?|inr)?\s*(\d+)",
-            query_lower
-        )
-        if above_match:
-            filters.min_price = float(above_match.group(1))
+        if table is None:
+            table = ProductTable(products, key=key, categorize=ProductCategorizer().classify)
+            self._tables.put(key, table)
         
-        between_match = re.search(
-            r"(\d+)\s*(?:to|se|-|and)\s*(\d+)",
-            query_lower
-        )
-        if between_match and not under_match and not above_match:
-            p1, p2 = float(between_match.group(1)), float(between_match.group(2))
-            filters.min_price = min(p1, p2)
-            filters.max_price = max(p1, p2)
-        
-        cheap_keywords = ["cheap", "sasta", "lowest price", "budget", "kam price"]
-        if any(kw in query_lower for kw in cheap_keywords):
-            filters.sort_by = "price"
-            filters.sort_order = SortOrder.ASCENDING
-        
-        expensive_keywords = ["expensive", "mehnga", "costly", "premium", "highest price"]
-        if any(kw in query_lower for kw in expensive_keywords):
-            filters.sort_by = "price"
-            filters.sort_order = SortOrder.DESCENDING
-        
-        best_keywords = ["best", "top", "highest rated", "accha", "popular"]
-        if any(kw in query_lower for kw in best_keywords):
-            filters.sort_by = "rating"
-            filters.sort_order = SortOrder.DESCENDING
-        
-        limit_match = re.search(r"(?:top|first|show)\s*(\d+)", query_lower)
-        if limit_match:
-            filters.limit = min(int(limit_match.group(1)), 20)
-        
-        return filters
+        return table
     
-    def apply_filters(self, products: List[Dict], filters: ProductFilter) -> List[Dict]:
-        """Apply filters to product list."""
+    def get_snapshot(self, snapshot_id: str) -> Optional[ProductTable]:
+        """Look up a cached product table by its snapshot id."""
+        return self._tables.get(snapshot_id)
+    
+    def collapse_duplicates(self, products: List[Dict]) -> List[Dict]:
+        """
+        Drop near-duplicate listings such as sponsored repeats and colour variants.
+        
+        Args:
+            products: Scraped products in page order
+            
+        Returns:
+            First listing of each near-duplicate group, in page order
+        """
         if not products:
             return []
         
-        filtered = products.copy()
+        table = self.get_table(products)
+        unique = self.unique_rows(table)
+        
+        return products if len(unique) == table.size else table.rows(unique)
+    
+    def unique_rows(self, table: ProductTable) -> np.ndarray:
+        """Row indices of the first listing in each near-duplicate group, in page order."""
+        return table.unique_rows(self._settings.duplicate_name_threshold)
+    
+    def parse_filters(self, query: Union[str, QueryAnalysis]) -> ProductFilter:
+        """Parse filter parameters from user query or its analysis."""
+        analysis = ensure_analysis(query)
+        filters = ProductFilter()
+        
+        filters.min_price = analysis.min_price
+        filters.max_price = analysis.max_price
+        filters.currency = analysis.price_currency
+        filters.category = analysis.category
+        filters.specs = list(analysis.specs)
+        filters.sort_by = analysis.sort_by
+        filters.sort_order = analysis.sort_order
         
-        if filters.min_price is not None:
-            filtered = [
-                p for p in filtered
-                if self.extract_price(p.get("price", "0")) >= filters.min_price
-            ]
+        if analysis.limit is not None:
+            filters.limit = min(analysis.limit, 20)
         
-        if filters.max_price is not None:
-            filtered = [
-                p for p in filtered
-                if 0 < self.extract_price(p.get("price", "0")) <= filters.max_price
-            ]
+        return filters
+    
+    def plan_filters(self, query: Union[str, QueryAnalysis]) -> FilterPlan:
+        """
+        Get the filter plan for a query, cached by normalized query text.
         
-        if filters.sort_by == "price":
-            reverse = filters.sort_order == SortOrder.DESCENDING
-            default_val = 0 if reverse else 999999
-            filtered = sorted(
-                filtered,
-                key=lambda x: self.extract_price(x.get("price", "0")) or default_val,
-                reverse=reverse
-            )
-        elif filters.sort_by == "rating":
-            filtered = sorted(
-                filtered,
-                key=lambda x: self.extract_rating(x.get("rating", "0")),
-                reverse=True
-            )
+        Repeated queries reuse the cached plan and skip parsing entirely.
+        """
+        raw = query.raw if isinstance(query, QueryAnalysis) else query
+        key = " ".join(raw.lower().split())
+        plan = self._plans.get(key)
         
-        return filtered[:filters.limit]
+        if plan is None:
+            plan = self.parse_filters(query).to_plan()
+            self._plans.put(key, plan)
+        
+        return plan
     
-    def analyze_products(self, products: List[Dict]) -> Dict:
-        """Analyze product list for statistics."""
+    def apply_filters(
+        self,
+        products: List[Dict],
+        filters: Union[ProductFilter, FilterPlan]
+    ) -> List[Dict]:
+        """Apply filters to product list."""
         if not products:
-            return {"total": 0}
+            return []
         
-        prices = [self.extract_price(p.get("price", "0")) for p in products]
-        prices = [p for p in prices if p > 0]
+        plan = filters if isinstance(filters, FilterPlan) else filters.to_plan()
+        return self.select(self.get_table(products), plan)
+    
+    def select(self, table: ProductTable, plan: FilterPlan) -> List[Dict]:
+        """Evaluate a plan over a table, caching the selected rows."""
+        return table.rows(self.select_rows(table, plan))
+    
+    def select_rows(self, table: ProductTable, plan: FilterPlan) -> np.ndarray:
+        """Row indices a plan selects from a table, cached per snapshot and plan."""
+        result_key = (table.key, plan)
+        indices = self._results.get(result_key)
         
-        ratings = [self.extract_rating(p.get("rating", "0")) for p in products]
-        ratings = [r for r in ratings if r > 0]
+        if indices is None:
+            indices = plan.evaluate(table)
+            self._results.put(result_key, indices)
         
-        return {
-            "total": len(products),
-            "price_min": min(prices) if prices else 0,
-            "price_max": max(prices) if prices else 0,
-            "price_avg": sum(prices) / len(prices) if prices else 0,
-            "rating_avg": sum(ratings) / len(ratings) if ratings else 0
-        }
+        return indices
     
-    def format_filter_description(self, filters: ProductFilter) -> str:
-        """Generate human-readable filter description."""
+    def analyze_products(self, products: List[Dict]) -> Dict:
+        """Analyze product list for statistics and facet counts."""
+        return self.facets(self.get_table(products))
+    
+    def facets(self, table: ProductTable) -> Dict:
+        """Statistics and facet counts for a parsed table."""
+        return compute_facets(table)
+    
+    def format_filter_description(
+        self,
+        filters: Union[ProductFilter, FilterPlan],
+        currency: Optional[str] = None
+    ) -> str:
+        """Generate human-readable filter description, with bounds in their own or the page currency."""
         parts = []
+        parser = get_price_parser()
+        currency = filters.currency or currency
         
         if filters.min_price and filters.max_price:
-            parts.append(f"Rs.{int(filters.min_price)} - Rs.{int(filters.max_price)}")
+            parts.append(f"{parser.format(filters.min_price, currency)} - {parser.format(filters.max_price, currency)}")
         elif filters.min_price:
-            parts.append(f"Above Rs.{int(filters.min_price)}")
+            parts.append(f"Above {parser.format(filters.min_price, currency)}")
         elif filters.max_price:
-            parts.append(f"Under Rs.{int(filters.max_price)}")
+            parts.append(f"Under {parser.format(filters.max_price, currency)}")
+        
+        if filters.category:
+            parts.append(f"Category: {filters.category}")
+        
+        parts.extend(describe_spec(*spec) for spec in filters.specs)
         
         if filters.sort_by == "price":
             order = "Lowest first" if filters.sort_order == SortOrder.ASCENDING else "Highest first"
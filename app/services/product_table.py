@@ -0,0 +1,251 @@
+"""
+Columnar product table.
+Parses a product snapshot once into NumPy columns for vectorized filtering.
+"""
+
+import hashlib
+import re
+from functools import cached_property
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from app.utils.keywords import keyword_matcher
+from app.utils.minhash import near_duplicate_groups
+from app.utils.prices import get_price_parser
+from app.utils.specs import SPEC_FIELDS, extract_specs
+
+
+_RATING_PATTERN = re.compile(r"(\d+\.?\d*)")
+_DISCOUNT_PATTERN = re.compile(r"(\d+)\s*%")
+_COUNT_PATTERN = re.compile(r"[\d,]+")
+# "1,234 ratings", "2.5k reviews" or a bare count in brackets after the stars: "4.3 (1,234)"
+_REVIEWS_PATTERN = re.compile(
+    r"(\d[\d,]*(?:\.\d+)?)\s*([kK])?\+?\s*(?:global\s+)?(?:ratings?|reviews?)\b|\((\d[\d,]*)\)"
+)
+
+# Value score weights: points per discount percent, per rating star, and
+# for being the cheapest / most reviewed listing on the page
+_DISCOUNT_WEIGHT = 0.4
+_RATING_WEIGHT = 6.0
+_PRICE_WEIGHT = 30.0
+_REVIEWS_WEIGHT = 10.0
+
+
+def parse_price(value) -> float:
+    """Extract numeric price in the base currency from string, for comparing across sites."""
+    return get_price_parser().parse(value)
+
+
+def parse_rating(value) -> float:
+    """Extract numeric rating from string."""
+    if not value or value in ["N/A", ""]:
+        return 0.0
+
+    match = _RATING_PATTERN.search(str(value))
+
+    try:
+        return float(match.group(1)) if match else 0.0
+    except (ValueError, AttributeError):
+        return 0.0
+
+
+def parse_discount(item: Dict) -> float:
+    """Extract discount percentage from the discount or extra field."""
+    for field in ("discount", "extra"):
+        match = _DISCOUNT_PATTERN.search(str(item.get(field) or ""))
+        if match:
+            return float(match.group(1))
+    return 0.0
+
+
+def parse_reviews(item: Dict) -> float:
+    """Extract review count from the reviews field, or from the extra text."""
+    match = _COUNT_PATTERN.search(str(item.get("reviews") or ""))
+    digits = match.group().replace(",", "") if match else ""
+    if digits:
+        return float(digits)
+
+    match = _REVIEWS_PATTERN.search(str(item.get("extra") or ""))
+    if not match:
+        return 0.0
+
+    count, thousands, bracketed = match.groups()
+    count = float((count or bracketed).replace(",", ""))
+    return count * 1000 if thousands else count
+
+
+def percentile_rank(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Mid-rank percentile of each value among the masked values.
+
+    Args:
+        values: Column to rank
+        mask: Rows taking part in the ranking
+
+    Returns:
+        Array in [0, 1] (lowest to highest), zero for rows outside the mask
+    """
+    ranks = np.zeros(values.shape[0])
+    ranked = np.sort(values[mask])
+
+    if ranked.size > 1:
+        below = np.searchsorted(ranked, values[mask], side="left")
+        at_or_below = np.searchsorted(ranked, values[mask], side="right")
+        ranks[mask] = (below + at_or_below - 1) / (2.0 * (ranked.size - 1))
+
+    return ranks
+
+
+def snapshot_key(products: List[Dict]) -> str:
+    """
+    Stable content hash identifying a product list.
+
+    Every field is hashed, since cached tables hand back their product
+    dicts and vector stores index them; two lists that differ in any
+    field (image, url, type...) never share a key.
+    """
+    text = "\x1e".join(
+        "\x1f".join(f"{field}\x1d{item[field]}" for field in sorted(item, key=str))
+        for item in products
+    )
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=12).hexdigest()
+
+
+class ProductTable:
+    """
+    Parsed, columnar view of one product snapshot.
+    Every string field is parsed exactly once when the table is built.
+    Prices stay in the page's own currency (the one most of them are
+    written in), so they read the way the shopper sees them.
+    """
+
+    def __init__(
+        self,
+        products: List[Dict],
+        key: Optional[str] = None,
+        categorize: Optional[Callable[[List[str]], List[str]]] = None
+    ):
+        self.products = products
+        self.key = key or snapshot_key(products)
+        self._categorize = categorize
+        self.size = len(products)
+
+        parser = get_price_parser()
+        prices = [p.get("price") for p in products]
+        self.currency = parser.page_currency(prices)
+        self.price = parser.parse_column(prices, self.currency)
+        self.rating = np.fromiter(
+            (parse_rating(p.get("rating")) for p in products), dtype=np.float64, count=self.size
+        )
+        self.discount = np.fromiter(
+            (parse_discount(p) for p in products), dtype=np.float64, count=self.size
+        )
+        self.reviews = np.fromiter(
+            (parse_reviews(p) for p in products), dtype=np.float64, count=self.size
+        )
+        self.valid = self.price > 0
+        self._duplicate_groups: Dict[float, np.ndarray] = {}
+
+    @cached_property
+    def text(self) -> np.ndarray:
+        """Lowercased name and extra text, built on first use."""
+        return np.array(
+            [f"{p.get('name') or ''} {p.get('extra') or ''}".lower() for p in self.products],
+            dtype=str
+        ) if self.products else np.array([], dtype=str)
+
+    @cached_property
+    def category(self) -> np.ndarray:
+        """Category per row from the product name, empty if none; keyword-matched without a categorizer."""
+        names = [str(p.get("name") or "").lower() for p in self.products]
+        if self._categorize is not None:
+            categories = self._categorize(names)
+        else:
+            categories = [keyword_matcher.match(name).category or "" for name in names]
+        return np.array(categories, dtype=str) if categories else np.array([], dtype=str)
+
+    @cached_property
+    def specs(self) -> Dict[str, np.ndarray]:
+        """RAM (GB), storage (GB), screen (inches) and battery (mAh) columns, zero if unknown."""
+        matrix = np.array(
+            [extract_specs(text) for text in self.text.tolist()], dtype=np.float64
+        ).reshape(self.size, len(SPEC_FIELDS))
+        return {field: matrix[:, column] for column, field in enumerate(SPEC_FIELDS)}
+
+    @cached_property
+    def value(self) -> np.ndarray:
+        """
+        Deal score per row from discount, rating, price and review count.
+
+        Price and reviews are ranked within the snapshot, so the cheapest
+        listing scores full price points whatever the category's price
+        range. Missing data is neutral, not a penalty: unpriced rows get
+        the middle price rank and unrated rows the snapshot's median
+        rating.
+        """
+        cheapness = np.where(self.valid, 1.0 - percentile_rank(self.price, self.valid), 0.5)
+        rated = self.rating > 0
+        rating = np.where(rated, self.rating, np.median(self.rating[rated]) if rated.any() else 0.0)
+        reviewed = self.reviews > 0
+
+        return (
+            self.discount * _DISCOUNT_WEIGHT
+            + rating * _RATING_WEIGHT
+            + cheapness * _PRICE_WEIGHT
+            + percentile_rank(self.reviews, reviewed) * _REVIEWS_WEIGHT
+        )
+
+    def duplicate_groups(self, threshold: float = 0.8) -> np.ndarray:
+        """Near-duplicate group per row: position of the first row with a near-identical name."""
+        groups = self._duplicate_groups.get(threshold)
+        if groups is None:
+            groups = near_duplicate_groups([str(p.get("name") or "") for p in self.products], threshold)
+            self._duplicate_groups[threshold] = groups
+        return groups
+
+    def unique_rows(self, threshold: float = 0.8) -> np.ndarray:
+        """Row indices of the first listing in each near-duplicate group."""
+        return np.flatnonzero(self.duplicate_groups(threshold) == np.arange(self.size))
+
+    def price_key(self, descending: bool = False) -> np.ndarray:
+        """Price sort key with unpriced rows pushed to the end."""
+        missing = 0.0 if descending else np.inf
+        return np.where(self.valid, self.price, missing)
+
+    def order(self, indices: np.ndarray, key: np.ndarray, descending: bool = False) -> np.ndarray:
+        """Stable ordering of the given row indices by a key column."""
+        values = key[indices]
+        if descending:
+            values = -values
+        return indices[np.argsort(values, kind="stable")]
+
+    def top_k(
+        self,
+        indices: np.ndarray,
+        key: np.ndarray,
+        k: int,
+        descending: bool = False
+    ) -> np.ndarray:
+        """
+        First k row indices of ``order(indices, key, descending)``.
+
+        Uses ``np.partition`` to find the k-th key, so only rows that make
+        the cut are sorted. Ties at the cut keep their original order.
+        """
+        if k >= len(indices):
+            return self.order(indices, key, descending)
+        if k <= 0:
+            return indices[:0]
+
+        values = -key[indices] if descending else key[indices]
+        threshold = np.partition(values, k - 1)[k - 1]
+
+        better = np.flatnonzero(values < threshold)
+        ties = np.flatnonzero(values == threshold)[:k - len(better)]
+        chosen = np.sort(np.concatenate([better, ties]))
+
+        return indices[chosen[np.argsort(values[chosen], kind="stable")]]
+
+    def rows(self, indices) -> List[Dict]:
+        """Materialize product dicts for row indices."""
+        products = self.products
+        return [products[i] for i in indices]
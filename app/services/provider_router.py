@@ -0,0 +1,405 @@
+"""
+LLM provider routing.
+Orders providers by observed latency, skips tripped ones, caps retries and hedges stalls.
+"""
+
+import asyncio
+import time
+from collections import deque
+from threading import Lock, Thread
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+from app.core.config import get_settings
+from app.core.exceptions import AIServiceException
+from app.core.logger import Logger
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_MIN_SUCCESS_RATE = 0.05
+_FIRST_TOKEN_SAMPLES = 256
+_HEDGE_BURST = 2.0
+
+
+class ProviderStats:
+    """Latency, error rate and circuit state of one provider and model."""
+
+    def __init__(self) -> None:
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+        self.first_token: Deque[float] = deque(maxlen=_FIRST_TOKEN_SAMPLES)
+
+    def first_token_quantile(self, quantile: float) -> Optional[float]:
+        if not self.first_token:
+            return None
+        samples = sorted(self.first_token)
+        return samples[int(quantile * (len(samples) - 1))]
+
+
+class _HedgedCall(NamedTuple):
+    """One in-flight streamed call of a hedged request."""
+
+    task: "asyncio.Task"
+    probe: bool
+    started: float
+
+
+class ProviderRouter:
+    """
+    Service choosing which LLM provider serves each call.
+
+    Providers are named by provider and model ("groq/llama-3.1-8b-instant"),
+    so a small and a large model on one provider keep separate stats.
+    They are tried fastest first by EWMA latency. A provider whose
+    EWMA error rate crosses the threshold trips its circuit and is skipped
+    for CIRCUIT_OPEN_SECONDS, then gets a single half-open probe call.
+    Every attempt after the first spends from a retry budget refilled by
+    a fraction of requests, so an outage cannot multiply upstream load.
+
+    With LLM_HEDGING on, calls are streamed as tasks on the router's event
+    loop. If the first provider has not sent a token by its own first-token
+    quantile, the prompt is also sent to the next one, and whichever
+    streams first wins while the other's task is cancelled, aborting its
+    stream. A cancelled half-open probe counts as failed, so the provider
+    stays open and is probed again later. Hedges draw from their own
+    budget. Implements singleton pattern.
+    """
+
+    _instance: Optional["ProviderRouter"] = None
+
+    def __new__(cls) -> "ProviderRouter":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        settings = get_settings()
+        self._logger = Logger("provider_router")
+        self._alpha = settings.provider_ewma_alpha
+        self._error_threshold = settings.circuit_error_threshold
+        self._min_calls = settings.circuit_min_calls
+        self._open_seconds = settings.circuit_open_seconds
+        self._retry_ratio = settings.retry_budget_ratio
+        self._retry_burst = float(settings.retry_budget_burst)
+        self._retry_balance = self._retry_burst
+        self._retries = 0
+        self._retries_denied = 0
+        self._hedging = settings.llm_hedging
+        self._hedge_quantile = settings.hedge_quantile
+        self._hedge_min_delay = settings.hedge_min_delay_seconds
+        self._hedge_min_samples = settings.hedge_min_samples
+        self._hedge_ratio = settings.hedge_budget_ratio
+        self._hedge_balance = _HEDGE_BURST
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._stats: Dict[str, ProviderStats] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = Lock()
+        self._logger.info("Provider router initialized")
+
+    def _get_stats(self, provider: str) -> ProviderStats:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = ProviderStats()
+        return stats
+
+    def order(self, providers: List[str]) -> List[str]:
+        """
+        Providers to try for one call, best first.
+
+        Args:
+            providers: Configured providers in preference order
+
+        Returns:
+            A half-open provider whose probe slot is free, then closed
+            providers by EWMA latency scaled up by their error rate
+            (unmeasured ones first, in preference order); providers with
+            an open circuit are left out
+        """
+        now = time.monotonic()
+        ready, probes = [], []
+
+        with self._lock:
+            for index, provider in enumerate(providers):
+                stats = self._get_stats(provider)
+                if stats.state == OPEN and now - stats.opened_at >= self._open_seconds:
+                    stats.state = HALF_OPEN
+                    stats.probing = False
+
+                if stats.state == CLOSED:
+                    score = (stats.latency or 0.0) / max(1.0 - stats.error_rate, _MIN_SUCCESS_RATE)
+                    ready.append((score, index, provider))
+                elif stats.state == HALF_OPEN and not stats.probing:
+                    probes.append(provider)
+
+        # Probes go first so a recovered provider is noticed; others remain as fallback
+        return probes + [provider for _, _, provider in sorted(ready)]
+
+    def record(self, provider: str, latency: float, ok: bool) -> None:
+        """
+        Record the outcome of one provider call.
+
+        Args:
+            provider: Provider/model name
+            latency: Call duration in seconds
+            ok: Whether the call succeeded
+        """
+        with self._lock:
+            stats = self._get_stats(provider)
+            stats.calls += 1
+            stats.error_rate += self._alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+
+            if ok:
+                stats.latency = latency if stats.latency is None else stats.latency + self._alpha * (latency - stats.latency)
+            else:
+                stats.failures += 1
+
+            if stats.state == HALF_OPEN:
+                stats.probing = False
+                if ok:
+                    stats.state, stats.error_rate = CLOSED, 0.0
+                    self._logger.info(f"Circuit closed for {provider}")
+                else:
+                    self._trip(provider, stats)
+            elif not ok and stats.calls >= self._min_calls and stats.error_rate >= self._error_threshold:
+                self._trip(provider, stats)
+
+    def _trip(self, provider: str, stats: ProviderStats) -> None:
+        stats.state = OPEN
+        stats.opened_at = time.monotonic()
+        self._logger.warning(f"Circuit opened for {provider} (error rate {stats.error_rate:.0%})")
+
+    def _claim(self, provider: str) -> Optional[str]:
+        """Reserve a call: the circuit state it runs under, or None if the provider must be skipped."""
+        with self._lock:
+            stats = self._get_stats(provider)
+            if stats.state == OPEN or (stats.state == HALF_OPEN and stats.probing):
+                return None
+            if stats.state == HALF_OPEN:
+                stats.probing = True
+            return stats.state
+
+    def _spend_retry(self) -> bool:
+        with self._lock:
+            if self._retry_balance < 1.0:
+                self._retries_denied += 1
+                return False
+            self._retry_balance -= 1.0
+            self._retries += 1
+            return True
+
+    def _spend_hedge(self) -> bool:
+        with self._lock:
+            if self._hedge_balance < 1.0:
+                return False
+            self._hedge_balance -= 1.0
+            return True
+
+    def hedge_delay(self, provider: str) -> Optional[float]:
+        """
+        How long to wait for a provider's first token before hedging.
+
+        Args:
+            provider: Provider/model name
+
+        Returns:
+            Its first-token latency at HEDGE_QUANTILE, at least
+            HEDGE_MIN_DELAY_SECONDS, or None until enough calls were seen
+        """
+        with self._lock:
+            stats = self._get_stats(provider)
+            if len(stats.first_token) < self._hedge_min_samples:
+                return None
+            return max(self._hedge_min_delay, stats.first_token_quantile(self._hedge_quantile))
+
+    def invoke(self, runnables: Dict[str, Any], prompt: Any) -> Any:
+        """
+        Run a prompt on the best available provider.
+
+        Args:
+            runnables: Provider/model name to LLM, in preference order
+            prompt: Prompt value passed to the LLM
+
+        Returns:
+            The first successful LLM output
+
+        Raises:
+            AIServiceException: If every provider is tripped, failed, or
+                the retry budget is spent
+        """
+        with self._lock:
+            self._retry_balance = min(self._retry_burst, self._retry_balance + self._retry_ratio)
+            self._hedge_balance = min(_HEDGE_BURST, self._hedge_balance + self._hedge_ratio)
+
+        order = self.order(list(runnables))
+        if self._hedging and len(order) > 1:
+            return self._invoke_hedged(runnables, order, prompt)
+
+        last_error: Optional[Exception] = None
+        attempted = False
+
+        for provider in order:
+            if attempted and not self._spend_retry():
+                self._logger.warning("Retry budget spent, not trying further providers")
+                break
+            if not self._claim(provider):
+                continue
+
+            attempted = True
+            start = time.monotonic()
+            try:
+                result = runnables[provider].invoke(prompt)
+            except Exception as e:
+                self.record(provider, time.monotonic() - start, ok=False)
+                self._logger.warning(f"{provider} call failed: {e}")
+                last_error = e
+                continue
+
+            self.record(provider, time.monotonic() - start, ok=True)
+            return result
+
+        provider = ",".join(runnables)
+        if last_error is not None:
+            raise AIServiceException(f"LLM providers failed: {last_error}", provider=provider)
+        raise AIServiceException("No LLM provider available", provider=provider)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                Thread(target=self._loop.run_forever, name="provider-hedging", daemon=True).start()
+            return self._loop
+
+    async def _stream(self, provider: str, runnable: Any, prompt: Any, events: "asyncio.Queue") -> None:
+        start = time.monotonic()
+        result = None
+
+        # Cancellation is raised at the pending read, which closes the HTTP stream;
+        # the control side settles cancelled calls, so they are not recorded here
+        try:
+            async for chunk in runnable.astream(prompt):
+                if result is None:
+                    with self._lock:
+                        self._get_stats(provider).first_token.append(time.monotonic() - start)
+                    events.put_nowait((provider, "token", None))
+                result = chunk if result is None else result + chunk
+        except Exception as e:
+            self.record(provider, time.monotonic() - start, ok=False)
+            events.put_nowait((provider, "error", e))
+            return
+
+        self.record(provider, time.monotonic() - start, ok=True)
+        events.put_nowait((provider, "done", result))
+
+    def _invoke_hedged(self, runnables: Dict[str, Any], order: List[str], prompt: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(self._hedge(runnables, order, prompt), self._get_loop()).result()
+
+    async def _hedge(self, runnables: Dict[str, Any], order: List[str], prompt: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        events: "asyncio.Queue" = asyncio.Queue()
+        running: Dict[str, _HedgedCall] = {}
+        waiting = list(order)
+        winner: Optional[str] = None
+        hedge: Optional[str] = None
+        last_error: Optional[Exception] = None
+
+        def launch() -> Optional[str]:
+            while waiting:
+                provider = waiting.pop(0)
+                state = self._claim(provider)
+                if state:
+                    task = loop.create_task(self._stream(provider, runnables[provider], prompt, events))
+                    running[provider] = _HedgedCall(task, state == HALF_OPEN, time.monotonic())
+                    return provider
+            return None
+
+        def cancel(provider: str) -> None:
+            call = running.pop(provider)
+            if call.task.done():
+                return
+            call.task.cancel()
+            if call.probe:
+                # A probe that lost the race proved nothing: free the slot and keep the circuit open
+                self.record(provider, time.monotonic() - call.started, ok=False)
+
+        primary = launch()
+        delay = self.hedge_delay(primary) if primary else None
+
+        try:
+            while running:
+                try:
+                    provider, kind, payload = await asyncio.wait_for(
+                        events.get(), timeout=delay if winner is None and waiting else None
+                    )
+                except asyncio.TimeoutError:
+                    # No first token within the primary's usual time: race the next provider
+                    delay = None
+                    if self._spend_hedge():
+                        hedge = launch()
+                        if hedge:
+                            with self._lock:
+                                self._hedges += 1
+                    continue
+
+                if provider not in running:
+                    continue
+
+                if kind == "token" and winner is None:
+                    winner = provider
+                    for loser in [other for other in running if other != provider]:
+                        cancel(loser)
+                elif kind == "done":
+                    running.pop(provider)
+                    if provider == hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return payload
+                elif kind == "error":
+                    running.pop(provider)
+                    last_error = payload
+                    self._logger.warning(f"{provider} call failed: {payload}")
+                    if winner == provider:
+                        winner = None
+                    if winner is None and not running and waiting and self._spend_retry():
+                        launch()
+        finally:
+            for provider in list(running):
+                cancel(provider)
+
+        provider = ",".join(runnables)
+        if last_error is not None:
+            raise AIServiceException(f"LLM providers failed: {last_error}", provider=provider)
+        raise AIServiceException("No LLM provider available", provider=provider)
+
+    @property
+    def metrics(self) -> Dict:
+        """Per-provider latency, error rate and circuit state, and retry budget use."""
+        with self._lock:
+            return {
+                "providers": {
+                    provider: {
+                        "state": stats.state,
+                        "latency_ms": round(stats.latency * 1000, 1) if stats.latency is not None else None,
+                        "error_rate": round(stats.error_rate, 4),
+                        "calls": stats.calls,
+                        "failures": stats.failures,
+                        "first_token_ms": (
+                            round(stats.first_token_quantile(self._hedge_quantile) * 1000, 1)
+                            if stats.first_token else None
+                        )
+                    }
+                    for provider, stats in self._stats.items()
+                },
+                "retry_budget": round(self._retry_balance, 2),
+                "retries": self._retries,
+                "retries_denied": self._retries_denied,
+                "hedges": self._hedges,
+                "hedge_wins": self._hedge_wins
+            }
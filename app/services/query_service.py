@@ -0,0 +1,162 @@
+"""
+Query analysis service.
+Parses a user query once per request into a shared QueryAnalysis.
+"""
+
+import re
+from typing import List, Optional, Union
+from app.core.logger import Logger
+from app.models.enums import SortOrder
+from app.services.language_service import LanguageService
+from app.utils.keywords import KeywordMatch, keyword_matcher
+from app.utils.prices import detect_currency
+from app.utils.specs import SpecBound, parse_spec_bounds
+from app.utils.spelling import spelling_normalizer
+
+
+_CURRENCY = r"(?:rs\.?|inr|₹|\$|usd|€|eur|£|gbp)?"
+_CURRENCY_SUFFIX = r"(?:\s*(?:rs\b|rupees?\b|inr\b|₹|\$|usd\b|dollars?\b|€|eur\b|euros?\b|£|gbp\b))?"
+_DIGIT_GROUP_PATTERN = re.compile(r"(?<=\d),(?=\d)")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+_UNDER_PATTERN = re.compile(
+    r"(?:under|below|niche|less than|max|upto|budget)\s*" + _CURRENCY + r"\s*(\d+)" + _CURRENCY_SUFFIX
+    + r"|(\d+)\s*(?:se|से)\s*kam"
+)
+_ABOVE_PATTERN = re.compile(
+    r"(?:above|over|upar|more than|min|atleast)\s*" + _CURRENCY + r"\s*(\d+)" + _CURRENCY_SUFFIX
+)
+_BETWEEN_PATTERN = re.compile(
+    _CURRENCY + r"\s*(\d+)\s*(?:to|se|से|-|and|&)\s*" + _CURRENCY + r"\s*(\d+)" + _CURRENCY_SUFFIX
+)
+_LIMIT_PATTERN = re.compile(r"(?:top|first|show)\s*(\d+)")
+_NORMALIZED_LANGUAGES = frozenset(("en", "hi"))
+
+
+class QueryAnalysis:
+    """Data class holding everything derived from one user query."""
+
+    def __init__(self, raw: str, text: Optional[str] = None):
+        self.raw: str = raw
+        self.text: str = raw.lower().strip() if text is None else text
+        self.tokens: List[str] = []
+        self.numbers: List[float] = []
+        self.keywords: KeywordMatch = keyword_matcher.match(self.text)
+        self.min_price: Optional[float] = None
+        self.max_price: Optional[float] = None
+        self.price_currency: Optional[str] = None
+        self.specs: List[SpecBound] = []
+        self.sort_by: Optional[str] = None
+        self.sort_order: Optional[SortOrder] = None
+        self.limit: Optional[int] = None
+        self.category: Optional[str] = None
+        self.language: Optional[str] = None
+
+    @property
+    def has_price_bounds(self) -> bool:
+        return self.min_price is not None or self.max_price is not None
+
+    @property
+    def has_spec_bounds(self) -> bool:
+        return bool(self.specs)
+
+
+class QueryService:
+    """
+    Service that builds a QueryAnalysis for each request.
+    Implements singleton pattern.
+    """
+
+    _instance: Optional["QueryService"] = None
+
+    def __new__(cls) -> "QueryService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self._logger = Logger("query_service")
+        self._language_service = LanguageService()
+        self._logger.info("Query service initialized")
+
+    def analyze(self, query: str, language: Optional[str] = None) -> QueryAnalysis:
+        """
+        Analyze a query once for use by every pipeline stage.
+
+        Args:
+            query: Raw user query
+            language: Language code, "auto" to detect, or None to skip
+
+        Returns:
+            Populated QueryAnalysis
+        """
+        raw = query.lower().strip()
+        # Language and category come from what the user typed; the corrector
+        # only knows English and Hinglish, so other languages are left as typed
+        detected = self._language_service.detect_language(raw)
+        normalized = spelling_normalizer.normalize(raw) if detected in _NORMALIZED_LANGUAGES else raw
+
+        analysis = QueryAnalysis(query, normalized)
+        text = _DIGIT_GROUP_PATTERN.sub("", analysis.text)
+
+        analysis.tokens = _TOKEN_PATTERN.findall(text)
+        analysis.numbers = [float(n) for n in _NUMBER_PATTERN.findall(text)]
+        analysis.category = keyword_matcher.match(raw).category
+
+        # Spec mentions are blanked so "8gb" is not read as a price or a limit
+        analysis.specs, text = parse_spec_bounds(text)
+        self._parse_price_bounds(analysis, text)
+        self._parse_sort_hints(analysis, text)
+
+        analysis.language = detected if language == "auto" else language
+
+        return analysis
+
+    def _parse_price_bounds(self, analysis: QueryAnalysis, text: str) -> None:
+        under_match = _UNDER_PATTERN.search(text)
+        if under_match:
+            analysis.max_price = float(under_match.group(1) or under_match.group(2))
+
+        above_match = _ABOVE_PATTERN.search(text)
+        if above_match:
+            analysis.min_price = float(above_match.group(1))
+
+        matches = [under_match, above_match]
+        between_match = _BETWEEN_PATTERN.search(text)
+        if between_match and not under_match and not above_match:
+            p1, p2 = float(between_match.group(1)), float(between_match.group(2))
+            analysis.min_price = min(p1, p2)
+            analysis.max_price = max(p1, p2)
+            matches.append(between_match)
+
+        # Bounds without a currency are read in the page's own currency
+        for match in matches:
+            if match and analysis.price_currency is None:
+                analysis.price_currency = detect_currency(match.group())
+
+    def _parse_sort_hints(self, analysis: QueryAnalysis, text: str) -> None:
+        keywords = analysis.keywords
+
+        if keywords.has("sort_cheap"):
+            analysis.sort_by = "price"
+            analysis.sort_order = SortOrder.ASCENDING
+
+        if keywords.has("sort_expensive"):
+            analysis.sort_by = "price"
+            analysis.sort_order = SortOrder.DESCENDING
+
+        if keywords.has("sort_best"):
+            analysis.sort_by = "rating"
+            analysis.sort_order = SortOrder.DESCENDING
+
+        limit_match = _LIMIT_PATTERN.search(text)
+        if limit_match:
+            analysis.limit = int(limit_match.group(1))
+
+
+def ensure_analysis(query: Union[str, QueryAnalysis]) -> QueryAnalysis:
+    """Return the given analysis, or analyze a raw query string."""
+    if isinstance(query, QueryAnalysis):
+        return query
+    return QueryService().analyze(query)
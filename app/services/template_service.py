@@ -0,0 +1,187 @@
+"""
+Template response tier.
+Answers simple intents from translations and product data without the LLM.
+"""
+
+from collections import Counter
+from threading import Lock
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+import numpy as np
+from app.core.config import get_settings
+from app.core.logger import Logger
+from app.models.enums import IntentType
+from app.services.language_service import LanguageService
+from app.services.product_search import ProductSearchService, query_terms
+from app.services.product_service import ProductService
+from app.services.query_service import QueryAnalysis
+from app.utils.bm25 import tokenize
+from app.utils.keywords import KEYWORD_TABLES
+from app.utils.prices import get_price_parser
+from app.utils.specs import parse_spec_bounds
+
+
+_PRICE_MATCH_LIMIT = 3
+
+# Words a filter or price request can contain without needing the LLM
+_FILTER_WORDS: FrozenSet[str] = frozenset(
+    token
+    for phrases in KEYWORD_TABLES.values()
+    for phrase in phrases
+    for token in tokenize(phrase)
+) | frozenset(tokenize(
+    "all only items products sort sorted by first low high lowest highest rated rating "
+    "less than more from to least at max min upto atleast from range filter list "
+    "cost costs how much kitna kitne ka kya daam rate"
+))
+
+
+class TemplateAnswer(NamedTuple):
+    """Rendered answer and the products it lists."""
+
+    text: str
+    products: List[Dict]
+
+
+class TemplateService:
+    """
+    Service rendering answers for templated intents.
+
+    Greetings, farewells, thanks, price questions and pure filter requests
+    are answered from LanguageService translations and the parsed product
+    table. Each intent can be switched off with LLM_BYPASS_INTENTS. Counts
+    how many chat requests skip the LLM. Implements singleton pattern.
+    """
+
+    _instance: Optional["TemplateService"] = None
+
+    def __new__(cls) -> "TemplateService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self) -> None:
+        self._logger = Logger("template_service")
+        self._settings = get_settings()
+        self._language_service = LanguageService()
+        self._product_service = ProductService()
+        self._product_search = ProductSearchService()
+        self._requests: Counter = Counter()
+        self._bypassed: Counter = Counter()
+        self._lock = Lock()
+        self._logger.info("Template service initialized")
+
+    @staticmethod
+    def residual_terms(analysis: QueryAnalysis) -> List[str]:
+        """Query terms left after removing filter, sort, category and spec vocabulary."""
+        _, text = parse_spec_bounds(analysis.text)
+        return [term for term in query_terms(text) if term not in _FILTER_WORDS]
+
+    def render(
+        self,
+        intent: str,
+        analysis: QueryAnalysis,
+        items: List[Dict],
+        language: Optional[str] = None
+    ) -> Optional[TemplateAnswer]:
+        """
+        Answer a request from templates if its intent allows it.
+
+        Args:
+            intent: Classified intent
+            analysis: Analyzed query
+            items: Products on the page
+            language: Response language
+
+        Returns:
+            TemplateAnswer, or None when the request needs the LLM
+        """
+        if intent not in self._settings.bypass_intents:
+            return None
+
+        if intent == IntentType.GREETING.value:
+            return TemplateAnswer(self._language_service.get_greeting(language), [])
+        if intent == IntentType.FAREWELL.value:
+            return TemplateAnswer(self._language_service.get_farewell(language), [])
+        if intent == IntentType.THANKS.value:
+            return TemplateAnswer(self._language_service.get_thanks_response(language), [])
+        if intent == IntentType.PRICE_QUERY.value and items:
+            return self._render_prices(analysis, items, language)
+        if intent == IntentType.PRODUCT_FILTER.value and items and not self.residual_terms(analysis):
+            return self._render_filter(analysis, items, language)
+
+        return None
+
+    def _render_filter(self, analysis: QueryAnalysis, items: List[Dict], language: Optional[str]) -> Optional[TemplateAnswer]:
+        table = self._product_service.get_table(items)
+        plan = self._product_service.plan_filters(analysis)
+        rows = self._product_service.select_rows(table, plan)
+
+        # The plan keeps rows without a category so "phones" never loses a phone;
+        # whether they belong in the list is for the LLM to judge
+        if analysis.category and (table.category[rows] == "").any():
+            return None
+
+        return self._render_list(table.rows(rows), language)
+
+    def _render_list(self, products: List[Dict], language: Optional[str], header: str = "products.filtered") -> TemplateAnswer:
+        translate = self._language_service.translate
+        if not products:
+            return TemplateAnswer(translate("products.no_match", language), [])
+
+        lines = [translate(header, language, count=len(products)), ""]
+        for i, item in enumerate(products, 1):
+            details = [str(item["price"])] if item.get("price") else []
+            if item.get("rating"):
+                details.append(f"⭐ {item['rating']}")
+            suffix = f" - {' | '.join(details)}" if details else ""
+            lines.append(f"{i}. **{item.get('name') or '-'}**{suffix}")
+
+        return TemplateAnswer("\n".join(lines), products)
+
+    def _render_prices(self, analysis: QueryAnalysis, items: List[Dict], language: Optional[str]) -> Optional[TemplateAnswer]:
+        table = self._product_service.get_table(items)
+        terms = self.residual_terms(analysis)
+
+        if terms:
+            result = self._product_search.search(table, " ".join(terms), limit=_PRICE_MATCH_LIMIT)
+            matched = result.indices[result.matched]
+            if not matched.size:
+                return None
+            return self._render_list(table.rows(matched), language, header="products.found")
+
+        prices = table.price[table.valid]
+        if not prices.size:
+            return None
+
+        parser = get_price_parser()
+        text = self._language_service.translate(
+            "products.price_range", language,
+            min=parser.format(prices.min(), table.currency),
+            max=parser.format(prices.max(), table.currency),
+            median=parser.format(float(np.median(prices)), table.currency)
+        )
+        return TemplateAnswer(text, [])
+
+    def record(self, intent: str, bypassed: bool) -> None:
+        """Count a chat request and whether it skipped the LLM."""
+        with self._lock:
+            self._requests[intent] += 1
+            if bypassed:
+                self._bypassed[intent] += 1
+
+    @property
+    def metrics(self) -> Dict:
+        """Request and bypass counts overall and per intent."""
+        with self._lock:
+            requests = sum(self._requests.values())
+            bypassed = sum(self._bypassed.values())
+            return {
+                "requests": requests,
+                "bypassed": bypassed,
+                "bypass_rate": bypassed / requests if requests else 0.0,
+                "intents": {
+                    intent: {"requests": count, "bypassed": self._bypassed[intent]}
+                    for intent, count in self._requests.most_common()
+                }
+            }
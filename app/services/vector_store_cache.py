@@ -0,0 +1,161 @@
+"""
+Per-snapshot FAISS vector store cache.
+Builds stores in the background, keyed by product-set hash, with optional disk persistence.
+"""
+
+import inspect
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, List, Optional
+from app.core.logger import Logger
+from app.services.product_table import snapshot_key
+from app.utils.cache import LRUCache
+
+try:
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+    VECTOR_STORE_AVAILABLE = True
+except ImportError:
+    VECTOR_STORE_AVAILABLE = False
+
+
+def product_documents(items: List[Dict]) -> List[Any]:
+    """Build one LangChain document per product, tagged with its list position."""
+    documents = []
+    for position, item in enumerate(items):
+        content = f"""
+        Product: {item.get('name', 'Unknown')}
+        Price: {item.get('price', 'N/A')}
+        Rating: {item.get('rating', 'N/A')}
+        Discount: {item.get('discount', 'N/A')}
+        """
+        metadata = {
+            'position': position,
+            'name': item.get('name'),
+            'price': item.get('price'),
+            'rating': item.get('rating'),
+            'discount': item.get('discount')
+        }
+        documents.append(Document(page_content=content, metadata=metadata))
+    return documents
+
+
+class VectorStoreCache:
+    """
+    Bounded LRU of FAISS stores keyed by product snapshot hash.
+
+    ``get`` never waits for embeddings: a miss schedules a background
+    build and returns None, and later requests for the same snapshot
+    pick up the finished store. At most ``max_pending`` builds are
+    queued; misses beyond that are dropped and retried on a later
+    request. Stores saved under ``persist_dir`` survive restarts.
+    """
+
+    def __init__(
+        self,
+        embeddings: Any,
+        maxsize: int = 8,
+        persist_dir: Optional[str] = None,
+        max_pending: int = 4
+    ):
+        self._logger = Logger("vector_store_cache")
+        self._embeddings = embeddings
+        self._stores: LRUCache[Any] = LRUCache(maxsize)
+        self._persist_dir = persist_dir
+        self._max_pending = max(1, max_pending)
+        self._dropped = 0
+        self._pending: Dict[str, Future] = {}
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vectorstore")
+
+    def get(self, items: List[Dict]) -> Optional[Any]:
+        """
+        Return the vector store for a product set, if it is ready.
+
+        Args:
+            items: Products to index
+
+        Returns:
+            FAISS store, or None while it is being built
+        """
+        if not VECTOR_STORE_AVAILABLE or not self._embeddings or not items:
+            return None
+
+        key = snapshot_key(items)
+        store = self._stores.get(key)
+        if store is not None:
+            return store
+
+        with self._lock:
+            if key in self._pending:
+                return None
+            if len(self._pending) >= self._max_pending:
+                self._dropped += 1
+                self._logger.debug(f"Build queue full, skipping vector store {key}")
+                return None
+            self._pending[key] = self._executor.submit(self._build, key, list(items))
+
+        return None
+
+    def _build(self, key: str, items: List[Dict]) -> None:
+        try:
+            store = self._load(key)
+            if store is None:
+                store = FAISS.from_documents(
+                    documents=product_documents(items),
+                    embedding=self._embeddings
+                )
+                self._save(key, store)
+            self._stores.put(key, store)
+        except Exception as e:
+            self._logger.error(f"Vector store build failed: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def _path(self, key: str) -> Optional[str]:
+        return os.path.join(self._persist_dir, key) if self._persist_dir else None
+
+    def _load(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        if not path or not os.path.isdir(path):
+            return None
+
+        kwargs = {}
+        if "allow_dangerous_deserialization" in inspect.signature(FAISS.load_local).parameters:
+            # Only stores this cache wrote itself are ever loaded
+            kwargs["allow_dangerous_deserialization"] = True
+
+        try:
+            return FAISS.load_local(path, self._embeddings, **kwargs)
+        except Exception as e:
+            self._logger.warning(f"Could not load persisted vector store {key}: {e}")
+            return None
+
+    def _save(self, key: str, store: Any) -> None:
+        path = self._path(key)
+        if not path:
+            return
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            store.save_local(path)
+        except Exception as e:
+            self._logger.warning(f"Could not persist vector store {key}: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until queued builds finish. Intended for tests and shutdown."""
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            future.result(timeout=timeout)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Ready stores, queued builds and builds dropped because the queue was full."""
+        with self._lock:
+            return {"stores": len(self._stores), "pending": len(self._pending), "dropped": self._dropped}
+
+    def __len__(self) -> int:
+        return len(self._stores)
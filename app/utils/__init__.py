@@ -3,5 +3,15 @@ Utility functions and helpers.
 """
 
 from app.utils.helpers import TextHelper, PriceHelper
+from app.utils.keywords import KeywordMatcher, KeywordMatch, keyword_matcher
+from app.utils.spelling import SpellingNormalizer, spelling_normalizer
 
-__all__ = ["TextHelper", "PriceHelper"]
\ No newline at end of file
+__all__ = [
+    "TextHelper",
+    "PriceHelper",
+    "KeywordMatcher",
+    "KeywordMatch",
+    "keyword_matcher",
+    "SpellingNormalizer",
+    "spelling_normalizer"
+]
@@ -0,0 +1,69 @@
+"""
+Okapi BM25 lexical scoring.
+Postings are stored as NumPy arrays so a query scores every document at once.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with a light plural strip ("earbuds" -> "earbud")."""
+    return [
+        token[:-1] if len(token) > 3 and token.endswith("s") and not token.endswith("ss") else token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+    ]
+
+
+class BM25Index:
+    """Inverted index scoring documents with Okapi BM25."""
+
+    def __init__(self, documents: Iterable[List[str]], k1: float = 1.5, b: float = 0.75):
+        self._k1 = k1
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths: List[int] = []
+
+        for doc_id, tokens in enumerate(documents):
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                ids, counts = postings.setdefault(token, ([], []))
+                ids.append(doc_id)
+                counts.append(count)
+
+        self.size = len(lengths)
+        doc_lengths = np.asarray(lengths, dtype=np.float64)
+        average = doc_lengths.mean() if self.size and doc_lengths.mean() > 0 else 1.0
+        self._norm = k1 * (1 - b + b * doc_lengths / average)
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+        for token, (ids, counts) in postings.items():
+            df = len(ids)
+            idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            self._postings[token] = (np.asarray(ids), np.asarray(counts, dtype=np.float64), idf)
+
+    def score(self, terms: Iterable[str]) -> np.ndarray:
+        """
+        Score every document against query terms.
+
+        Args:
+            terms: Query tokens, as produced by ``tokenize``
+
+        Returns:
+            Array of BM25 scores, one per document
+        """
+        scores = np.zeros(self.size)
+
+        for term in set(terms):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            ids, tf, idf = posting
+            scores[ids] += idf * tf * (self._k1 + 1) / (tf + self._norm[ids])
+
+        return scores
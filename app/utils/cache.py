@@ -0,0 +1,44 @@
+"""
+Small bounded caches shared by the services.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe least-recently-used cache with a fixed capacity."""
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = max(1, maxsize)
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Get a cached value and mark it as recently used."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -4,6 +4,7 @@ Utility helper classes for common operations.
 
 import re
 from typing import Optional
+from app.utils.prices import get_price_parser
 
 
 class TextHelper:
@@ -36,24 +37,10 @@ class TextHelper:
 class PriceHelper:
     """Helper class for price-related operations."""
     
-    CURRENCY_SYMBOLS = ["$", "Rs", "Rs.", "INR", "USD"]
-    
     @classmethod
     def parse(cls, price_str: str) -> float:
-        """Parse price string to float."""
-        if not price_str:
-            return 0.0
-        
-        cleaned = price_str
-        for symbol in cls.CURRENCY_SYMBOLS:
-            cleaned = cleaned.replace(symbol, "")
-        
-        cleaned = re.sub(r"[^\d.]", "", cleaned.replace(",", ""))
-        
-        try:
-            return float(cleaned) if cleaned else 0.0
-        except ValueError:
-            return 0.0
+        """Parse price string to float in the base currency."""
+        return get_price_parser().parse(price_str)
     
     @classmethod
     def format(cls, price: float, currency: str = "Rs.") -> str:
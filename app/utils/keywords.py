@@ -0,0 +1,172 @@
+"""
+Keyword tables and a compiled multi-pattern matcher.
+Finds every keyword class present in a query in a single pass.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+
+KEYWORD_TABLES: Dict[str, List[str]] = {
+    # Intent detection
+    "thanks": ["thank", "thanks", "thanku", "shukriya"],
+    "product": ["best", "top", "cheap", "sasta", "under", "above", "price", "product", "show"],
+    "compare": ["compare", "vs", "better", "difference"],
+    "summarize": ["summarize", "summary"],
+    "help": ["help", "command", "how to"],
+
+    # Filter sort hints
+    "sort_cheap": ["cheap", "sasta", "lowest price", "budget", "kam price"],
+    "sort_expensive": ["expensive", "mehnga", "costly", "premium", "highest price"],
+    "sort_best": ["best", "top", "highest rated", "accha", "popular"],
+
+    # Prompt item ordering
+    "rank_cheap": ["cheapest", "lowest price", "sasta", "cheap", "budget"],
+    "rank_premium": ["expensive", "costly", "premium", "best"],
+    "rank_rated": ["best rated", "top rated", "highest rating", "popular"],
+
+    # Product categories; accessories come before phones so "phone case" is an accessory
+    "category:mobile_accessories": [
+        "earphone", "headphone", "earbuds", "buds", "microphone",
+        "charger", "cable", "power bank", "case", "cover", "screen protector"
+    ],
+    "category:mobiles": ["mobile", "phone", "redmi", "oneplus", "realme"],
+    "category:electronics": [
+        "tv", "television", "speaker", "tablet", "laptop",
+        "camera", "smart watch", "monitor"
+    ],
+    "category:home_kitchen": [
+        "mixer", "grinder", "kettle", "cooker", "toaster",
+        "oven", "refrigerator", "washing machine", "iron", "fan"
+    ],
+    "category:fashion": [
+        "shirt", "tshirt", "jeans", "shoes", "watch",
+        "sunglasses", "bag", "wallet", "belt"
+    ],
+    "category:books": ["book", "novel", "kindle", "magazine"],
+    "category:beauty": ["beauty", "cosmetic", "makeup", "skincare", "perfume"]
+}
+
+CATEGORY_PREFIX = "category:"
+
+# Facet and filter name for products no category fits (stored as "")
+OTHER_CATEGORY = "other"
+
+CATEGORIES: List[str] = [
+    name[len(CATEGORY_PREFIX):]
+    for name in KEYWORD_TABLES
+    if name.startswith(CATEGORY_PREFIX)
+]
+
+
+class KeywordMatch:
+    """Result of matching a query against the keyword tables."""
+
+    __slots__ = ("classes", "keywords")
+
+    def __init__(self, classes: FrozenSet[str], keywords: FrozenSet[str]):
+        self.classes = classes
+        self.keywords = keywords
+
+    def has(self, name: str) -> bool:
+        """Check if any keyword of a class occurs in the query."""
+        return name in self.classes
+
+    @property
+    def category(self) -> Optional[str]:
+        """First matched product category in table order."""
+        for category in CATEGORIES:
+            if CATEGORY_PREFIX + category in self.classes:
+                return category
+        return None
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton compiled from keyword tables.
+    Matching is substring-based, like ``keyword in query``.
+    """
+
+    def __init__(self, tables: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._keywords: List[FrozenSet[str]] = [frozenset()]
+        self._classes: List[FrozenSet[str]] = [frozenset()]
+
+        owners: Dict[str, set] = {}
+        for name, keywords in tables.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), set()).add(name)
+
+        for keyword in owners:
+            self._insert(keyword)
+
+        self._build_links(owners)
+
+    def _insert(self, keyword: str) -> None:
+        node = 0
+        for char in keyword:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._keywords.append(frozenset())
+                self._classes.append(frozenset())
+            node = nxt
+        self._keywords[node] = frozenset([keyword])
+
+    def _build_links(self, owners: Dict[str, set]) -> None:
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            fail = self._fail[node]
+            self._keywords[node] = self._keywords[node] | self._keywords[fail]
+
+            for char, child in self._goto[node].items():
+                state = fail
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                target = self._goto[state].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                queue.append(child)
+
+        for node, keywords in enumerate(self._keywords):
+            classes = set()
+            for keyword in keywords:
+                classes |= owners[keyword]
+            self._classes[node] = frozenset(classes)
+
+    def match(self, text: str) -> KeywordMatch:
+        """
+        Scan text once and collect every matched keyword and class.
+
+        Args:
+            text: Lowercased query text
+
+        Returns:
+            KeywordMatch with matched classes and keywords
+        """
+        goto, fail = self._goto, self._fail
+        node = 0
+        hits = set()
+
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if self._keywords[node]:
+                hits.add(node)
+
+        classes: FrozenSet[str] = frozenset()
+        keywords: FrozenSet[str] = frozenset()
+        for node in hits:
+            classes = classes | self._classes[node]
+            keywords = keywords | self._keywords[node]
+
+        return KeywordMatch(classes, keywords)
+
+
+keyword_matcher = KeywordMatcher(KEYWORD_TABLES)
@@ -0,0 +1,194 @@
+"""
+MinHash signatures and LSH banding for near-duplicate text.
+Finds similar product names without comparing every pair.
+"""
+
+import re
+import zlib
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Set, Tuple
+import numpy as np
+
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_BRACKETED_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_NOISE_WORDS = frozenset(["sponsored", "ad"])
+_VARIANT_WORDS = frozenset(["men", "mens", "women", "womens", "boys", "girls", "kids", "unisex"])
+
+
+def normalize_name(text: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Reduce a product name to comparable text and its model tokens.
+
+    Bracketed variant details like "(Bold Black)" are dropped from the
+    text. Tokens containing digits ("141", "128gb", "510bt") and audience
+    words ("men", "women") are kept separately, because names that
+    differ in them are different products.
+    """
+    text = text.lower()
+    tokens = _WORD_PATTERN.findall(text)
+    model = frozenset(
+        token for token in tokens
+        if token in _VARIANT_WORDS or any(c.isdigit() for c in token)
+    )
+    words = [word for word in _WORD_PATTERN.findall(_BRACKETED_PATTERN.sub(" ", text)) if word not in _NOISE_WORDS]
+    return " ".join(words), model
+
+
+class MinHasher:
+    """
+    MinHash over character shingles of normalized text.
+
+    The fraction of equal signature slots between two texts estimates
+    the Jaccard similarity of their shingle sets.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._shingle_size = shingle_size
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+
+    def shingles(self, text: str) -> List[int]:
+        """Hashed character shingles of normalized text."""
+        size = self._shingle_size
+        grams = {text} if len(text) <= size else {text[i:i + size] for i in range(len(text) - size + 1)}
+        return [zlib.crc32(g.encode("utf-8")) for g in grams if g]
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature with ``num_perm`` slots."""
+        return self.signatures([text])[0]
+
+    def signatures(self, texts: List[str]) -> np.ndarray:
+        """
+        MinHash signatures for many texts in one vectorized pass.
+
+        Args:
+            texts: Normalized texts
+
+        Returns:
+            Matrix of shape (len(texts), num_perm); empty texts get
+            a sentinel signature that matches nothing real
+        """
+        result = np.full((len(texts), self.num_perm), _MERSENNE_PRIME, dtype=np.uint64)
+        hashed = [self.shingles(text) for text in texts]
+        lengths = np.fromiter((len(h) for h in hashed), dtype=np.int64, count=len(hashed))
+        rows = np.flatnonzero(lengths)
+
+        if rows.size:
+            flat = np.fromiter((value for h in hashed for value in h), dtype=np.uint64, count=int(lengths.sum()))
+            permuted = (self._a * flat + self._b) % _MERSENNE_PRIME
+            starts = np.concatenate(([0], np.cumsum(lengths[rows])[:-1]))
+            result[rows] = np.minimum.reduceat(permuted, starts, axis=1).T
+
+        return result
+
+
+class LSHIndex:
+    """
+    Banded locality-sensitive hash index over MinHash signatures.
+
+    Signatures are split into bands; items sharing any whole band are
+    candidates, which are then verified by estimated similarity.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16):
+        self._bands = bands
+        self._rows = num_perm // bands
+        self._buckets: Dict[Tuple[int, bytes], Set[Hashable]] = {}
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        rows = self._rows
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(self._bands)]
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        """Index a signature under a key."""
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a key from the index."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def query(self, signature: np.ndarray, threshold: float) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed keys similar to a signature.
+
+        Args:
+            signature: MinHash signature
+            threshold: Minimum estimated Jaccard similarity
+
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        candidates: Set[Hashable] = set()
+        for band_key in self._band_keys(signature):
+            candidates |= self._buckets.get(band_key, set())
+
+        if not candidates:
+            return []
+
+        keys = list(candidates)
+        similarities = (np.stack([self._signatures[key] for key in keys]) == signature).mean(axis=1)
+        order = np.argsort(-similarities, kind="stable")
+
+        return [(keys[i], float(similarities[i])) for i in order if similarities[i] >= threshold]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+
+minhasher = MinHasher()
+
+
+def near_duplicate_groups(names: List[str], threshold: float = 0.8) -> np.ndarray:
+    """
+    Group near-identical product names.
+
+    Args:
+        names: Product names in page order
+        threshold: Minimum estimated Jaccard similarity of shingles
+
+    Returns:
+        Array mapping each name to the position of its group's first member
+    """
+    normalized = [normalize_name(name or "") for name in names]
+    signatures = minhasher.signatures([text for text, _ in normalized])
+    index = LSHIndex(minhasher.num_perm)
+    exact: Dict[Tuple[str, FrozenSet[str]], int] = {}
+    groups: List[int] = []
+
+    for position, key in enumerate(normalized):
+        text, model = key
+
+        if not text:
+            groups.append(position)
+            continue
+
+        if key in exact:
+            groups.append(exact[key])
+            continue
+
+        signature = signatures[position]
+        group = position
+        for match, _ in index.query(signature, threshold):
+            if normalized[match][1] == model:
+                group = groups[match]
+                break
+
+        exact[key] = group
+        index.add(position, signature)
+        groups.append(group)
+
+    return np.asarray(groups, dtype=np.int64)
@@ -0,0 +1,278 @@
+"""
+Price normalization engine.
+Detects currency and number locale, and converts prices through an offline rates table.
+"""
+
+import json
+import re
+from functools import lru_cache
+from collections import Counter
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+import numpy as np
+
+
+# Units of each currency per 1 USD; used when the rates file is missing
+DEFAULT_RATES: Dict[str, float] = {
+    "USD": 1.0, "INR": 83.2, "EUR": 0.92, "GBP": 0.79, "JPY": 149.5,
+    "AED": 3.6725, "CAD": 1.36, "AUD": 1.52, "SGD": 1.34
+}
+
+CURRENCY_SYMBOLS: Dict[str, str] = {
+    "₹": "INR", "rs": "INR", "rs.": "INR", "inr": "INR",
+    "$": "USD", "us$": "USD", "usd": "USD",
+    "€": "EUR", "eur": "EUR",
+    "£": "GBP", "gbp": "GBP",
+    "¥": "JPY", "jpy": "JPY",
+    "aed": "AED", "cad": "CAD", "c$": "CAD", "aud": "AUD", "a$": "AUD",
+    "sgd": "SGD", "s$": "SGD",
+    "rupee": "INR", "rupees": "INR", "dollar": "USD", "dollars": "USD", "euro": "EUR", "euros": "EUR"
+}
+
+DISPLAY_SYMBOLS: Dict[str, str] = {"INR": "₹", "USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
+
+# Currencies whose locales usually write 1.299,00
+_COMMA_DECIMAL_CURRENCIES = frozenset(["EUR"])
+
+_CURRENCY_PATTERN = re.compile(
+    r"\b(?:us|c|a|s)\$|\brs\.?|\b(?:inr|usd|eur|gbp|jpy|aed|cad|aud|sgd)\b"
+    r"|\b(?:rupee|dollar|euro)s?\b|[₹$€£¥]"
+)
+_AMOUNT_PATTERN = re.compile(
+    r"\d{1,3}(?:[ \u00a0\u202f']\d{3})+(?:[.,]\d{1,2})?(?![\d.,])"
+    r"|\d(?:[\d.,]*\d)?"
+)
+_RANGE_GAP_PATTERN = re.compile(r"^\s*\D{0,4}?\s*(?:-|–|—|to)\s*\D{0,4}\s*$")
+# Indian number words after an amount: "₹1.2 lakh", "2 crore"
+_MULTIPLIER_PATTERN = re.compile(r"\s*(lakhs?|lacs?|crores?|cr)\b")
+_MULTIPLIERS = {"lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lacs": 1e5, "crore": 1e7, "crores": 1e7, "cr": 1e7}
+_GROUP_SPACES = str.maketrans("", "", " \u00a0\u202f'")
+
+
+class ParsedPrice(NamedTuple):
+    """Amount in its own currency, with the upper bound of a price range if any."""
+
+    amount: float
+    currency: str
+    upper: Optional[float] = None
+
+
+def _to_number(token: str, currency: str) -> float:
+    """Interpret grouping and decimal separators for one numeric token."""
+    token = token.translate(_GROUP_SPACES)
+
+    if "," in token and "." in token:
+        decimal = "," if token.rfind(",") > token.rfind(".") else "."
+        group = "." if decimal == "," else ","
+        token = token.replace(group, "").replace(decimal, ".")
+
+    elif "," in token:
+        parts = token.split(",")
+        # "1,299" / "1,29,999" group thousands; "12,50" is a decimal comma
+        if len(parts) == 2 and len(parts[1]) in (1, 2):
+            token = token.replace(",", ".")
+        else:
+            token = token.replace(",", "")
+
+    elif "." in token:
+        parts = token.split(".")
+        if len(parts) > 2 or (len(parts[1]) == 3 and currency in _COMMA_DECIMAL_CURRENCIES):
+            token = token.replace(".", "")
+
+    try:
+        return float(token)
+    except ValueError:
+        return 0.0
+
+
+@lru_cache(maxsize=8192)
+def parse_price_text(text: str, default_currency: str = "INR") -> Optional[ParsedPrice]:
+    """
+    Parse one scraped price string.
+
+    Handles currency symbols and codes on either side ("₹1,299",
+    "1.299,00 €", "USD 15"), Indian and European digit grouping, lakh
+    and crore words ("₹1.2 lakh"), and ranges ("₹499 - ₹999"), which
+    resolve to their lower bound. When several numbers appear ("2 for
+    ₹500"), the one next to the currency is the price.
+
+    Args:
+        text: Raw price text
+        default_currency: Currency assumed when none is written
+
+    Returns:
+        ParsedPrice, or None if the text holds no amount
+    """
+    lowered = text.lower()
+    currency_match = _CURRENCY_PATTERN.search(lowered)
+    currency = CURRENCY_SYMBOLS.get(currency_match.group(), default_currency) if currency_match else default_currency
+
+    amounts = list(_AMOUNT_PATTERN.finditer(lowered))
+    if not amounts:
+        return None
+
+    first = 0
+    if currency_match:
+        # The price is the amount next to the currency: "2 for ₹500" costs 500
+        first = min(
+            range(len(amounts)),
+            key=lambda i: max(amounts[i].start() - currency_match.end(), currency_match.start() - amounts[i].end(), 0)
+        )
+
+    amount = _to_number(amounts[first].group(), currency)
+    scale = _multiplier(lowered, amounts[first].end())
+    upper = None
+
+    if first + 1 < len(amounts) and _RANGE_GAP_PATTERN.match(lowered[amounts[first].end():amounts[first + 1].start()]):
+        upper_scale = _multiplier(lowered, amounts[first + 1].end())
+        # "₹1.2 - 1.5 lakh": the unit after the range applies to both ends
+        scale = scale if scale != 1.0 else upper_scale
+        upper = _to_number(amounts[first + 1].group(), currency) * upper_scale
+
+    return ParsedPrice(amount * scale, currency, upper)
+
+
+def _multiplier(text: str, position: int) -> float:
+    match = _MULTIPLIER_PATTERN.match(text, position)
+    return _MULTIPLIERS[match.group(1)] if match else 1.0
+
+
+def detect_currency(text: str) -> Optional[str]:
+    """Currency code written in a text ("under $50" -> "USD"), or None."""
+    match = _CURRENCY_PATTERN.search(text.lower())
+    return CURRENCY_SYMBOLS.get(match.group()) if match else None
+
+
+def currency_symbol(currency: str) -> str:
+    """Display prefix for a currency code, e.g. "₹" or "AED "."""
+    return DISPLAY_SYMBOLS.get(currency, f"{currency} ")
+
+
+class PriceParser:
+    """
+    Parses prices into one base currency.
+    Unparseable or missing prices become 0, matching the rest of the app.
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        base_currency: str = "INR",
+        default_currency: Optional[str] = None
+    ):
+        self.rates = {code.upper(): float(rate) for code, rate in (rates or DEFAULT_RATES).items() if rate}
+        self.base_currency = base_currency.upper()
+        self.default_currency = (default_currency or base_currency).upper()
+
+    @classmethod
+    def from_file(cls, path: Optional[str], base_currency: str = "INR") -> "PriceParser":
+        """Build a parser from a JSON rates file, falling back to DEFAULT_RATES."""
+        rates = None
+        if path:
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    rates = json.load(handle).get("rates")
+            except (OSError, ValueError, AttributeError):
+                rates = None
+        return cls(rates, base_currency)
+
+    def convert(self, amount: float, currency: str, target: Optional[str] = None) -> float:
+        """Convert an amount into the target (default: base) currency; unknown currencies pass through."""
+        target = target or self.base_currency
+        if currency == target or currency not in self.rates or target not in self.rates:
+            return amount
+        return amount * self.rates[target] / self.rates[currency]
+
+    def detect(self, value) -> Optional[ParsedPrice]:
+        """Parse a value without converting it."""
+        if value is None or value == "" or value == "N/A":
+            return None
+        if isinstance(value, (int, float)):
+            return ParsedPrice(float(value), self.default_currency)
+        return parse_price_text(str(value), self.default_currency)
+
+    def parse(self, value) -> float:
+        """
+        Parse a single price into the base currency.
+
+        Args:
+            value: Price text or number
+
+        Returns:
+            Price in base currency, or 0.0 if it cannot be parsed
+        """
+        parsed = self.detect(value)
+        return self.convert(parsed.amount, parsed.currency) if parsed else 0.0
+
+    def format(self, amount: float, currency: Optional[str] = None) -> str:
+        """Display an amount in a currency (default: base), e.g. "₹1,299" or "$9.99"."""
+        currency = currency or self.base_currency
+        decimals = 0 if currency in ("INR", "JPY") or float(amount).is_integer() else 2
+        return f"{currency_symbol(currency)}{amount:,.{decimals}f}"
+
+    def _parse_distinct(self, values: Iterable) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parse each distinct price string of a column once.
+
+        Returns:
+            Tuple of (inverse, amounts, currencies, counts): ``inverse``
+            maps rows to distinct strings, the other arrays hold one
+            entry per distinct string ("" currency where unparseable)
+        """
+        texts = np.array(["" if value is None else str(value) for value in values], dtype=str)
+        distinct, inverse, counts = np.unique(texts, return_inverse=True, return_counts=True)
+        parsed = [self.detect(text) for text in distinct.tolist()]
+
+        amounts = np.array([price.amount if price else 0.0 for price in parsed], dtype=np.float64)
+        currencies = np.array([price.currency if price else "" for price in parsed], dtype=str)
+        return inverse, amounts, currencies, counts
+
+    def page_currency(self, values: Iterable) -> str:
+        """
+        Currency most prices in a column are written in.
+
+        Args:
+            values: Price values in row order
+
+        Returns:
+            Most common detected currency, or the default currency if
+            nothing parses
+        """
+        _, _, currencies, counts = self._parse_distinct(values)
+        totals = Counter()
+        for code, count in zip(currencies.tolist(), counts.tolist()):
+            if code:
+                totals[code] += count
+        return totals.most_common(1)[0][0] if totals else self.default_currency
+
+    def parse_column(self, values: Iterable, currency: Optional[str] = None) -> np.ndarray:
+        """
+        Parse a column of prices into amounts in one currency.
+
+        Scraped columns repeat a small set of strings, so each distinct
+        string goes through the text parser once. Currency lookup and
+        scaling are array operations over the distinct values, and the
+        result is scattered back to rows by index.
+
+        Args:
+            values: Price values in row order
+            currency: Target currency, default the base currency
+
+        Returns:
+            Float array of prices in the target currency (0.0 where unparseable)
+        """
+        inverse, amounts, currencies, _ = self._parse_distinct(values)
+        if not amounts.size:
+            return np.zeros(0)
+
+        codes, code_index = np.unique(currencies, return_inverse=True)
+        factors = np.array([self.convert(1.0, code, currency) if code else 0.0 for code in codes.tolist()])
+        return (amounts * factors[code_index])[inverse]
+
+
+@lru_cache()
+def get_price_parser() -> PriceParser:
+    """Shared parser configured from application settings."""
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    return PriceParser.from_file(settings.exchange_rates_path, settings.price_base_currency)
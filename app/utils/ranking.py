@@ -0,0 +1,42 @@
+"""
+Top-k selection helpers.
+Rank only the items that will actually be kept.
+"""
+
+import heapq
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def top_k(
+    items: List[T],
+    key: Callable[[T], float],
+    k: Optional[int] = None,
+    reverse: bool = False
+) -> List[T]:
+    """
+    Return the first k items of ``sorted(items, key=key, reverse=reverse)``.
+
+    Keys are computed once per item. When k is smaller than the list,
+    a heap selection costs O(n log k) instead of a full sort.
+
+    Args:
+        items: Items to rank
+        key: Sort key function
+        k: Number of items to keep, or None for all
+        reverse: Rank highest keys first
+
+    Returns:
+        Ranked items, at most k long
+    """
+    keys = [key(item) for item in items]
+
+    if k is None or k >= len(items):
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    elif reverse:
+        order = heapq.nlargest(k, range(len(items)), key=keys.__getitem__)
+    else:
+        order = heapq.nsmallest(k, range(len(items)), key=keys.__getitem__)
+
+    return [items[i] for i in order]
@@ -0,0 +1,173 @@
+"""
+Product spec extraction.
+Compiled extractors for RAM, storage, screen size and battery capacity.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+
+
+SPEC_FIELDS = ("ram", "storage", "screen", "battery")
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_RAM_PATTERNS = (
+    re.compile(_NUMBER + r"\s*gb\+?\s*(?:(?:lp)?ddr\w*\s*)?ram\b"),
+    re.compile(r"\bram\s*[:\-]?\s*" + _NUMBER + r"\s*gb\b"),
+)
+_STORAGE_PATTERNS = (
+    re.compile(_NUMBER + r"\s*(gb|tb)\+?\s*(?:internal\s*|ufs\s*[\d.]*\s*|nvme\s*)?(?:storage|rom|ssd|hdd|emmc|memory)\b"),
+    re.compile(r"\b(?:storage|rom|ssd)\s*[:\-]?\s*" + _NUMBER + r"\s*(gb|tb)\b"),
+)
+# "8GB+128GB", "8 GB/256 GB", "(8GB, 128GB)": RAM then storage
+_PAIR_PATTERN = re.compile(_NUMBER + r"\s*gb\s*[+/,]\s*" + _NUMBER + r"\s*(gb|tb)\b")
+_CAPACITY_PATTERN = re.compile(_NUMBER + r"\s*(gb|tb)\b")
+_SCREEN_PATTERN = re.compile(_NUMBER + r"\s*-?\s*(?:inch(?:es)?\b|\"|″|”)")
+_BATTERY_PATTERN = re.compile(r"(\d{3,5})\s*mah\b")
+
+# RAM tops out well below the smallest storage sizes sold today
+_MAX_RAM_GB = 24.0
+_MIN_STORAGE_GB = 32.0
+
+_AT_LEAST_PATTERN = re.compile(r"(?:at\s*least|minimum|min)\s*$")
+_OR_MORE_PATTERN = re.compile(r"^\s*(?:\+|or more|and above|or above|plus)")
+_SCREEN_TOLERANCE = 0.02
+
+
+class SpecBound(NamedTuple):
+    """Constraint on one spec column, e.g. ``ram eq 8``."""
+
+    field: str
+    op: str
+    value: float
+
+
+def _gigabytes(value: str, unit: str) -> float:
+    return float(value) * (1024 if unit == "tb" else 1)
+
+
+@lru_cache(maxsize=8192)
+def extract_specs(text: str) -> Tuple[float, float, float, float]:
+    """
+    Extract specs from lowercased product text.
+
+    Args:
+        text: Lowercased name and extra text
+
+    Returns:
+        Tuple of (ram GB, storage GB, screen inches, battery mAh),
+        zero where a spec is not mentioned
+    """
+    ram = storage = screen = battery = 0.0
+
+    for pattern in _RAM_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            ram = float(match.group(1))
+            break
+
+    for pattern in _STORAGE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            storage = _gigabytes(match.group(1), match.group(2))
+            break
+
+    pair = _PAIR_PATTERN.search(text)
+    if pair and float(pair.group(1)) <= _MAX_RAM_GB:
+        ram = ram or float(pair.group(1))
+        storage = storage or _gigabytes(pair.group(2), pair.group(3))
+
+    if not storage:
+        for match in _CAPACITY_PATTERN.finditer(text):
+            size = _gigabytes(match.group(1), match.group(2))
+            if size >= _MIN_STORAGE_GB:
+                storage = size
+                break
+
+    match = _SCREEN_PATTERN.search(text)
+    if match:
+        screen = float(match.group(1))
+
+    match = _BATTERY_PATTERN.search(text)
+    if match:
+        battery = float(match.group(1))
+
+    return ram, storage, screen, battery
+
+
+def _minimum_op(text: str, match: "re.Match") -> str:
+    before, after = text[:match.start()], text[match.end():]
+    if "+" in match.group(0) or _AT_LEAST_PATTERN.search(before) or _OR_MORE_PATTERN.match(after):
+        return "ge"
+    return "eq"
+
+
+def parse_spec_bounds(text: str) -> Tuple[List[SpecBound], str]:
+    """
+    Find spec constraints in a lowercased query.
+
+    "8gb ram" means exactly 8 GB and "8gb+ ram" or "at least 8gb ram"
+    at least 8 GB; a bare "128gb" is storage and a bare "8gb" RAM.
+    Screen sizes match within 2% and battery sizes are minimums.
+
+    Args:
+        text: Lowercased query text
+
+    Returns:
+        Tuple of (bounds, text with the spec mentions blanked out), so
+        numbers like "8" in "8gb" are not mistaken for prices or limits
+    """
+    bounds: List[SpecBound] = []
+    spans: List[Tuple[int, int]] = []
+
+    def claim(field: str, op: str, value: float, match: "re.Match") -> None:
+        if any(start < match.end() and match.start() < end for start, end in spans):
+            return
+        if all(bound.field != field for bound in bounds):
+            bounds.append(SpecBound(field, op, value))
+        spans.append(match.span())
+
+    for pattern in _RAM_PATTERNS:
+        for match in pattern.finditer(text):
+            claim("ram", _minimum_op(text, match), float(match.group(1)), match)
+
+    for pattern in _STORAGE_PATTERNS:
+        for match in pattern.finditer(text):
+            claim("storage", _minimum_op(text, match), _gigabytes(match.group(1), match.group(2)), match)
+
+    for match in _CAPACITY_PATTERN.finditer(text):
+        size = _gigabytes(match.group(1), match.group(2))
+        field = "storage" if size >= _MIN_STORAGE_GB else "ram"
+        claim(field, _minimum_op(text, match), size, match)
+
+    for match in _SCREEN_PATTERN.finditer(text):
+        op = "ge" if _minimum_op(text, match) == "ge" else "near"
+        claim("screen", op, float(match.group(1)), match)
+
+    for match in _BATTERY_PATTERN.finditer(text):
+        claim("battery", "ge", float(match.group(1)), match)
+
+    for start, end in spans:
+        text = text[:start] + " " * (end - start) + text[end:]
+
+    return bounds, text
+
+
+def screen_tolerance(value: float) -> float:
+    """Allowed difference when matching a screen size, in inches."""
+    return value * _SCREEN_TOLERANCE
+
+
+def describe_spec(field: str, op: str, value: float) -> str:
+    """Human-readable spec constraint, e.g. "8GB+ RAM"."""
+    amount = f"{value:g}"
+    plus = "+" if op == "ge" else ""
+
+    if field == "ram":
+        return f"{amount}GB{plus} RAM"
+    if field == "storage":
+        size = f"{value / 1024:g}TB" if value >= 1024 and value % 1024 == 0 else f"{amount}GB"
+        return f"{size}{plus} storage"
+    if field == "screen":
+        return f"{amount}\"{plus} screen"
+    return f"{amount}mAh{plus} battery"
@@ -0,0 +1,268 @@
+"""
+Fuzzy token normalization for English and Hinglish queries.
+Uses a SymSpell-style precomputed deletion index.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from app.utils.keywords import KEYWORD_TABLES
+
+
+DICTIONARY_PATH = Path(__file__).resolve().parents[2] / "data" / "english_words.txt"
+
+
+HINGLISH_VOCABULARY: List[str] = [
+    "sasta", "saste", "sasti", "mehnga", "mehngi", "mehnge", "accha", "acchi",
+    "dikhao", "dikha", "batao", "bata", "chahiye", "mujhe", "kitne", "kitna",
+    "kaise", "kaunsa", "konsa", "wala", "wali", "sabse", "shukriya", "dhanyawad",
+    "namaste", "alvida", "theek", "upar", "niche", "kharidna", "lena", "daam"
+]
+
+SHOPPING_VOCABULARY: List[str] = [
+    "cheapest", "lowest", "highest", "rated", "rating", "ratings", "review", "reviews",
+    "products", "items", "deals", "offer", "offers", "discount", "discounts", "price",
+    "prices", "hello", "thanks", "compare", "comparison", "between", "first", "second",
+    "third", "phones", "mobiles", "laptops", "headphones", "earphones", "watches",
+    "shirts", "shoes", "books", "cameras", "tablets", "speakers", "chargers", "covers",
+    "summarize", "summary", "expensive", "premium", "budget", "popular", "recommend",
+    "suggest", "please", "which", "better", "should", "would", "could", "there",
+    "where", "these", "those", "about", "quality", "battery", "storage", "screen",
+    "display", "memory", "colour", "color", "order", "store", "value", "money",
+    "under", "above", "below", "worth", "buying", "features", "details", "options",
+    "shows", "showing", "cases", "bags"
+]
+
+TOKEN_ALIASES: Dict[str, str] = {
+    "thnx": "thanks", "thx": "thanks", "thanx": "thanks", "tnx": "thanks",
+    "tysm": "thanks", "helo": "hello", "hllo": "hello", "plz": "please",
+    "pls": "please", "cmpare": "compare",
+    "mehenga": "mehnga", "mehanga": "mehnga", "acha": "accha"
+}
+
+_WORD_PATTERN = re.compile(r"[a-z]+|[^a-z]+")
+_REPEAT_PATTERN = re.compile(r"([a-z])\1{2,}")
+# Inflections stripped before a dictionary lookup: (suffix, replacement)
+_SUFFIXES = (
+    ("ies", "y"), ("es", ""), ("s", ""), ("ed", ""), ("ed", "e"), ("ing", ""), ("ing", "e"),
+    ("ier", "y"), ("er", ""), ("er", "e"), ("iest", "y"), ("est", ""), ("est", "e"),
+    ("ily", "y"), ("ly", "")
+)
+
+
+def load_word_list(path: Path) -> FrozenSet[str]:
+    """
+    Read a whitespace-separated word list, skipping ``#`` comment lines.
+
+    Frequency lists in ``word count`` format load as well; the counts
+    are skipped.
+
+    Args:
+        path: Word list file
+
+    Returns:
+        Lowercased words, empty if the file cannot be read
+    """
+    try:
+        with open(path, encoding="utf-8") as source:
+            return frozenset(
+                word.lower()
+                for line in source
+                if not line.lstrip().startswith("#")
+                for word in line.split()
+                if not word.isdigit()
+            )
+    except OSError:
+        return frozenset()
+
+
+def _osa_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, short-circuited above limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = current[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+            row_min = min(row_min, current[j])
+        if row_min > limit:
+            return limit + 1
+        previous2, previous = previous, current
+
+    return previous[-1]
+
+
+class SpellingNormalizer:
+    """
+    SymSpell-style corrector over a fixed vocabulary.
+
+    Every vocabulary word is indexed under all of its deletions up to
+    ``max_distance``. A lookup only generates deletions of the input
+    token and intersects them with the index, so it never scans the
+    whole vocabulary. Tokens found in the general dictionary, directly
+    or after stripping a plural or verb suffix, are real words and are
+    never rewritten ("sneakers" must not become "speakers").
+    """
+
+    def __init__(
+        self,
+        vocabulary: Dict[str, int],
+        aliases: Optional[Dict[str, str]] = None,
+        dictionary: Iterable[str] = (),
+        max_distance: int = 2,
+        min_length: int = 5,
+        cache_size: int = 4096
+    ):
+        self._words = dict(vocabulary)
+        self._aliases = dict(aliases or {})
+        self._dictionary = frozenset(dictionary)
+        self._max_distance = max_distance
+        self._min_length = min_length
+        self._cache_size = cache_size
+        self._cache: Dict[str, str] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+
+        for word in self._words:
+            for variant in self._deletions(word, max_distance):
+                self._deletes.setdefault(variant, set()).add(word)
+
+    @staticmethod
+    def _deletions(word: str, max_distance: int) -> Set[str]:
+        variants = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            frontier = {
+                candidate[:i] + candidate[i + 1:]
+                for candidate in frontier
+                for i in range(len(candidate))
+            }
+            variants |= frontier
+        return variants
+
+    def is_known(self, token: str) -> bool:
+        """
+        Whether a token is a dictionary word or an inflection of one.
+
+        Plurals, verb forms, comparatives and -ly adverbs are derived,
+        with a doubled final consonant undone ("bigger", "shopping").
+        """
+        if token in self._dictionary:
+            return True
+
+        for suffix, replacement in _SUFFIXES:
+            if len(token) <= len(suffix) + 2 or not token.endswith(suffix):
+                continue
+            stem = token[:len(token) - len(suffix)] + replacement
+            if stem in self._dictionary:
+                return True
+            if not replacement and stem[-1] == stem[-2] and stem[:-1] in self._dictionary:
+                return True
+
+        return False
+
+    def _allowed_distance(self, token: str) -> int:
+        if len(token) < self._min_length:
+            return 0
+        if len(token) < 8:
+            return min(1, self._max_distance)
+        return self._max_distance
+
+    def correct(self, token: str) -> str:
+        """
+        Correct a single lowercase token.
+
+        Args:
+            token: Lowercase alphabetic token
+
+        Returns:
+            Closest vocabulary word, or the token unchanged
+        """
+        cached = self._cache.get(token)
+        if cached is not None:
+            return cached
+
+        result = self._lookup(token)
+
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[token] = result
+        return result
+
+    def _lookup(self, token: str) -> str:
+        if token in self._words:
+            return token
+
+        squeezed = _REPEAT_PATTERN.sub(r"\1\1", token)
+        if squeezed in self._words:
+            return squeezed
+
+        alias = self._aliases.get(squeezed)
+        if alias:
+            return alias
+
+        if self.is_known(token):
+            return token
+
+        limit = self._allowed_distance(squeezed)
+        if not limit:
+            return token
+
+        candidates: Set[str] = set()
+        for variant in self._deletions(squeezed, limit):
+            candidates |= self._deletes.get(variant, set())
+
+        best: Optional[str] = None
+        best_key = (limit + 1, 0, "")
+
+        for word in candidates:
+            if abs(len(word) - len(squeezed)) > limit:
+                continue
+            distance = _osa_distance(squeezed, word, limit)
+            key = (distance, -self._words[word], word)
+            if distance <= limit and key < best_key:
+                best, best_key = word, key
+
+        return best or token
+
+    def normalize(self, text: str) -> str:
+        """
+        Correct every alphabetic token in lowercase text.
+
+        Args:
+            text: Lowercased query text
+
+        Returns:
+            Text with misspelled tokens replaced
+        """
+        return "".join(
+            self.correct(piece) if "a" <= piece[0] <= "z" else piece
+            for piece in _WORD_PATTERN.findall(text)
+        )
+
+
+def _build_vocabulary(groups: Iterable[Iterable[str]]) -> Dict[str, int]:
+    vocabulary: Dict[str, int] = {}
+    for weight, words in enumerate(groups, 1):
+        for phrase in words:
+            for word in phrase.lower().split():
+                vocabulary[word] = max(vocabulary.get(word, 0), weight)
+    return vocabulary
+
+
+spelling_normalizer = SpellingNormalizer(
+    _build_vocabulary([
+        SHOPPING_VOCABULARY,
+        HINGLISH_VOCABULARY,
+        [keyword for keywords in KEYWORD_TABLES.values() for keyword in keywords]
+    ]),
+    aliases=TOKEN_ALIASES,
+    dictionary=load_word_list(DICTIONARY_PATH)
+)
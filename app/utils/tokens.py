@@ -0,0 +1,78 @@
+"""
+Local token counting for prompt budgets.
+Uses tiktoken when installed, otherwise an approximate regex estimate.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+    TOKENIZER_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    TOKENIZER_AVAILABLE = False
+
+
+_PIECE_PATTERN = re.compile(r"[^\W\d_]+|\d+|\S", re.UNICODE)
+
+
+def _estimate(piece: str) -> int:
+    if not piece.isascii():
+        # Non-Latin scripts take several UTF-8 bytes per character and BPE
+        # vocabularies cover them poorly; about one token per two bytes
+        return math.ceil(len(piece.encode("utf-8")) / 2)
+    if piece.isdigit():
+        # BPE vocabularies split numbers into groups of up to three digits
+        return math.ceil(len(piece) / 3)
+    return math.ceil(len(piece) / 4)
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens a text takes in a prompt.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Exact cl100k count with tiktoken; otherwise an approximation meant
+        to err high, which can still be off for unusual text
+    """
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return sum(_estimate(piece) for piece in _PIECE_PATTERN.findall(text))
+
+
+def truncate_tokens(text: str, limit: int) -> str:
+    """
+    Cut a text down to at most ``limit`` tokens.
+
+    Args:
+        text: Text to shorten
+        limit: Token limit
+
+    Returns:
+        The longest prefix that fits, ending on a whole token
+    """
+    if limit <= 0 or not text:
+        return ""
+    if _ENCODING is not None:
+        tokens = _ENCODING.encode(text, disallowed_special=())
+        return text if len(tokens) <= limit else _ENCODING.decode(tokens[:limit])
+
+    used = 0
+    end = 0
+    for match in _PIECE_PATTERN.finditer(text):
+        used += _estimate(match.group())
+        if used > limit:
+            break
+        end = match.end()
+    else:
+        return text
+    return text[:end]
@@ -11,6 +11,9 @@
 
     class Config {
         static API_URL = "http://127.0.0.1:8080/chat";
+        static QUERY_URL = "http://127.0.0.1:8080/products/query";
+        static FACETS_URL = "http://127.0.0.1:8080/products/facets";
+        static MATCH_URL = "http://127.0.0.1:8080/products/match";
         static VERSION = "8.0.0";
         static MAX_ITEMS = 50;
         static CACHE_DURATION = 5 * 60 * 1000;
@@ -569,11 +572,14 @@
     class APIClient {
         constructor() {
             this.baseUrl = Config.API_URL;
+            this.queryUrl = Config.QUERY_URL;
+            this.facetsUrl = Config.FACETS_URL;
+            this.matchUrl = Config.MATCH_URL;
             this.timeout = 30000;
         }
         
         async send(query, data) {
-            const payload = {
+            return this.post(this.baseUrl, {
                 query: query,
                 products: data.items,
                 page_url: data.page.url,
@@ -581,13 +587,27 @@
                 site_type: data.site.name,
                 page_type: data.site.category,
                 item_count: data.meta.count
-            };
-            
+            });
+        }
+        
+        async query(filters, data) {
+            return this.post(this.queryUrl, { ...filters, products: data.items });
+        }
+        
+        async facets(data) {
+            return this.post(this.facetsUrl, { products: data.items });
+        }
+        
+        async match(data) {
+            return this.post(this.matchUrl, { products: data.items, site: data.site.name });
+        }
+        
+        async post(url, payload) {
             const controller = new AbortController();
             const timeoutId = setTimeout(() => controller.abort(), this.timeout);
             
             try {
-                const response = await fetch(this.baseUrl, {
+                const response = await fetch(url, {
                     method: "POST",
                     headers: { "Content-Type": "application/json" },
                     body: JSON.stringify(payload),
@@ -1404,7 +1424,13 @@
             
             this.elements.actions.addEventListener("click", (e) => {
                 const btn = e.target.closest(".sb-quick-btn");
-                if (btn?.dataset.cmd) {
+                if (btn?.dataset.action === "facets") {
+                    this.showFacets();
+                } else if (btn?.dataset.action === "match") {
+                    this.showPriceMatch();
+                } else if (btn?.dataset.query) {
+                    this.runQuery(btn.textContent, JSON.parse(decodeURIComponent(btn.dataset.query)));
+                } else if (btn?.dataset.cmd) {
                     this.elements.input.value = btn.dataset.cmd;
                     this.send();
                 }
@@ -1471,8 +1497,10 @@
             if (meta.count > 0) {
                 actions.push({ label: "Show All", cmd: "show all products" });
                 actions.push({ label: "Best Deals", cmd: "best deals" });
-                actions.push({ label: "Cheapest", cmd: "cheapest products" });
-                actions.push({ label: "Top Rated", cmd: "top rated" });
+                actions.push({ label: "Cheapest", query: { sort_by: "price", sort_order: "asc", limit: 10 } });
+                actions.push({ label: "Top Rated", query: { sort_by: "rating", sort_order: "desc", limit: 10 } });
+                actions.push({ label: "Stats", action: "facets" });
+                actions.push({ label: "Other Sites", action: "match" });
             }
             
             if (page.type === PageType.PRODUCT) {
@@ -1482,7 +1510,12 @@
             actions.push({ label: "Help", cmd: "help" });
             
             this.elements.actions.innerHTML = actions
-                .map(a => `<button class="sb-quick-btn" data-cmd="${a.cmd}">${a.label}</button>`)
+                .map(a => {
+                    const attr = a.action ? `data-action="${a.action}"`
+                        : a.query ? `data-query="${encodeURIComponent(JSON.stringify(a.query))}"`
+                        : `data-cmd="${a.cmd}"`;
+                    return `<button class="sb-quick-btn" ${attr}>${a.label}</button>`;
+                })
                 .join("");
         }
         
@@ -1658,6 +1691,147 @@
             this.setLoading(false);
             this.elements.input.focus();
         }
+        
+        async runQuery(label, filters) {
+            if (this.isLoading) return;
+            
+            this.addMessage(label, "user");
+            this.setLoading(true);
+            this.showTyping();
+            
+            try {
+                this.currentData = this.scraper.scrape();
+                const response = await this.api.query(filters, this.currentData);
+                
+                this.hideTyping();
+                this.addMessage(this.formatQueryResult(label, response), "bot");
+                
+            } catch (error) {
+                this.hideTyping();
+                this.addMessage(this.buildCard({
+                    icon: '<circle cx="12" cy="12" r="10"/><line x1="12" y1="8" x2="12" y2="12"/><line x1="12" y1="16" x2="12.01" y2="16"/>',
+                    title: 'Connection Error',
+                    rows: [],
+                    footer: 'Unable to connect to the server. Please make sure the backend is running.',
+                    footerWarning: true
+                }), "bot");
+            }
+            
+            this.setLoading(false);
+        }
+        
+        async showFacets() {
+            if (this.isLoading) return;
+            
+            this.addMessage("Stats", "user");
+            this.setLoading(true);
+            this.showTyping();
+            
+            try {
+                this.currentData = this.scraper.scrape();
+                const facets = await this.api.facets(this.currentData);
+                
+                this.hideTyping();
+                this.addMessage(this.buildFacetsCard(facets), "bot");
+                
+            } catch (error) {
+                this.hideTyping();
+                this.addMessage(this.buildCard({
+                    icon: '<circle cx="12" cy="12" r="10"/><line x1="12" y1="8" x2="12" y2="12"/><line x1="12" y1="16" x2="12.01" y2="16"/>',
+                    title: 'Connection Error',
+                    rows: [],
+                    footer: 'Unable to connect to the server. Please make sure the backend is running.',
+                    footerWarning: true
+                }), "bot");
+            }
+            
+            this.setLoading(false);
+        }
+        
+        async showPriceMatch() {
+            if (this.isLoading) return;
+            
+            this.addMessage("Other Sites", "user");
+            this.setLoading(true);
+            this.showTyping();
+            
+            try {
+                this.currentData = this.scraper.scrape();
+                const response = await this.api.match(this.currentData);
+                
+                this.hideTyping();
+                this.addMessage(this.formatPriceMatches(response.matches || []), "bot");
+                
+            } catch (error) {
+                this.hideTyping();
+                this.addMessage(this.buildCard({
+                    icon: '<circle cx="12" cy="12" r="10"/><line x1="12" y1="8" x2="12" y2="12"/><line x1="12" y1="16" x2="12.01" y2="16"/>',
+                    title: 'Connection Error',
+                    rows: [],
+                    footer: 'Unable to connect to the server. Please make sure the backend is running.',
+                    footerWarning: true
+                }), "bot");
+            }
+            
+            this.setLoading(false);
+        }
+        
+        formatPriceMatches(matches) {
+            if (matches.length === 0) {
+                return "No matches yet. Open the same products on another site and ask again.";
+            }
+            
+            const lines = matches.map((m, i) => {
+                const best = m.offers[0];
+                const saving = m.savings > 0 ? ` (save Rs.${Math.round(m.savings).toLocaleString("en-IN")})` : "";
+                return `${i + 1}. **${m.product.name}** - ${best.site}: ${best.price}${saving}`;
+            });
+            
+            return `**Prices on other sites**\n\n${lines.join("\n")}`;
+        }
+        
+        buildFacetsCard(facets) {
+            const rupees = (value) => `Rs.${Math.round(value).toLocaleString("en-IN")}`;
+            const rows = [{ label: 'Items', value: facets.total }];
+            
+            if (facets.price_max > 0) {
+                rows.push({ label: 'Price range', value: `${rupees(facets.price_min)} - ${rupees(facets.price_max)}` });
+                rows.push({ label: 'Median price', value: rupees(facets.price_percentiles.p50) });
+            }
+            if (facets.rating_avg > 0) {
+                rows.push({ label: 'Avg rating', value: `${facets.rating_avg.toFixed(1)}★` });
+            }
+            
+            const busiest = (facets.price_histogram || []).reduce((a, b) => (b.count > (a?.count || 0) ? b : a), null);
+            if (busiest) {
+                rows.push({ label: 'Most items', value: `${busiest.label} (${busiest.count})` });
+            }
+            
+            const topCategory = Object.entries(facets.categories || {}).find(([name]) => name !== "other");
+            if (topCategory) {
+                rows.push({ label: 'Top category', value: `${topCategory[0].replace(/_/g, " ")} (${topCategory[1]})` });
+            }
+            
+            return this.buildCard({
+                icon: '<line x1="18" y1="20" x2="18" y2="10"/><line x1="12" y1="20" x2="12" y2="4"/><line x1="6" y1="20" x2="6" y2="14"/>',
+                title: 'Page Stats',
+                rows: rows
+            });
+        }
+        
+        formatQueryResult(label, response) {
+            const items = response.items || [];
+            if (items.length === 0) {
+                return "No matching products found on this page.";
+            }
+            
+            const lines = items.map((item, i) => {
+                const details = [item.price, item.rating ? `${item.rating}★` : ""].filter(Boolean).join(" | ");
+                return `${i + 1}. **${item.name}**${details ? ` - ${details}` : ""}`;
+            });
+            
+            return `**${label}** (${items.length} of ${response.total})\n\n${lines.join("\n")}`;
+        }
     }
 
     window.ShopBuddy = new UIManager();
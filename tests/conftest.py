@@ -0,0 +1,39 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from app.services.intent_service import IntentService
+from app.services.product_search import ProductSearchService
+from app.utils.bm25 import tokenize
+from app.utils.cache import LRUCache
+
+
+class StubEncoder:
+    """
+    Bag-of-words stand-in for the sentence transformer.
+    A shared bias dimension makes every pair of texts slightly similar, as real embeddings are.
+    """
+
+    dimensions = 64
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=64, normalize_embeddings=False):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dimensions + 1), dtype=np.float32)
+        vectors[:, 0] = 0.5
+        for row, text in enumerate(texts):
+            for token in tokenize(text):
+                vectors[row, 1 + zlib.crc32(token.encode()) % self.dimensions] += 1.0
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def semantic(monkeypatch):
+    """Run search in hybrid mode with the stub encoder."""
+    encoder = StubEncoder()
+    monkeypatch.setattr(IntentService(), "_model", encoder)
+    monkeypatch.setattr(ProductSearchService(), "_indexes", LRUCache(8))
+    return encoder
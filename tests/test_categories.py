@@ -0,0 +1,79 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.product_categorizer import ProductCategorizer
+from app.services.product_service import ProductService
+from app.services.query_service import QueryService
+from app.utils.keywords import keyword_matcher
+
+
+client = TestClient(app)
+
+
+def _items():
+    return [
+        {"id": 1, "name": "Redmi 13C 5G", "price": "₹11,499", "rating": "4.0"},
+        {"id": 2, "name": "Philips Mixer Grinder 750W", "price": "₹3,299", "rating": "4.5"},
+        {"id": 3, "name": "boAt Airdopes 141 earbuds", "price": "₹1,299", "rating": "4.1"},
+        {"id": 4, "name": "Samsung Galaxy M14", "price": "₹13,990", "rating": "4.3"},
+        {"id": 5, "name": "Realme Narzo phone cover", "price": "₹299", "rating": "3.8"},
+    ]
+
+
+def _filter(query):
+    service = ProductService()
+    plan = service.plan_filters(QueryService().analyze(query))
+    return [item["id"] for item in service.apply_filters(_items(), plan)]
+
+
+def test_phones_have_their_own_category():
+    """
+    Phones and phone accessories are told apart.
+    """
+    assert keyword_matcher.match("top 5 phones").category == "mobiles"
+    assert keyword_matcher.match("phone case").category == "mobile_accessories"
+    assert keyword_matcher.match("headphones").category == "mobile_accessories"
+
+
+def test_query_category_scopes_filter():
+    """
+    "top 5 phones" drops the mixer grinder and accessories, keeping rows with no category.
+    """
+    ids = _filter("top 5 phones")
+
+    assert 1 in ids and 4 in ids
+    assert 2 not in ids and 3 not in ids and 5 not in ids
+
+
+def test_other_category_is_filterable():
+    """
+    The "other" facet selects the uncategorized rows it counts.
+    """
+    facets = client.post("/products/facets", json={"products": _items()}).json()
+    other = facets["categories"]["other"]
+
+    response = client.post("/products/query", json={"products": _items(), "category": "other"})
+    ids = [item["id"] for item in response.json()["items"]]
+
+    assert len(ids) == other == 1
+    assert ids == [4]
+
+
+def test_failed_embedding_is_not_cached(semantic, monkeypatch):
+    """
+    A keyword guess made while the encoder is down is recomputed once it recovers.
+    """
+    categorizer = object.__new__(ProductCategorizer)
+    categorizer._initialize()
+    working = semantic.encode
+
+    def broken(texts, batch_size=64, normalize_embeddings=False):
+        raise RuntimeError("encoder down")
+
+    monkeypatch.setattr(semantic, "encode", broken)
+    assert categorizer.classify(["Realme Narzo 60x mobile"]) == ["mobiles"]
+    assert len(categorizer._cache) == 0
+
+    monkeypatch.setattr(semantic, "encode", working)
+    categorizer.classify(["Realme Narzo 60x mobile"])
+    assert len(categorizer._cache) == 1
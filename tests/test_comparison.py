@@ -0,0 +1,106 @@
+from app.models.enums import IntentType
+from app.services.comparison_service import ComparisonService
+from app.services.intent_service import IntentService
+from app.services.query_service import QueryService
+
+
+def _items():
+    return [
+        {"id": 1, "name": "boAt Airdopes 141 Bluetooth Earbuds", "price": "₹1,299", "rating": "4.1"},
+        {"id": 2, "name": "JBL Tune 230NC TWS Earbuds", "price": "₹5,999", "rating": "4.3"},
+        {"id": 3, "name": "Noise Buds VS104 Max", "price": "₹1,499", "rating": "3.9"},
+        {"id": 4, "name": "boAt Airdopes 141 Bluetooth Earbuds", "price": "₹1,299", "rating": "4.1"},
+        {"id": 5, "name": "Realme Buds T300", "price": "₹2,299", "rating": "4.2"},
+        {"id": 6, "name": "OnePlus Nord Buds 2r", "price": "₹1,999", "rating": "4.0"},
+    ]
+
+
+def _compared(query):
+    items = _items()
+    _, comparison = ComparisonService().answer(items, QueryService().analyze(query))
+    return [row["position"] for row in comparison["items"]]
+
+
+def test_numbered_references_are_page_positions():
+    """
+    "3 vs 4" compares the shopper's #3 and #4, duplicates included.
+    """
+    assert _compared("compare 3 vs 4") == [3, 4]
+    assert _compared("compare first vs last") == [1, 6]
+
+
+def test_open_picks_skip_duplicates():
+    """
+    "top 3" and the default pick skip the repeated listing but keep page numbers.
+    """
+    assert _compared("compare top 3") == [1, 2, 3]
+    assert _compared("compare top 4") == [1, 2, 3, 5]
+    assert _compared("compare under 2000") == [1, 3, 6]
+
+
+def test_render_uses_page_numbers():
+    """
+    The rendered table and winners name items by their page number.
+    """
+    items = _items()
+    text, _ = ComparisonService().answer(items, QueryService().analyze("compare first vs last"))
+
+    assert "6. **OnePlus Nord Buds 2r**" in text
+    assert "#5" not in text
+
+
+def test_leading_compare_beats_filter_rules():
+    """
+    A query starting with "compare" is a comparison even with "top N" or a price bound.
+    """
+    classify = IntentService().classify
+
+    assert classify("compare top 3")[0] == IntentType.PRODUCT_COMPARE.value
+    assert classify("compare phones under 20000")[0] == IntentType.PRODUCT_COMPARE.value
+    assert classify("top 3 phones")[0] == IntentType.PRODUCT_FILTER.value
+
+
+def _phones():
+    fillers = [{"id": i, "name": f"Filler {i}", "price": "₹999"} for i in range(1, 16)]
+    fillers[1] = {"id": 2, "name": "Apple iPhone 14 (128 GB)", "price": "₹58,999", "rating": "4.6"}
+    fillers[4] = {"id": 5, "name": "Apple iPhone 15 (128 GB)", "price": "₹69,999", "rating": "4.6"}
+    return fillers
+
+
+def test_model_numbers_are_names_not_positions():
+    """
+    "iphone 14 and 15" compares the two iPhones, not listings #14 and #15.
+    """
+    items = _phones()
+
+    for query in ("compare iphone 14 and 15", "iphone 14 vs iphone 15"):
+        _, comparison = ComparisonService().answer(items, QueryService().analyze(query))
+        assert [row["position"] for row in comparison["items"]] == [2, 5]
+
+    _, comparison = ComparisonService().answer(items, QueryService().analyze("compare #14 and #15"))
+    assert [row["position"] for row in comparison["items"]] == [14, 15]
+
+
+def test_unknown_name_is_not_found(semantic):
+    """
+    With embeddings every row scores above zero, but "sony" is still not on the page.
+    """
+    text, comparison = ComparisonService().answer(_items(), QueryService().analyze("boat vs sony"))
+
+    assert comparison is None
+    assert _compared("boat vs jbl") == [1, 2]
+
+
+def test_open_picks_keep_to_category():
+    """
+    "compare phones" on a mixed page leaves the accessories out.
+    """
+    items = [
+        {"id": 1, "name": "boAt Airdopes 141 earbuds", "price": "₹1,299"},
+        {"id": 2, "name": "Redmi 13C 5G", "price": "₹11,499"},
+        {"id": 3, "name": "Spigen tempered glass screen protector", "price": "₹499"},
+        {"id": 4, "name": "Realme Narzo 60x mobile", "price": "₹12,999"},
+    ]
+    _, comparison = ComparisonService().answer(items, QueryService().analyze("compare phones"))
+
+    assert [row["position"] for row in comparison["items"]] == [2, 4]
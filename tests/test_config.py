@@ -0,0 +1,23 @@
+from app.core.config import ModelRoute, Settings
+
+
+def test_model_routes_parse_entries():
+    """
+    Routes take three or four fields; the prompt budget defaults to PROMPT_TOKEN_BUDGET.
+    """
+    settings = Settings(llm_routes="fast=small:600:10:1500,balanced=large:1000:20", prompt_token_budget=6000)
+    routes = settings.model_routes
+
+    assert routes["fast"] == ModelRoute("small", 600, 10, 1500)
+    assert routes["balanced"] == ModelRoute("large", 1000, 20, 6000)
+    assert routes["quality"].model == settings.groq_model
+
+
+def test_malformed_routes_are_skipped():
+    """
+    A typo in one entry drops that entry instead of raising.
+    """
+    settings = Settings(llm_routes="fast=x:abc:10, bad, =y:1:2,zero=z:0:5,ok=small:600:10,")
+    routes = settings.model_routes
+
+    assert set(routes) == {"quality", "ok"}
@@ -0,0 +1,67 @@
+import numpy as np
+
+from app.services.embedding_store import EmbeddingStore
+
+
+class CountingEncoder:
+    """Encoder recording which texts reached it."""
+
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, texts):
+        self.seen.extend(texts)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    """
+    A second store on the same file serves earlier vectors without encoding.
+    """
+    path = str(tmp_path / "embeddings.sqlite3")
+    encoder = CountingEncoder()
+    first = EmbeddingStore(path, namespace="model-a").encode(["boat earbuds", "jbl speaker"], encoder)
+
+    encoder.seen.clear()
+    second = EmbeddingStore(path, namespace="model-a").encode(["jbl speaker", "boat earbuds"], encoder)
+
+    assert encoder.seen == []
+    assert np.array_equal(second, first[::-1])
+
+    EmbeddingStore(path, namespace="model-b").encode(["jbl speaker"], encoder)
+    assert encoder.seen == ["jbl speaker"]
+
+
+def test_memory_tier_is_least_recently_used():
+    """
+    Without a file, the in-memory tier keeps the most recently used vectors.
+    """
+    encoder = CountingEncoder()
+    store = EmbeddingStore(None, namespace="model", maxsize=2)
+
+    store.encode(["a", "b"], encoder)
+    store.encode(["a"], encoder)
+    store.encode(["c"], encoder)
+    encoder.seen.clear()
+    store.encode(["a", "b"], encoder)
+
+    assert encoder.seen == ["b"]
+    assert store.stats["hits"] == 2
+
+
+def test_unreadable_database_falls_back_to_encoder(tmp_path):
+    """
+    A broken cache file is a miss, not an error in the request.
+    """
+    garbage = tmp_path / "garbage.sqlite3"
+    garbage.write_bytes(b"not a database" * 100)
+    encoder = CountingEncoder()
+
+    assert EmbeddingStore(str(garbage), namespace="model").encode(["x"], encoder).shape == (1, 2)
+
+    store = EmbeddingStore(str(tmp_path / "ok.sqlite3"), namespace="model")
+    store._db.execute("DROP TABLE embeddings")
+    vectors = store.encode(["boat earbuds"], encoder)
+
+    assert vectors.tolist() == [[12.0, 1.0]]
+    assert encoder.seen == ["x", "boat earbuds"]
@@ -0,0 +1,70 @@
+import pytest
+
+from app.models.enums import SortOrder
+from app.services.filter_plan import FilterPlan, Predicate
+from app.services.product_service import ProductService
+from app.services.product_table import ProductTable
+
+
+def _table():
+    return ProductTable([
+        {"id": 1, "name": "Redmi 13C 4GB RAM", "price": "₹11,499", "rating": "4.0"},
+        {"id": 2, "name": "boAt Airdopes 141", "price": "₹1,299", "rating": "4.1"},
+        {"id": 3, "name": "Samsung Galaxy M14 6GB RAM", "price": "₹13,990", "rating": "4.3"},
+        {"id": 4, "name": "Unpriced listing", "price": "", "rating": "3.9"},
+    ])
+
+
+def _ids(table, plan):
+    return [table.products[i]["id"] for i in plan.evaluate(table)]
+
+
+def test_plan_is_hashable_and_cacheable():
+    """
+    Equal parameters build equal plans that share one dict slot.
+    """
+    plan = FilterPlan.build(max_price=14000, sort_by="price")
+
+    assert plan == FilterPlan.build(max_price=14000.0, sort_by="price")
+    assert len({plan, FilterPlan.build(max_price=14000, sort_by="price")}) == 1
+    assert plan.max_price == 14000.0 and plan.min_price is None
+    assert plan.sort_order == SortOrder.ASCENDING
+
+
+def test_plan_rejects_unknown_sort_field():
+    """
+    Only table columns can be sorted on.
+    """
+    with pytest.raises(ValueError):
+        FilterPlan.build(sort_by="name")
+
+
+def test_plan_filters_sorts_and_limits():
+    """
+    Predicates are combined, then rows are ordered and cut to the limit.
+    """
+    table = _table()
+
+    assert _ids(table, FilterPlan.build(max_price=14000, sort_by="price")) == [2, 1, 3]
+    assert _ids(table, FilterPlan.build(min_price=5000, sort_by="rating", descending=True)) == [3, 1]
+    assert _ids(table, FilterPlan.build(sort_by="rating", descending=True, limit=2)) == [3, 2]
+    assert _ids(table, FilterPlan.build(contains="ram")) == [1, 3]
+    assert _ids(table, FilterPlan(predicates=(Predicate("ram", "ge", 6.0),))) == [3]
+
+
+def test_unpriced_rows_never_pass_an_upper_bound():
+    """
+    A price that failed to parse is not treated as free.
+    """
+    assert 4 not in _ids(_table(), FilterPlan.build(max_price=100000))
+
+
+def test_plan_filters_caches_by_normalized_query():
+    """
+    Queries differing only in case and spacing reuse one plan.
+    """
+    service = ProductService()
+    plan = service.plan_filters("phones under 14000")
+
+    assert service.plan_filters("  Phones   UNDER 14000 ") is plan
+    assert plan.max_price == 14000.0
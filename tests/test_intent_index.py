@@ -0,0 +1,120 @@
+import json
+import math
+import os
+import threading
+
+from app.models.enums import IntentType
+from app.services.intent_index import IntentIndex
+
+
+GREETING = IntentType.GREETING.value
+FAREWELL = IntentType.FAREWELL.value
+
+
+def _unit(similarity):
+    """2-D unit vector with the given cosine to (1, 0)."""
+    return [similarity, math.sqrt(1 - similarity ** 2)]
+
+
+VECTORS = {
+    "see you": _unit(0.95),
+    "hello": _unit(0.9),
+    "hi there": _unit(0.85),
+    "bye": _unit(0.1),
+    "hey": _unit(0.8),
+}
+
+
+class Encoder:
+    def __init__(self):
+        self.encoded = []
+
+    def __call__(self, texts):
+        self.encoded.extend(texts)
+        return [VECTORS[text] for text in texts]
+
+
+def _write(path, examples):
+    path.write_text("\n".join(json.dumps({"text": text, "intent": intent}) for text, intent in examples))
+
+
+def _corpus(tmp_path):
+    path = tmp_path / "intents.jsonl"
+    _write(path, [("see you", FAREWELL), ("hello", GREETING), ("hi there", GREETING), ("bye", FAREWELL)])
+    return path
+
+
+def test_top_k_votes_outweigh_single_nearest(tmp_path):
+    """
+    Two close greetings outvote one slightly closer farewell; confidence is the winner's best similarity.
+    """
+    index = IntentIndex(str(_corpus(tmp_path)), Encoder(), top_k=3)
+    assert index.load()
+
+    intent, confidence, scores = index.search([1.0, 0.0])
+
+    assert intent == GREETING
+    assert abs(confidence - 0.9) < 1e-5
+    assert abs(scores[GREETING] - 1.75 / 2.7) < 1e-5
+    assert set(scores) == {GREETING, FAREWELL}
+
+
+def test_top_one_follows_nearest_example(tmp_path):
+    """
+    With k=1 the single nearest example decides.
+    """
+    index = IntentIndex(str(_corpus(tmp_path)), Encoder(), top_k=1)
+    index.load()
+
+    intent, confidence, _ = index.search([1.0, 0.0])
+
+    assert intent == FAREWELL
+    assert abs(confidence - 0.95) < 1e-5
+
+
+def test_hot_reload_encodes_only_new_lines(tmp_path):
+    """
+    A changed corpus is picked up on the next check and only new texts reach the encoder.
+    """
+    path = _corpus(tmp_path)
+    encoder = Encoder()
+    index = IntentIndex(str(path), encoder, top_k=3, reload_interval=0)
+    index.load()
+    encoder.encoded.clear()
+
+    _write(path, [("see you", FAREWELL), ("hello", GREETING), ("hi there", GREETING), ("bye", FAREWELL), ("hey", GREETING)])
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    index.maybe_reload()
+
+    assert index.size == 5
+    assert encoder.encoded == ["hey"]
+
+
+def test_search_during_reload_sees_consistent_examples(tmp_path):
+    """
+    Reloads that change the corpus size never pair a matrix with another load's labels.
+    """
+    path = _corpus(tmp_path)
+    index = IntentIndex(str(path), Encoder(), top_k=3)
+    index.load()
+    errors = []
+    done = threading.Event()
+
+    def search():
+        while not done.is_set():
+            try:
+                index.search([1.0, 0.0])
+            except Exception as e:
+                errors.append(e)
+                return
+
+    worker = threading.Thread(target=search)
+    worker.start()
+    for i in range(200):
+        _write(path, [("hello", GREETING), ("hey", GREETING)] if i % 2 else [("see you", FAREWELL), ("hello", GREETING), ("hi there", GREETING), ("bye", FAREWELL), ("hey", GREETING)])
+        index.load()
+    done.set()
+    worker.join()
+
+    assert errors == []
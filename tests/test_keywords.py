@@ -0,0 +1,40 @@
+import random
+
+from app.utils.keywords import KEYWORD_TABLES, KeywordMatcher, keyword_matcher
+
+
+def _naive(tables, text):
+    classes = {name for name, words in tables.items() if any(word in text for word in words)}
+    keywords = {word for words in tables.values() for word in words if word in text}
+    return classes, keywords
+
+
+def test_matches_overlapping_and_nested_keywords():
+    """
+    Keywords that share prefixes or sit inside other keywords are all found.
+    """
+    matcher = KeywordMatcher({"a": ["he", "she", "his", "hers"], "b": ["is"]})
+    match = matcher.match("ushers this")
+
+    assert match.keywords == {"he", "she", "hers", "his", "is"}
+    assert match.has("a") and match.has("b")
+
+
+def test_agrees_with_substring_search():
+    """
+    The automaton gives the same classes as ``keyword in text`` for every table.
+    """
+    rng = random.Random(7)
+    vocabulary = [word for words in KEYWORD_TABLES.values() for word in words] + ["xyz", "q", " "]
+    for _ in range(300):
+        text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 6)))
+        match = keyword_matcher.match(text)
+        assert (set(match.classes), set(match.keywords)) == _naive(KEYWORD_TABLES, text)
+
+
+def test_category_follows_table_order():
+    """
+    The first category in table order wins when several match.
+    """
+    assert keyword_matcher.match("book a kettle").category == "home_kitchen"
+    assert keyword_matcher.match("nothing here").category is None
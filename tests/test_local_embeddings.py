@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from app.services import ai_service
+from app.services.ai_service import AIService
+from app.services.intent_service import IntentService
+from app.services.local_embeddings import LocalEmbeddings
+
+
+class LengthEncoder:
+    """Sentence transformer stand-in recording each batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, batch_size=64, normalize_embeddings=False):
+        self.batches.append((list(texts), batch_size))
+        vectors = np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    encoder = LengthEncoder()
+    monkeypatch.setattr(IntentService(), "_model", encoder)
+    monkeypatch.setattr(IntentService(), "_embedding_store", None, raising=False)
+    return encoder
+
+
+def test_documents_are_encoded_in_batches(encoder):
+    """
+    Documents reach the model batch_size at a time, one normalized vector per text.
+    """
+    texts = ["boat earbuds", "jbl speaker", "kettle", "mixer grinder", "tv"]
+    vectors = LocalEmbeddings(batch_size=2).embed_documents(texts)
+
+    assert encoder.batches == [(texts[0:2], 2), (texts[2:4], 2), (texts[4:], 2)]
+    assert len(vectors) == 5
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert np.allclose(LocalEmbeddings().embed_query("kettle"), vectors[2])
+
+
+def _setup(monkeypatch, provider, gemini_key=None):
+    monkeypatch.setattr(AIService, "_setup_llms", lambda self: setattr(self, "_llm", None))
+    monkeypatch.setattr(ai_service, "VECTOR_STORE_AVAILABLE", True)
+    monkeypatch.setattr(ai_service, "GoogleGenerativeAIEmbeddings", lambda **kwargs: "gemini-embeddings")
+
+    service = object.__new__(AIService)
+    service._initialize()
+    service._settings = service._settings.model_copy(update={
+        "embedding_provider": provider, "gemini_api_key": gemini_key, "vector_store_dir": None
+    })
+    service._embeddings = service._embedding_provider = service._vector_stores = None
+    service._setup_embeddings()
+    return service
+
+
+@pytest.mark.parametrize("provider, gemini_key, expected", [
+    ("auto", "key", "local"),
+    ("local", "key", "local"),
+    ("gemini", "key", "gemini"),
+    ("AUTO", None, "local"),
+])
+def test_provider_selection_with_local_model(encoder, monkeypatch, provider, gemini_key, expected):
+    """
+    auto prefers the loaded local model; gemini is used only when asked for.
+    """
+    service = _setup(monkeypatch, provider, gemini_key)
+
+    assert service._embedding_provider == expected
+    assert isinstance(service._embeddings, LocalEmbeddings) == (expected == "local")
+    assert service._vector_stores is not None
+
+
+@pytest.mark.parametrize("provider, gemini_key, expected", [
+    ("auto", "key", "gemini"),
+    ("auto", None, None),
+    ("local", "key", None),
+])
+def test_provider_selection_without_local_model(monkeypatch, provider, gemini_key, expected):
+    """
+    Without the model, auto falls back to Gemini and local disables RAG.
+    """
+    monkeypatch.setattr(IntentService(), "_model", None)
+    service = _setup(monkeypatch, provider, gemini_key)
+
+    assert service._embedding_provider == expected
+    assert (service._vector_stores is not None) == (expected is not None)
@@ -0,0 +1,83 @@
+import numpy as np
+
+from app.services.price_match import PriceMatchService
+from app.services.product_service import ProductService
+from app.utils.minhash import LSHIndex, minhasher, near_duplicate_groups
+
+
+def test_lsh_candidates_need_one_whole_band():
+    """
+    Sharing one full band makes a candidate; matching slots spread over every band do not.
+    """
+    index = LSHIndex(num_perm=64, bands=16)
+    base = np.arange(64, dtype=np.uint64)
+    index.add("base", base)
+
+    one_band = base + 100
+    one_band[:4] = base[:4]
+    assert index.query(one_band, threshold=0.0) == [("base", 4 / 64)]
+    assert index.query(one_band, threshold=0.5) == []
+
+    every_band_touched = base.copy()
+    every_band_touched[::4] += 100
+    assert index.query(every_band_touched, threshold=0.0) == []
+
+
+def test_similar_names_collide_and_different_names_do_not():
+    """
+    Real near-identical names clear the threshold; unrelated ones are never candidates.
+    """
+    index = LSHIndex(minhasher.num_perm)
+    index.add("airdopes", minhasher.signature("boat airdopes 141 bluetooth truly wireless earbuds"))
+
+    similar = index.query(minhasher.signature("boat airdopes 141 bluetooth true wireless earbuds"), 0.6)
+    assert [key for key, _ in similar] == ["airdopes"]
+    assert index.query(minhasher.signature("prestige mixer grinder 750 watt"), 0.1) == []
+
+
+def test_dedup_keeps_page_positions():
+    """
+    Each duplicate points at its first listing and unique rows keep page order.
+    """
+    names = [
+        "boAt Airdopes 141 Earbuds (Bold Black)",
+        "JBL Tune 230NC TWS Earbuds",
+        "Sponsored boAt Airdopes 141 Earbuds (Cherry Blossom)",
+        "boAt Airdopes 161 Earbuds",
+    ]
+
+    assert near_duplicate_groups(names).tolist() == [0, 1, 0, 3]
+
+    table = ProductService().get_table([{"name": name, "price": "₹999"} for name in names])
+    assert table.unique_rows().tolist() == [0, 1, 3]
+
+
+def _service(capacity):
+    service = object.__new__(PriceMatchService)
+    service._initialize()
+    service._capacity = capacity
+    return service
+
+
+def test_match_across_sites_within_capacity():
+    """
+    A product seen on another site is matched with its saving; the oldest offer past capacity is evicted.
+    """
+    service = _service(capacity=2)
+    service.observe("Amazon", [
+        {"name": "boAt Airdopes 141 Bluetooth Earbuds", "price": "₹1,099"},
+        {"name": "JBL Tune 230NC TWS Earbuds", "price": "₹4,999"},
+    ])
+    service.observe("Flipkart", [{"name": "Noise Buds VS104 Max", "price": "₹1,299"}])
+
+    assert len(service._index) == 2
+
+    matches = service.match("Flipkart", [
+        {"name": "JBL Tune 230NC TWS Earbuds (Black)", "price": "₹5,999"},
+        {"name": "boAt Airdopes 141 Bluetooth Earbuds", "price": "₹1,299"},
+        {"name": "Noise Buds VS104 Max", "price": "₹1,299"},
+    ])
+
+    assert len(matches) == 1
+    assert matches[0]["best_site"] == "Amazon"
+    assert matches[0]["savings"] == 1000
@@ -0,0 +1,141 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.product_service import ProductService
+from app.services.query_service import QueryService
+from app.utils import prices
+from app.utils.prices import PriceParser, get_price_parser, parse_price_text
+
+
+client = TestClient(app)
+
+
+def _usd_items():
+    return [
+        {"id": 1, "name": "Wired earbuds", "price": "$9.99", "rating": "4.0"},
+        {"id": 2, "name": "Wireless headphones", "price": "$39.99", "rating": "4.4"},
+        {"id": 3, "name": "Noise cancelling headphones", "price": "$129.00", "rating": "4.7"},
+    ]
+
+
+def _filter(query, items):
+    service = ProductService()
+    analysis = QueryService().analyze(query)
+    return [item["id"] for item in service.apply_filters(items, service.plan_filters(analysis))]
+
+
+def test_price_next_to_currency_wins():
+    """
+    Quantities and percentages are not read as the price.
+    """
+    assert parse_price_text("2 for ₹500").amount == 500
+    assert parse_price_text("40% off ₹1,299").amount == 1299
+    assert parse_price_text("₹499 - ₹999") == (499, "INR", 999)
+    assert parse_price_text("1.299,00 €") == (1299, "EUR", None)
+
+
+def test_table_keeps_page_currency():
+    """
+    A dollar page is parsed in dollars, not converted to rupees.
+    """
+    table = ProductService().get_table(_usd_items())
+
+    assert table.currency == "USD"
+    assert table.price.tolist() == [9.99, 39.99, 129.0]
+
+
+def test_bounds_on_usd_page():
+    """
+    "under 50" reads in the page currency; "$50" matches it explicitly.
+    """
+    items = _usd_items()
+
+    assert _filter("headphones under $50", items) == [1, 2]
+    assert _filter("under 50", items) == [1, 2]
+    assert _filter("between $20 and $200", items) == [2, 3]
+
+
+def test_bounds_in_another_currency_are_converted():
+    """
+    A rupee bound on a dollar page is converted at the offline rate.
+    """
+    rate = get_price_parser().rates["INR"] / get_price_parser().rates["USD"]
+    limit = int(50 * rate)
+
+    assert _filter(f"under ₹{limit}", _usd_items()) == [1, 2]
+    assert _filter("under $50", [{"id": 1, "name": "Kettle", "price": f"₹{limit - 10}"}]) == [1]
+
+
+def test_euro_page_labels_and_structured_query():
+    """
+    Euro prices keep their value and symbol in facets and /products/query.
+    """
+    items = [
+        {"id": 1, "name": "Kaffeemühle", "price": "1.299,00 €"},
+        {"id": 2, "name": "Wasserkocher", "price": "49,99 €"},
+    ]
+
+    facets = client.post("/products/facets", json={"products": items}).json()
+    assert facets["currency"] == "EUR"
+    assert facets["price_max"] == 1299.0
+    assert facets["price_histogram"][0]["label"].startswith("€")
+
+    response = client.post("/products/query", json={"products": items, "max_price": 100})
+    assert [item["id"] for item in response.json()["items"]] == [2]
+
+    response = client.post("/products/query", json={"products": items, "max_price": 100, "currency": "usd"})
+    assert [item["id"] for item in response.json()["items"]] == [2]
+
+    response = client.post("/products/query", json={"products": items, "currency": "XYZ"})
+    assert response.status_code == 400
+
+
+def test_filter_description_uses_page_currency():
+    """
+    Thoughts show bounds in the currency they apply in.
+    """
+    service = ProductService()
+    plan = service.plan_filters(QueryService().analyze("under 50"))
+
+    assert service.format_filter_description(plan, "USD") == "Under $50"
+    assert service.format_filter_description(service.plan_filters(QueryService().analyze("under ₹500"))) == "Under ₹500"
+
+
+def test_lakh_and_crore_formats():
+    """
+    Indian grouping and lakh/crore words give the full rupee amount.
+    """
+    assert parse_price_text("₹1,29,999").amount == 129999
+    assert parse_price_text("₹1,00,00,000").amount == 10_000_000
+    assert parse_price_text("₹1.2 lakh").amount == 120_000
+    assert parse_price_text("Rs 2 Cr").amount == 20_000_000
+    assert parse_price_text("₹1.2 - 1.5 lakh") == (120_000, "INR", 150_000)
+
+
+def test_mixed_currency_column():
+    """
+    Each row is converted from its own currency; the page currency is the majority.
+    """
+    parser = PriceParser({"USD": 1.0, "INR": 80.0, "EUR": 0.5}, base_currency="INR")
+    column = ["$10", "₹1,29,999", "$2.50", None, "5,00 €", "N/A", 799]
+
+    assert parser.page_currency(column) == "USD"
+    assert parser.parse_column(column, "INR").tolist() == [800.0, 129999.0, 200.0, 0.0, 800.0, 0.0, 799.0]
+    assert parser.parse_column(column, "USD").tolist() == pytest.approx([10.0, 1624.9875, 2.5, 0.0, 10.0, 0.0, 9.9875])
+
+
+def test_column_parses_each_distinct_string_once(monkeypatch):
+    """
+    A 10,000-row column of repeated prices costs one text parse per distinct value.
+    """
+    parsed = []
+    real = prices.parse_price_text.__wrapped__
+    monkeypatch.setattr(prices, "parse_price_text", lambda text, currency="INR": parsed.append(text) or real(text, currency))
+
+    column = ["₹1,299", "₹499", "$5", "₹1,299"] * 2500
+    result = PriceParser().parse_column(column, "INR")
+
+    assert len(parsed) == 3
+    assert result.shape == (10000,)
+    assert result[0] == result[3] == 1299
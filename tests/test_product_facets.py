@@ -0,0 +1,70 @@
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.product_facets import price_histogram, rating_distribution, discount_bands
+from app.services.product_service import ProductService
+
+
+client = TestClient(app)
+
+
+def _facets(items):
+    return ProductService().facets(ProductService().get_table(items))
+
+
+def test_histogram_edges_are_round_and_cover_every_price():
+    """
+    Buckets have a 1-2-5 width, start at or below the minimum, and a price on an edge counts in the upper bucket.
+    """
+    prices = np.array([149.0, 499.0, 999.0, 2000.0, 2499.0, 4999.0])
+    buckets = price_histogram(prices)
+
+    assert [(bucket["min"], bucket["max"], bucket["count"]) for bucket in buckets] == [
+        (0.0, 2000.0, 3), (2000.0, 4000.0, 2), (4000.0, 6000.0, 1)
+    ]
+    assert sum(bucket["count"] for bucket in price_histogram(np.array([10.0, 20.0, 20.0]))) == 3
+
+
+def test_single_item_and_unpriced_pages():
+    """
+    One price gives one bucket and flat percentiles; no prices gives empty price facets.
+    """
+    single = _facets([{"name": "Kettle", "price": "₹1,299", "rating": "4.2"}])
+    assert len(single["price_histogram"]) == 1
+    assert set(single["price_percentiles"].values()) == {1299.0}
+
+    unpriced = _facets([{"name": "Kettle", "price": "N/A"}, {"name": "Toaster"}])
+    assert unpriced["price_histogram"] == []
+    assert unpriced["price_percentiles"] == {}
+    assert unpriced["price_min"] == unpriced["price_max"] == 0
+    assert unpriced["total"] == 2
+
+
+def test_rating_and_discount_distributions():
+    """
+    Ratings count per whole star with unrated items apart; discounts fall into their bands.
+    """
+    assert rating_distribution(np.array([4.6, 4.0, 3.2, 0.0, 5.0])) == {
+        "5": 1, "4": 2, "3": 1, "2": 0, "1": 0, "unrated": 1
+    }
+
+    bands = {band["label"]: band["count"] for band in discount_bands(np.array([0.0, 5.0, 10.0, 30.0, 50.0, 75.0]))}
+    assert bands == {"No discount": 1, "Up to 10%": 1, "10-25%": 1, "25-50%": 1, "50%+": 2}
+
+
+def test_facets_endpoint():
+    """
+    /products/facets returns the same facets for a posted snapshot.
+    """
+    items = [
+        {"id": 1, "name": "Kettle", "price": "₹1,299", "rating": "4.2", "discount": "20% off"},
+        {"id": 2, "name": "Toaster", "price": "₹2,499", "rating": "3.9"},
+    ]
+    response = client.post("/products/facets", json={"products": items})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert body["price_percentiles"]["p50"] == 1899.0
+    assert body["rating_distribution"]["4"] == 1
@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.product_table import parse_reviews
+
+
+client = TestClient(app)
+
+
+def _items():
+    return [
+        {"id": 1, "name": "Mixer grinder", "price": "₹2,499", "rating": "4.1", "extra": "4.1 (1,234) 20% off"},
+        {"id": 2, "name": "Electric kettle", "price": "₹899", "rating": "4.5", "extra": "56 ratings 45% off"},
+        {"id": 3, "name": "Air fryer", "price": "₹4,999", "rating": "3.9", "extra": "2.5k ratings"},
+    ]
+
+
+def _query(**fields):
+    response = client.post("/products/query", json={"products": _items(), **fields})
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()["items"]]
+
+
+def test_review_counts_read_from_extra():
+    """
+    Review counts come from the extra text when there is no reviews field.
+    """
+    assert parse_reviews({"extra": "4.3 (1,234)"}) == 1234
+    assert parse_reviews({"extra": "12,345 global ratings"}) == 12345
+    assert parse_reviews({"extra": "2.5k ratings"}) == 2500
+    assert parse_reviews({"extra": "Rated (4.0) 40% off"}) == 0
+    assert parse_reviews({"reviews": "320", "extra": "(5)"}) == 320
+
+
+def test_sort_by_reviews_orders_by_count():
+    """
+    Sorting by reviews is not a no-op.
+    """
+    assert _query(sort_by="reviews") == [3, 1, 2]
+    assert _query(sort_by="reviews", sort_order="asc") == [2, 1, 3]
+
+
+def test_default_sort_order_depends_on_field():
+    """
+    Price sorts cheapest first; rating and discount sort best first.
+    """
+    assert _query(sort_by="price") == [2, 1, 3]
+    assert _query(sort_by="rating") == [2, 1, 3]
+    assert _query(sort_by="discount") == [2, 1, 3]
+    assert _query(sort_by="price", sort_order="desc") == [3, 1, 2]
+
+
+def test_unknown_sort_field_is_rejected():
+    """
+    An unsupported sort field is a 400, not a silent no-op.
+    """
+    response = client.post("/products/query", json={"products": _items(), "sort_by": "name"})
+    assert response.status_code == 400
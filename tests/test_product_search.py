@@ -0,0 +1,73 @@
+import numpy as np
+
+from app.services.product_search import ProductSearchService
+from app.services.product_service import ProductService
+from app.utils.bm25 import BM25Index, tokenize
+
+
+def _table():
+    return ProductService().get_table([
+        {"name": "boAt Airdopes 141 wireless earbuds", "price": "₹1,299"},
+        {"name": "JBL Tune 230NC noise cancelling earbuds", "price": "₹5,999"},
+        {"name": "Prestige mixer grinder 750W", "price": "₹3,499"},
+    ])
+
+
+def test_bm25_prefers_rarer_terms_and_shorter_documents():
+    """
+    A term in fewer documents weighs more, and documents without any term score zero.
+    """
+    index = BM25Index([
+        tokenize("wireless earbuds"),
+        tokenize("noise cancelling earbuds with long battery and fast charging"),
+        tokenize("mixer grinder"),
+    ])
+
+    scores = index.score(tokenize("earbuds"))
+    assert scores[0] > scores[1] > 0
+    assert scores[2] == 0
+
+    scores = index.score(tokenize("noise earbuds"))
+    assert scores[1] > scores[0]
+    assert tokenize("Earbuds") == ["earbud"]
+
+
+def test_keyword_mode_returns_only_rows_sharing_a_term():
+    """
+    Without embeddings, search ranks by BM25 and leaves out rows with no query term.
+    """
+    result = ProductSearchService().search(_table(), "noise cancelling earbuds")
+
+    assert result.mode == "keyword"
+    assert result.indices.tolist() == [1, 0]
+    assert result.matched.all()
+
+
+def test_hybrid_blends_vector_and_lexical_scores(semantic, monkeypatch):
+    """
+    Hybrid scores are the configured weighted sum of cosine and normalized BM25.
+    """
+    service = ProductSearchService()
+    monkeypatch.setattr(service, "_vector_weight", 0.25)
+    table = _table()
+
+    scores, mode, _ = service.score(table, "wireless earbuds")
+    index = service.get_index(table)
+    vector = index.vector_scores(service._intent_service.encode(["wireless earbuds"])[0])
+    lexical = index.lexical_scores(["wireless", "earbud"])
+
+    assert mode == "hybrid"
+    assert np.allclose(scores, 0.25 * vector + 0.75 * lexical)
+    assert int(np.argmax(scores)) == 0
+
+
+def test_hybrid_no_match_is_reported(semantic):
+    """
+    Every row gets a positive cosine score, yet none of them matches an absent product.
+    """
+    service = ProductSearchService()
+    result = service.search(_table(), "iphone 15 pro", limit=3)
+
+    assert (result.scores > 0).all()
+    assert not result.matched.any()
+    assert service.rank_items(_table().rows(np.arange(3)), "iphone 15 pro") is None
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from app.services.product_table import ProductTable, snapshot_key
+
+
+def _items():
+    return [
+        {"id": 1, "name": "Redmi 13C", "price": "₹11,499", "rating": "4.0", "image": "a.jpg"},
+        {"id": 2, "name": "boAt Airdopes 141", "price": "₹1,299", "rating": "4.1", "image": "b.jpg"},
+    ]
+
+
+def test_snapshot_key_covers_every_field():
+    """
+    Lists that differ only in a returned field get different keys.
+    """
+    changed = _items()
+    changed[0]["image"] = "new.jpg"
+    extra = _items()
+    extra[1]["url"] = "https://example.com/airdopes"
+
+    assert snapshot_key(_items()) == snapshot_key(_items())
+    assert snapshot_key(changed) != snapshot_key(_items())
+    assert snapshot_key(extra) != snapshot_key(_items())
+
+
+def test_table_parses_columns_once():
+    """
+    Prices and ratings are parsed into numeric columns.
+    """
+    table = ProductTable(_items())
+
+    assert table.price.tolist() == [11499.0, 1299.0]
+    assert table.rating.tolist() == [4.0, 4.1]
+    assert table.valid.all()
+
+
+def _value_table(items):
+    return ProductTable([{"name": f"Item {i}", **item} for i, item in enumerate(items)])
+
+
+def test_cheaper_better_rated_item_has_higher_value():
+    """
+    Lower price and higher rating both raise the deal score.
+    """
+    table = _value_table([
+        {"price": "₹1,999", "rating": "3.9"},
+        {"price": "₹1,499", "rating": "4.4"},
+        {"price": "₹1,799", "rating": "4.1"},
+    ])
+
+    assert np.argsort(-table.value).tolist() == [1, 2, 0]
+
+
+def test_missing_rating_or_price_is_neutral():
+    """
+    An unrated row scores as the median rating and an unpriced row as the middle price rank.
+    """
+    unrated = _value_table([
+        {"price": "₹999", "rating": "4.0"},
+        {"price": "₹999", "rating": "4.4"},
+        {"price": "₹999"},
+    ]).value
+    assert unrated[0] < unrated[2] < unrated[1]
+    assert unrated[2] - unrated[0] == pytest.approx(unrated[1] - unrated[2])
+
+    unpriced = _value_table([
+        {"price": "₹500", "rating": "4.0"},
+        {"price": "₹1,500", "rating": "4.0"},
+        {"price": "N/A", "rating": "4.0"},
+    ]).value
+    assert unpriced[0] > unpriced[2] > unpriced[1]
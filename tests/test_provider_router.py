@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.exceptions import AIServiceException
+from app.services import provider_router as router_module
+from app.services.provider_router import CLOSED, HALF_OPEN, OPEN, ProviderRouter
+
+
+class FakeLLM:
+    """Runnable that answers or raises on invoke."""
+
+    def __init__(self, reply="ok", fail=False):
+        self.reply = reply
+        self.fail = fail
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("provider down")
+        return self.reply
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(router_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def router(clock):
+    router = object.__new__(ProviderRouter)
+    router._initialize()
+    router._hedging = False
+    return router
+
+
+def _trip(router, name):
+    for _ in range(router._min_calls):
+        router.record(name, 0.1, ok=False)
+
+
+def test_models_on_one_provider_have_separate_circuits(router):
+    """
+    Failures of the small model do not open the large model's circuit.
+    """
+    _trip(router, "groq/small")
+
+    assert router._stats["groq/small"].state == OPEN
+    assert router.order(["groq/small", "groq/large"]) == ["groq/large"]
+    assert "groq/large" in router.metrics["providers"]
+
+
+def test_failover_trips_circuit_and_skips_provider(router):
+    """
+    A failing provider is retried elsewhere, then skipped once its circuit opens.
+    """
+    down, backup = FakeLLM(fail=True), FakeLLM(reply="backup")
+    runnables = {"groq/small": down, "gemini/flash": backup}
+
+    for _ in range(router._min_calls):
+        assert router.invoke(runnables, "hi") == "backup"
+
+    assert router._stats["groq/small"].state == OPEN
+    calls = down.calls
+    assert router.invoke(runnables, "hi") == "backup"
+    assert down.calls == calls
+
+
+def test_half_open_allows_one_probe(router, clock):
+    """
+    After the open period one probe runs; success closes the circuit, failure reopens it.
+    """
+    _trip(router, "groq/small")
+    clock.now += router._open_seconds
+
+    assert router.order(["groq/small"]) == ["groq/small"]
+    assert router._stats["groq/small"].state == HALF_OPEN
+    assert router._claim("groq/small")
+    assert router.order(["groq/small"]) == []
+
+    router.record("groq/small", 0.1, ok=False)
+    assert router._stats["groq/small"].state == OPEN
+
+    clock.now += router._open_seconds
+    assert router.invoke({"groq/small": FakeLLM()}, "hi") == "ok"
+    assert router._stats["groq/small"].state == CLOSED
+
+
+def test_retry_budget_caps_failover(router):
+    """
+    Once the retry budget is spent, a failed call is not retried on another provider.
+    """
+    router._retry_balance = 0.0
+    router._retry_ratio = 0.0
+    backup = FakeLLM(reply="backup")
+
+    with pytest.raises(AIServiceException):
+        router.invoke({"groq/small": FakeLLM(fail=True), "gemini/flash": backup}, "hi")
+
+    assert backup.calls == 0
+    assert router.metrics["retries_denied"] == 1
+
+
+def test_ai_service_names_llms_by_model():
+    """
+    Each route registers its LLM under provider and model.
+    """
+    from app.core.config import ModelRoute, Settings
+    from app.services.ai_service import AIService
+
+    seen = []
+
+    class Recorder:
+        def invoke(self, runnables, prompt):
+            seen.append(list(runnables))
+            return "ok"
+
+    service = object.__new__(AIService)
+    service._initialize()
+    service._settings = Settings(groq_api_key="test-key", gemini_api_key="")
+    service._provider_router = Recorder()
+
+    service._build_llm(ModelRoute("llama-3.1-8b-instant", 600, 10, 1500)).invoke("hi")
+    service._build_llm(ModelRoute("llama-3.3-70b-versatile", 1000, 20, 3000)).invoke("hi")
+
+    assert seen == [["groq/llama-3.1-8b-instant"], ["groq/llama-3.3-70b-versatile"]]
+
+
+class FakeStream:
+    """Async streaming runnable that can stall or fail, and notices being cancelled."""
+
+    def __init__(self, chunks=("o", "k"), stall=0.0, fail=False):
+        self.chunks = chunks
+        self.stall = stall
+        self.fail = fail
+        self.cancelled = threading.Event()
+
+    async def astream(self, prompt):
+        try:
+            await asyncio.sleep(self.stall)
+            if self.fail:
+                raise RuntimeError("provider down")
+            for chunk in self.chunks:
+                yield chunk
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+@pytest.fixture
+def hedging_router():
+    router = object.__new__(ProviderRouter)
+    router._initialize()
+    router._hedging = True
+    router._hedge_min_samples = 1
+    router._hedge_min_delay = 0.05
+    return router
+
+
+def test_stalled_probe_is_released_when_hedged(hedging_router):
+    """
+    A half-open probe that stalls and loses the race reopens its circuit instead of holding the slot.
+    """
+    router = hedging_router
+    stats = router._get_stats("groq/a")
+    stats.first_token.append(0.01)
+    stats.state, stats.opened_at = OPEN, time.monotonic() - router._open_seconds
+    probe, backup = FakeStream(stall=30), FakeStream(chunks=("fast",))
+
+    assert router.invoke({"groq/a": probe, "gemini/b": backup}, "hi") == "fast"
+    assert probe.cancelled.wait(1)
+    assert stats.state == OPEN and not stats.probing
+
+    stats.opened_at -= router._open_seconds
+    assert router.order(["groq/a", "gemini/b"])[0] == "groq/a"
+    assert router.metrics["hedges"] == 1 and router.metrics["hedge_wins"] == 1
+
+
+def test_cancelled_loser_is_aborted_without_a_chunk(hedging_router):
+    """
+    The control side aborts a stalled stream, and a closed provider's loss is not a failure.
+    """
+    router = hedging_router
+    router._get_stats("groq/a").first_token.append(0.01)
+    slow = FakeStream(stall=30)
+
+    assert router.invoke({"groq/a": slow, "gemini/b": FakeStream(chunks=("fast",))}, "hi") == "fast"
+    assert slow.cancelled.wait(1)
+    assert router._stats["groq/a"].state == CLOSED
+    assert router._stats["groq/a"].failures == 0
+
+
+def test_fast_primary_is_not_hedged(hedging_router):
+    """
+    A primary that streams before the hedge delay answers alone.
+    """
+    router = hedging_router
+    router._get_stats("groq/a").first_token.append(0.01)
+    backup = FakeStream()
+
+    assert router.invoke({"groq/a": FakeStream(), "gemini/b": backup}, "hi") == "ok"
+    assert router.metrics["hedges"] == 0
+    assert not backup.cancelled.is_set()
+
+
+def test_failed_stream_is_retried_on_next_provider(hedging_router):
+    """
+    A stream that errors before any token spends a retry on the next provider.
+    """
+    router = hedging_router
+
+    assert router.invoke({"groq/a": FakeStream(fail=True), "gemini/b": FakeStream(chunks=("fast",))}, "hi") == "fast"
+    assert router._stats["groq/a"].failures == 1
+    assert router.metrics["retries"] == 1
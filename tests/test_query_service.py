@@ -0,0 +1,78 @@
+import pytest
+
+from app.models.enums import SortOrder
+from app.services.ai_service import ProductIntelligence
+from app.services.intent_service import IntentService
+from app.services.product_service import ProductService
+from app.services.query_service import QueryService, ensure_analysis
+
+
+@pytest.mark.parametrize("query, min_price, max_price", [
+    ("earbuds under ₹1,500", None, 1500.0),
+    ("kettle above 999", 999.0, None),
+    ("earbuds between 500 and 2000", 500.0, 2000.0),
+    ("earbuds 2000 se kam", None, 2000.0),
+    ("show me earbuds", None, None),
+])
+def test_price_bounds(query, min_price, max_price):
+    """
+    Under, above, between and Hinglish bounds are read once; digit groups are joined.
+    """
+    analysis = QueryService().analyze(query)
+
+    assert (analysis.min_price, analysis.max_price) == (min_price, max_price)
+    assert analysis.has_price_bounds == (min_price is not None or max_price is not None)
+
+
+def test_numbers_sort_limit_and_category():
+    """
+    One pass records tokens, numbers, sort hints, the result limit and the category.
+    """
+    analysis = QueryService().analyze("First 3 cheap earbuds under 1,500")
+
+    assert analysis.text == "first 3 cheap earbuds under 1,500"
+    assert analysis.tokens == ["first", "3", "cheap", "earbuds", "under", "1500"]
+    assert analysis.numbers == [3.0, 1500.0]
+    assert analysis.limit == 3
+    assert (analysis.sort_by, analysis.sort_order) == ("price", SortOrder.ASCENDING)
+    assert analysis.category == "mobile_accessories"
+    assert QueryService().analyze("electric kettle").category == "home_kitchen"
+    assert QueryService().analyze("hello").category is None
+
+
+def test_language_is_detected_only_on_request():
+    """
+    language="auto" detects, an explicit code is kept and None skips detection.
+    """
+    assert QueryService().analyze("earbuds", language="auto").language == "en"
+    assert QueryService().analyze("earbuds", language="hi").language == "hi"
+    assert QueryService().analyze("earbuds").language is None
+
+
+def test_stages_reuse_the_shared_analysis(monkeypatch):
+    """
+    Intent, filter and prompt stages read a passed analysis instead of parsing the query again.
+    """
+    query = "first 3 cheap earbuds under 1500"
+    expected_intent = IntentService().classify(query)[0]
+    analysis = QueryService().analyze(query)
+
+    calls = []
+    original = QueryService.analyze
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(QueryService, "analyze", counting)
+
+    assert ensure_analysis(analysis) is analysis
+    assert IntentService().classify(analysis)[0] == expected_intent
+    filters = ProductService().parse_filters(analysis)
+    assert (filters.max_price, filters.limit) == (1500.0, 3)
+    assert ProductIntelligence.extract_price_range(analysis) == (0, 1500)
+    assert ProductIntelligence.extract_category(analysis) == "mobile_accessories"
+    assert calls == []
+
+    ProductIntelligence.extract_price_range(query)
+    assert len(calls) == 1
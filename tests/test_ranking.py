@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+
+from app.services.product_table import ProductTable
+from app.utils.ranking import top_k
+
+
+def test_top_k_matches_sorted_prefix():
+    """
+    top_k equals the first k of a stable full sort, ties included.
+    """
+    rng = random.Random(7)
+    for _ in range(200):
+        items = [rng.randint(0, 9) for _ in range(rng.randint(0, 30))]
+        k = rng.choice([None, 0, 1, 3, 10, 50])
+        reverse = rng.random() < 0.5
+        expected = sorted(items, key=float, reverse=reverse)
+        expected = expected if k is None else expected[:k]
+
+        assert top_k(items, float, k, reverse) == expected
+
+
+def test_top_k_calls_key_once_per_item():
+    """
+    Keys are computed once, not on every heap comparison.
+    """
+    calls = []
+
+    def key(item):
+        calls.append(item)
+        return -item
+
+    assert top_k(list(range(100)), key, 5) == [99, 98, 97, 96, 95]
+    assert len(calls) == 100
+
+
+def test_table_top_k_matches_stable_order():
+    """
+    ProductTable.top_k equals the stable order prefix, including ties at the cut.
+    """
+    rng = np.random.default_rng(3)
+    table = ProductTable([{"id": i, "name": f"item {i}", "price": "0"} for i in range(40)])
+
+    for _ in range(100):
+        key = rng.integers(0, 6, size=table.size).astype(np.float64)
+        indices = np.flatnonzero(rng.random(table.size) < 0.7)
+        k = int(rng.integers(0, 45))
+        descending = bool(rng.integers(0, 2))
+        expected = table.order(indices, key, descending)[:k]
+
+        assert table.top_k(indices, key, k, descending).tolist() == expected.tolist()
@@ -0,0 +1,54 @@
+import pytest
+
+from app.utils.specs import SpecBound, extract_specs, parse_spec_bounds
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("redmi 13c (8 gb ram, 128 gb storage) 6.74-inch 5000 mah", (8, 128, 6.74, 5000)),
+    ("samsung galaxy m14 8gb ram 128gb rom 6.6\" 6000mah", (8, 128, 6.6, 6000)),
+    ("oneplus nord ce 8gb+256gb 6.7 inch", (8, 256, 6.7, 0)),
+    ("macbook air 16 gb/512 gb ssd 13.6 inches", (16, 512, 13.6, 0)),
+    ("wd external hard drive 1 tb storage", (0, 1024, 0, 0)),
+    ("realme narzo 6.72″ display 5000 mah battery", (0, 0, 6.72, 5000)),
+    ("boat airdopes 141 bluetooth earbuds", (0, 0, 0, 0)),
+])
+def test_extract_specs(text, expected):
+    """
+    RAM, storage, screen and battery are read in their common written forms.
+    """
+    assert extract_specs(text) == expected
+
+
+@pytest.mark.parametrize("spaced, compact", [
+    ("8 gb ram", "8gb ram"),
+    ("128 gb storage", "128gb storage"),
+    ("6.7-inch display", "6.7\" display"),
+    ("5000 mah", "5000mah"),
+])
+def test_unit_variants_agree(spaced, compact):
+    """
+    Spacing and unit spelling do not change the extracted value.
+    """
+    assert extract_specs(spaced) == extract_specs(compact) != (0, 0, 0, 0)
+
+
+def test_query_bounds():
+    """
+    Plain sizes are exact, "+" or "at least" sizes and batteries are minimums, screens are near.
+    """
+    assert parse_spec_bounds("phones with 8gb ram")[0] == [SpecBound("ram", "eq", 8)]
+    assert parse_spec_bounds("at least 8 gb ram")[0] == [SpecBound("ram", "ge", 8)]
+    assert parse_spec_bounds("8gb+ ram")[0] == [SpecBound("ram", "ge", 8)]
+    assert parse_spec_bounds("128gb phones")[0] == [SpecBound("storage", "eq", 128)]
+    assert parse_spec_bounds("6.7 inch phone")[0] == [SpecBound("screen", "near", 6.7)]
+    assert parse_spec_bounds("5000mah battery")[0] == [SpecBound("battery", "ge", 5000)]
+
+
+def test_spec_mentions_are_blanked_for_price_parsing():
+    """
+    "256 gb" is removed from the text so only the real price bound remains.
+    """
+    bounds, text = parse_spec_bounds("256 gb storage under 20000")
+
+    assert bounds == [SpecBound("storage", "eq", 256)]
+    assert "256" not in text and "under 20000" in text
@@ -0,0 +1,76 @@
+import pytest
+
+from app.services.query_service import QueryService
+from app.utils.spelling import spelling_normalizer
+
+
+@pytest.mark.parametrize("query", [
+    "sneakers under 2000",
+    "tables",
+    "amazon prime deals",
+    "match box",
+    "coaster",
+    "show lower price items",
+    "older models",
+    "bigger screen with faster charging",
+    "shopping for a tower fan",
+])
+def test_real_words_are_not_rewritten(query):
+    """
+    Valid words close to a catalog word are left as typed.
+    """
+    assert spelling_normalizer.normalize(query) == query
+
+
+@pytest.mark.parametrize("typo, expected", [
+    ("cheapst", "cheapest"),
+    ("laptps", "laptops"),
+    ("prise", "price"),
+    ("sastaa", "sasta"),
+    ("thnx", "thanks"),
+])
+def test_misspellings_are_corrected(typo, expected):
+    """
+    Tokens missing from the dictionary still snap to the shopping vocabulary.
+    """
+    assert spelling_normalizer.correct(typo) == expected
+
+
+def test_inflections_of_dictionary_words_are_known():
+    """
+    Plural and verb forms of dictionary words count as real words.
+    """
+    assert spelling_normalizer.is_known("tables")
+    assert spelling_normalizer.is_known("batteries")
+    assert spelling_normalizer.is_known("lower")
+    assert spelling_normalizer.is_known("bigger")
+    assert spelling_normalizer.is_known("quickly")
+    assert not spelling_normalizer.is_known("cheapst")
+
+
+def test_correct_words_keep_their_meaning_in_analysis():
+    """
+    "lower" and "older" reach the rules as typed, not as "power" and "order".
+    """
+    assert "lower" in QueryService().analyze("show lower price items").text
+    assert "older" in QueryService().analyze("older models").text
+
+
+def test_category_comes_from_the_raw_query():
+    """
+    A corrected token cannot change the detected category.
+    """
+    analysis = QueryService().analyze("sneakers under 2000")
+
+    assert analysis.category != "electronics"
+    assert analysis.max_price == 2000
+
+
+def test_language_is_detected_before_correction():
+    """
+    Non-English queries keep their words and their detected language.
+    """
+    analysis = QueryService().analyze("produtos baratos", "auto")
+
+    assert analysis.language == "pt"
+    assert "produtos" in analysis.text
@@ -0,0 +1,63 @@
+from app.models.enums import IntentType
+from app.services.query_service import QueryService
+from app.services.template_service import TemplateService
+
+
+def _render(query, items, intent=IntentType.PRODUCT_FILTER.value):
+    return TemplateService().render(intent, QueryService().analyze(query), items, "en")
+
+
+def _categorized():
+    return [
+        {"id": 1, "name": "Redmi 13C 5G", "price": "₹11,499", "rating": "4.0"},
+        {"id": 2, "name": "boAt Airdopes 141 earbuds", "price": "₹1,299", "rating": "4.1"},
+        {"id": 3, "name": "Realme Narzo 60x mobile", "price": "₹12,999", "rating": "4.2"},
+    ]
+
+
+def test_filter_lists_only_query_category():
+    """
+    "phones under 14000" lists the phones, not the earbuds.
+    """
+    answer = _render("phones under 14000", _categorized())
+
+    assert [item["id"] for item in answer.products] == [1, 3]
+
+
+def test_uncategorized_rows_go_to_llm():
+    """
+    A phone no category was found for is neither dropped nor guessed at.
+    """
+    items = _categorized() + [{"id": 4, "name": "Samsung Galaxy M14", "price": "₹13,990"}]
+
+    assert _render("phones under 14000", items) is None
+
+
+def test_filter_without_category_is_templated():
+    """
+    Pure price filters need no category and are answered locally.
+    """
+    answer = _render("under 2000", _categorized())
+
+    assert [item["id"] for item in answer.products] == [2]
+
+
+def test_residual_terms_and_chat_intents():
+    """
+    Queries with words the template cannot honour go to the LLM; greetings never do.
+    """
+    assert _render("phones under 14000 with good camera for gaming", _categorized()) is None
+    assert _render("general question", [], IntentType.GENERAL_QUESTION.value) is None
+    assert _render("hi", [], IntentType.GREETING.value).text
+
+
+def test_price_of_product_not_on_page_goes_to_llm(semantic):
+    """
+    Every row has some cosine similarity; a product missing from the page is still no match.
+    """
+    items = _categorized()
+
+    assert _render("price of iphone 15 pro", items, IntentType.PRICE_QUERY.value) is None
+
+    answer = _render("price of airdopes", items, IntentType.PRICE_QUERY.value)
+    assert [item["id"] for item in answer.products] == [2]
@@ -0,0 +1,70 @@
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from app.core.config import ModelRoute
+from app.services.ai_service import AIService
+from app.services.context_assembler import ContextAssembler
+from app.utils.tokens import TOKENIZER_AVAILABLE, count_tokens, truncate_tokens
+
+
+@pytest.mark.skipif(TOKENIZER_AVAILABLE, reason="checks the fallback estimate")
+def test_estimate_counts_non_ascii_by_bytes():
+    """
+    Devanagari costs about one token per two UTF-8 bytes, not one per character.
+    """
+    word = "नमस्ते"
+
+    assert count_tokens(word) >= len(word.encode("utf-8")) // 2 > len(word)
+    assert count_tokens("hello world") == 4
+    assert count_tokens("1234567") == 3
+
+
+def test_truncate_stays_within_limit():
+    """
+    Truncated text never counts above the limit and ends on a whole piece.
+    """
+    text = "सस्ता फ़ोन दिखाओ under 15000 with 8GB RAM " * 5
+
+    for limit in (0, 1, 5, 20, 1000):
+        cut = truncate_tokens(text, limit)
+        assert count_tokens(cut) <= limit
+        assert text.startswith(cut)
+
+
+def test_assembler_fills_by_priority():
+    """
+    Products first in rank order, then the newest history, then page text.
+    """
+    fixed = "instructions " * 10
+    products = [f"{i}. product number {i} with a long description" for i in range(1, 30)]
+    history = [f"User: message {i}" for i in range(10)]
+    budget = count_tokens(fixed) + sum(count_tokens(entry) for entry in products[:5]) + 12
+
+    assembled = ContextAssembler().assemble(budget, fixed, products, history, "page text " * 100)
+
+    assert assembled.products == products[:5]
+    assert history[len(history) - len(assembled.history):] == assembled.history
+    assert assembled.prompt_tokens <= budget
+
+
+def test_prompt_tokens_match_sent_prompt(monkeypatch):
+    """
+    prompt_tokens counts the prompt actually sent, placeholders included, within the route budget.
+    """
+    sent = []
+    monkeypatch.setattr(
+        AIService, "_build_llm",
+        lambda self, route: RunnableLambda(lambda prompt: sent.append(prompt.to_string()) or "ok")
+    )
+    service = object.__new__(AIService)
+    service._initialize()
+
+    items = [{"id": i, "name": f"Wireless earbuds model {i}", "price": f"₹{999 + i}"} for i in range(40)]
+    route = ModelRoute("test-model", 200, 40, 700)
+    generated = service.generate("cheap earbuds", items=items, route=route, session_id="tokens-test")
+
+    assert generated.text == "ok"
+    assert "No previous conversation." in sent[0]
+    assert "No additional page content available." in sent[0]
+    assert generated.prompt_tokens == count_tokens(sent[0])
+    assert generated.prompt_tokens <= route.prompt_tokens
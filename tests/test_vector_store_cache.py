@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from app.services import vector_store_cache
+from app.services.ai_service import AIService
+from app.services.query_service import QueryService
+from app.services.vector_store_cache import VectorStoreCache
+
+
+class FakeStore:
+    """In-memory stand-in for FAISS that finds documents naming the query, last listed first."""
+
+    builds = []
+    gate = threading.Event()
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    @classmethod
+    def from_documents(cls, documents, embedding):
+        cls.gate.wait(5)
+        cls.builds.append([document.metadata["name"] for document in documents])
+        return cls(documents)
+
+    def similarity_search(self, query, k):
+        words = query.split()
+        hits = [d for d in self.documents if any(word in d.metadata["name"].lower() for word in words)]
+        return hits[::-1][:k]
+
+
+@pytest.fixture
+def fake_faiss(monkeypatch):
+    FakeStore.builds = []
+    FakeStore.gate.set()
+    monkeypatch.setattr(vector_store_cache, "FAISS", FakeStore, raising=False)
+    monkeypatch.setattr(vector_store_cache, "VECTOR_STORE_AVAILABLE", True)
+    return FakeStore
+
+
+def _items(*names):
+    return [{"name": name, "price": "₹999"} for name in names]
+
+
+def test_miss_builds_in_background_then_hits(fake_faiss):
+    """
+    The first request schedules a build; once it finishes the same snapshot is served from cache.
+    """
+    cache = VectorStoreCache(embeddings=object())
+    items = _items("boAt earbuds", "JBL speaker")
+
+    assert cache.get(items) is None
+    cache.wait(5)
+    store = cache.get(items)
+
+    assert isinstance(store, FakeStore)
+    assert cache.get(list(items)) is store
+    assert len(fake_faiss.builds) == 1
+
+
+def test_least_recently_used_store_is_evicted(fake_faiss):
+    """
+    Beyond maxsize the oldest snapshot is dropped and rebuilt on its next request.
+    """
+    cache = VectorStoreCache(embeddings=object(), maxsize=1)
+    first, second = _items("boAt earbuds"), _items("JBL speaker")
+
+    cache.get(first)
+    cache.wait(5)
+    cache.get(second)
+    cache.wait(5)
+
+    assert cache.get(second) is not None
+    assert cache.get(first) is None
+    assert len(cache) == 1
+
+
+def test_full_build_queue_drops_new_builds(fake_faiss):
+    """
+    Misses beyond max_pending are skipped instead of piling up behind the worker.
+    """
+    fake_faiss.gate.clear()
+    cache = VectorStoreCache(embeddings=object(), max_pending=1)
+
+    cache.get(_items("boAt earbuds"))
+    cache.get(_items("JBL speaker"))
+    assert cache.stats == {"stores": 0, "pending": 1, "dropped": 1}
+
+    fake_faiss.gate.set()
+    cache.wait(5)
+    assert fake_faiss.builds == [["boAt earbuds"]]
+    assert cache.stats["pending"] == 0
+
+
+def test_rag_store_orders_prompt_items(fake_faiss, monkeypatch):
+    """
+    With use_rag, prompt items come from the vector store once it is built.
+    """
+    monkeypatch.setattr(AIService, "_setup_llms", lambda self: setattr(self, "_llm", None))
+    service = object.__new__(AIService)
+    service._initialize()
+    service._vector_stores = VectorStoreCache(embeddings=object())
+
+    items = _items("Prestige mixer grinder", "boAt earbuds", "JBL earbuds")
+    analysis = QueryService().analyze("earbuds")
+
+    prepared, _ = service._prepare_items(items, analysis, use_rag=True)
+    assert len(prepared) == 3
+
+    service._vector_stores.wait(5)
+    prepared, _ = service._prepare_items(items, analysis, use_rag=True)
+    assert [item["name"] for item in prepared] == ["JBL earbuds", "boAt earbuds"]